@@ -1,10 +1,8 @@
-import os
-
-import aioredis
 from aioredis import Redis
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
 
+from auth_management.config.database import database_manager
+from auth_management.config.redis_pool import redis_manager
 from auth_management.entities.user import User
 
 
@@ -27,22 +25,21 @@ from auth_management.entities.user import User
 
 
 async def initiate_database() -> None:
-    if os.getenv("ENVIRONMENT") == "local":
-        client = AsyncIOMotorClient(os.getenv("LOCAL_DATABASE_URL"))
-    else:
-        client = AsyncIOMotorClient(os.getenv("DATABASE_URL"))
-    await init_beanie(database=client.get_default_database(),
+    await init_beanie(database=await database_manager.connect(),
                       document_models=[User])
 
 
+async def close_database() -> None:
+    await database_manager.close()
+
+
 async def initiate_redis_pool() -> Redis:
-    redis_connection = await aioredis.from_url(
-        os.getenv("REDIS_AUTH_URL"),
-        password=os.getenv("REDIS_PASSWORD"),
-        encoding="utf-8",
-        db=os.getenv("REDIS_USER_DB"),
-        decode_responses=True,
-    )
-    await redis_connection.set("hello", "world")
-    print(await redis_connection.get("hello"))
-    return redis_connection
+    return await redis_manager.connect()
+
+
+async def close_redis_pool() -> None:
+    await redis_manager.close()
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+    return {"mongo": database_manager.get_pool_stats(), "redis": redis_manager.get_pool_stats()}
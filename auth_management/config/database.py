@@ -0,0 +1,143 @@
+import asyncio
+import os
+import threading
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
+
+from auth_management.utils.metrics import command_listener
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Keeps running counters of the connection pool events. Pymongo calls the listener from its
+    own threads, so every counter update goes through a lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkout_started = 0
+        self.checkout_failed = 0
+        self.checked_out = 0
+        self.checked_in = 0
+        self.pools_cleared = 0
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        self._increment("pools_cleared")
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        self._increment("connections_created")
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        self._increment("connections_closed")
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        self._increment("checkout_started")
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        self._increment("checkout_failed")
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        self._increment("checked_out")
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        self._increment("checked_in")
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            total = self.connections_created - self.connections_closed
+            in_use = self.checked_out - self.checked_in
+            return {
+                "total": total,
+                "in_use": in_use,
+                "idle": total - in_use,
+                "wait_queue": self.checkout_started - self.checked_out - self.checkout_failed,
+                "checkout_failed": self.checkout_failed,
+                "pools_cleared": self.pools_cleared,
+            }
+
+
+class DatabaseConnectionManager:
+    """
+    Owns the Motor client of the worker process: builds it from the MONGO_* env variables,
+    opens minPoolSize connections before the app reports ready and closes it on shutdown.
+    """
+    __slots__ = ["client", "pool_listener"]
+
+    def __init__(self) -> None:
+        self.client: AsyncIOMotorClient | None = None
+        self.pool_listener = PoolStatsListener()
+
+    @staticmethod
+    def get_database_url() -> str | None:
+        if os.getenv("ENVIRONMENT") == "local":
+            return os.getenv("LOCAL_DATABASE_URL")
+        return os.getenv("DATABASE_URL")
+
+    @staticmethod
+    def get_client_options() -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", default=100)),
+            "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", default=0)),
+            "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", default=60000)),
+            "connectTimeoutMS": int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", default=10000)),
+            "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", default=10000)),
+            "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", default=10000)),
+        }
+        socket_timeout = os.getenv("MONGO_SOCKET_TIMEOUT_MS")
+        if socket_timeout:
+            options["socketTimeoutMS"] = int(socket_timeout)
+        compressors = os.getenv("MONGO_COMPRESSORS", default="zstd,zlib")
+        if compressors:
+            options["compressors"] = compressors
+        return options
+
+    async def connect(self) -> AsyncIOMotorDatabase:
+        if self.client is None:
+            self.client = AsyncIOMotorClient(self.get_database_url(),
+                                             event_listeners=[self.pool_listener, command_listener],
+                                             **self.get_client_options())
+            await self.prewarm()
+        return self.client.get_default_database()
+
+    async def prewarm(self) -> None:
+        """
+        Concurrent pings force the pool to open minPoolSize connections up front instead of
+        letting the first requests pay for the handshakes.
+        """
+        if self.client is None:
+            return
+        min_pool_size = self.get_client_options()["minPoolSize"]
+        await asyncio.gather(*[self.client.admin.command("ping") for _ in range(max(min_pool_size, 1))])
+
+    def get_pool_stats(self) -> dict[str, int]:
+        stats = self.pool_listener.get_stats()
+        stats["max_pool_size"] = self.get_client_options()["maxPoolSize"]
+        return stats
+
+    async def close(self) -> None:
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+
+database_manager = DatabaseConnectionManager()
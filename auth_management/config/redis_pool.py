@@ -0,0 +1,134 @@
+import asyncio
+import os
+from typing import Any
+
+import aioredis
+from aioredis import Redis
+
+from auth_management.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class RedisConnectionManager:
+    """
+    Owns the Redis pool of the worker process. Checkouts block up to REDIS_POOL_TIMEOUT when
+    REDIS_MAX_CONNECTIONS are in use, connections idle for longer than the health-check
+    interval are pinged before reuse and a background task keeps checking the server.
+    """
+    __slots__ = ["pool", "client", "healthy", "_health_check_task"]
+
+    def __init__(self) -> None:
+        self.pool: aioredis.BlockingConnectionPool | None = None
+        self.client: Redis | None = None
+        self.healthy = False
+        self._health_check_task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def get_pool_options() -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "password": os.getenv("REDIS_PASSWORD"),
+            "encoding": "utf-8",
+            "decode_responses": True,
+            "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", default=50)),
+            "timeout": float(os.getenv("REDIS_POOL_TIMEOUT", default=5)),
+            "socket_timeout": float(os.getenv("REDIS_SOCKET_TIMEOUT", default=2)),
+            "socket_connect_timeout": float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", default=2)),
+            "socket_keepalive": True,
+            "health_check_interval": int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", default=30)),
+            "retry_on_timeout": True,
+        }
+        db = os.getenv("REDIS_USER_DB")
+        if db:
+            options["db"] = int(db)
+        return options
+
+    async def connect(self) -> Redis:
+        if self.client is None:
+            redis_url = os.getenv("REDIS_AUTH_URL")
+            if not redis_url:
+                raise RuntimeError("REDIS_AUTH_URL must be set to the url of the Redis server")
+            self.pool = aioredis.BlockingConnectionPool.from_url(redis_url, **self.get_pool_options())
+            self.client = Redis(connection_pool=self.pool)
+            await self.ping_with_retry()
+            self._health_check_task = asyncio.create_task(self._health_check())
+        return self.client
+
+    async def ping_with_retry(self) -> None:
+        attempts = int(os.getenv("REDIS_RETRY_ATTEMPTS", default=5))
+        backoff = float(os.getenv("REDIS_RETRY_BACKOFF", default=0.1))
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.client.ping()  # type: ignore
+                self.healthy = True
+                return
+            except (aioredis.ConnectionError, aioredis.TimeoutError) as exc:
+                self.healthy = False
+                if attempt == attempts:
+                    raise
+                delay = backoff * 2 ** (attempt - 1)
+                logger.warning(f"Redis ping failed ({exc}), retrying in {delay:.2f}s........")
+                await asyncio.sleep(delay)
+
+    async def _health_check(self) -> None:
+        interval = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", default=30))
+        while interval > 0:
+            await asyncio.sleep(interval)
+            try:
+                await self.ping_with_retry()
+            except (aioredis.ConnectionError, aioredis.TimeoutError) as exc:
+                logger.error(f"Redis health check failed: {exc}")
+                """
+                Drop the broken connections, the pool reconnects on the next checkout
+                """
+                try:
+                    await self.pool.disconnect()  # type: ignore
+                except Exception:
+                    logger.exception("Redis pool disconnect failed")
+            except Exception:
+                """
+                Any other failure must not end the task, the next interval checks again
+                """
+                self.healthy = False
+                logger.exception("Redis health check failed")
+
+    def get_pool_stats(self) -> dict[str, int]:
+        if self.pool is None:
+            return {"total": 0, "in_use": 0, "idle": 0, "max_connections": 0, "healthy": 0}
+        """
+        The pool does not expose its counts, read them from the private attributes of the installed
+        version and report no connections when they are not there
+        """
+        connections = getattr(self.pool, "_connections", None)
+        queue = getattr(getattr(self.pool, "pool", None), "_queue", None)
+        available = getattr(self.pool, "_available_connections", None)
+        in_use_connections = getattr(self.pool, "_in_use_connections", None)
+        if connections is not None and queue is not None:
+            total = len(connections)
+            idle = sum(1 for connection in queue if connection is not None)
+        elif available is not None and in_use_connections is not None:
+            idle = len(available)
+            total = idle + len(in_use_connections)
+        else:
+            total = idle = 0
+        return {
+            "total": total,
+            "in_use": total - idle,
+            "idle": idle,
+            "max_connections": self.pool.max_connections,
+            "healthy": int(self.healthy),
+        }
+
+    async def close(self) -> None:
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        if self.client is not None:
+            await self.client.close()
+            await self.pool.disconnect()  # type: ignore
+            self.client = None
+            self.pool = None
+        self.healthy = False
+
+
+redis_manager = RedisConnectionManager()
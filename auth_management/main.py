@@ -1,14 +1,16 @@
-import json
 import os
 
 from fastapi import FastAPI
-from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
-from auth_management.config.config import initiate_database, initiate_redis_pool
+from auth_management.config.config import initiate_database, initiate_redis_pool, close_database, close_redis_pool, \
+    get_pool_stats
 from auth_management.controllers.router import api_router
-from auth_management.utils.logger import get_logger
+from auth_management.utils.compression import CompressionMiddleware
+from auth_management.utils.logger import get_logger, RequestIdMiddleware, start_log_listener, stop_log_listener
+from auth_management.utils.metrics import MetricsMiddleware, metrics_endpoint, mark_worker_dead
+from auth_management.utils.openapi import mount_openapi
+from auth_management.utils.profiling import ProfilingMiddleware, is_profiling_enabled
 
 # API Doc
 if os.getenv("ENVIRONMENT") == "local":
@@ -30,7 +32,14 @@ else:
         debug=True
         # root_path="/api/v1"
     )
-auth_app.add_middleware(GZipMiddleware)
+if is_profiling_enabled():
+    auth_app.add_middleware(ProfilingMiddleware,
+                            interval=float(os.getenv("PROFILING_INTERVAL", default=0.001)),
+                            report_dir=os.getenv("PROFILING_REPORT_DIR") or None)
+auth_app.add_middleware(CompressionMiddleware,
+                        minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", default=1024)),
+                        cache_size=int(os.getenv("COMPRESSION_CACHE_SIZE", default=128)))
+auth_app.add_middleware(MetricsMiddleware, pool_stats=get_pool_stats)
 auth_app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -39,28 +48,34 @@ auth_app.add_middleware(
         allow_headers=["*"],
     )
 
+auth_app.add_middleware(RequestIdMiddleware)
 auth_app.include_router(api_router, prefix='/api/v1/auth')
+mount_openapi(auth_app)
+auth_app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 @auth_app.on_event("startup")
 async def start_database() -> None:
+    start_log_listener()
     logger = get_logger()
-    with open('openapi/auth_management/openapi.json', 'w') as f:
-        json.dump(get_openapi(
-            title=auth_app.title,
-            version=auth_app.version,
-            openapi_version=auth_app.openapi_version,
-            description=auth_app.description,
-            routes=auth_app.routes,
-        ), f)
     logger.info("Initiating database........")
     await initiate_database()
     logger.info("Initiating database completed........")
-    logger.info("OpenAPI specification created.........")
     logger.info("Connecting to redis.........")
     auth_app.state.redis_connection = await initiate_redis_pool()
     logger.info("Redis Connected.........")
 
+
+@auth_app.on_event("shutdown")
+async def shutdown_connections() -> None:
+    logger = get_logger()
+    logger.info("Closing redis.........")
+    await close_redis_pool()
+    logger.info("Closing database connections........")
+    await close_database()
+    mark_worker_dead()
+    stop_log_listener()
+
 #
 # PORT = 8000
 # BIND = '127.0.0.1'
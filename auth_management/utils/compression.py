@@ -0,0 +1,192 @@
+import gzip
+import importlib
+import typing
+import zlib
+from collections import OrderedDict
+from types import ModuleType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+zstandard: ModuleType | None
+try:
+    zstandard = importlib.import_module("zstandard")
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "image/", "video/", "audio/", "font/woff",
+    "application/pdf", "application/zip", "application/gzip", "application/x-7z-compressed",
+    "application/x-rar-compressed", "application/octet-stream")
+COMPRESSIBLE_IMAGE_TYPES = ("image/svg+xml", "image/bmp", "image/x-icon")
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith(COMPRESSIBLE_IMAGE_TYPES):
+        return True
+    return not content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+
+
+class StreamCompressor:
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        self._compressor: typing.Any
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            assert zstandard is not None
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return typing.cast(bytes, self._compressor.process(data) + self._compressor.flush())
+        return typing.cast(bytes, self._compressor.compress(data))
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return typing.cast(bytes, self._compressor.finish())
+        return typing.cast(bytes, self._compressor.flush())
+
+
+class CompressionMiddleware:
+    """
+    Negotiates br, zstd or gzip from Accept-Encoding, leaves small bodies, already encoded
+    bodies and incompressible media (images, pdf, archives) untouched, and keeps the compressed
+    body of cacheable responses (ETag plus a public Cache-Control) in a bounded LRU cache.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, gzip_level: int = 6,
+                 brotli_quality: int = 4, zstd_level: int = 3, cache_size: int = 128) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"br": brotli_quality, "zstd": zstd_level, "gzip": gzip_level}
+        self.encodings = [encoding for encoding, module in (("br", brotli), ("zstd", zstandard), ("gzip", gzip))
+                          if module is not None]
+        self.cache_size = cache_size
+        self.cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding = self.select_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+            if encoding is not None:
+                responder = CompressionResponder(self, encoding)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def select_encoding(self, accept_encoding: str) -> str | None:
+        accepted: set[str] = set()
+        for item in accept_encoding.split(","):
+            name, _, params = item.strip().partition(";")
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(name.strip().lower())
+        for encoding in self.encodings:
+            if encoding in accepted:
+                return encoding
+        return None
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return typing.cast(bytes, brotli.compress(body, quality=self.levels["br"]))
+        if encoding == "zstd":
+            assert zstandard is not None
+            return zstandard.ZstdCompressor(level=self.levels["zstd"]).compress(body)
+        return gzip.compress(body, compresslevel=self.levels["gzip"], mtime=0)
+
+    def compress_cached(self, key: tuple[str, str, str] | None, body: bytes, encoding: str) -> bytes:
+        if key is None or self.cache_size <= 0:
+            return self.compress(body, encoding)
+        compressed = self.cache.get(key)
+        if compressed is not None:
+            self.cache.move_to_end(key)
+            return compressed
+        compressed = self.compress(body, encoding)
+        self.cache[key] = compressed
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return compressed
+
+
+class CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send: Send = unattached_send
+        self.path = ""
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor: StreamCompressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        self.path = scope["path"]
+        await self.middleware.app(scope, receive, self.send_compressed)
+
+    def should_compress(self, headers: Headers, body: bytes, more_body: bool) -> bool:
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    def get_cache_key(self, headers: Headers) -> tuple[str, str, str] | None:
+        etag = headers.get("etag")
+        if etag is None or "public" not in headers.get("cache-control", ""):
+            return None
+        return self.path, etag, self.encoding
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk tells whether to compress.
+            self.initial_message = message
+        elif message_type == "http.response.body" and not self.started:
+            self.started = True
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if not self.should_compress(headers, body, more_body):
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                message["body"] = self.middleware.compress_cached(self.get_cache_key(headers), body, self.encoding)
+                headers["Content-Length"] = str(len(message["body"]))
+            else:
+                del headers["Content-Length"]
+                self.compressor = StreamCompressor(self.encoding, self.middleware.levels[self.encoding])
+                message["body"] = self.compressor.compress(body)
+            await self.send(self.initial_message)
+            await self.send(message)
+        elif message_type == "http.response.body" and not self.passthrough:
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            compressor = typing.cast(StreamCompressor, self.compressor)
+            message["body"] = compressor.compress(body)
+            if not more_body:
+                message["body"] += compressor.finish()
+            await self.send(message)
+        else:
+            await self.send(message)
+
+
+async def unattached_send(message: Message) -> typing.NoReturn:
+    raise RuntimeError("send awaitable not set")  # pragma: no cover
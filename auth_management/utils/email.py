@@ -6,6 +6,9 @@ from typing import Any
 
 from jinja2 import Environment, select_autoescape, FileSystemLoader, Template
 
+from auth_management.utils.logger import get_logger
+
+logger = get_logger()
 
 # from auth_management.config.config import Settings
 
@@ -45,7 +48,7 @@ class EmailGenerator(metaclass=SingletonMeta):
         text = message.as_string()
         session.sendmail(sender_address, receiver_address, text)
         session.quit()
-        print('Mail Sent')
+        logger.info('Mail Sent')
 
     def get_account_verify_email(self, to_email: str, **kwargs: Any) -> None:
         template = self.get_jinja_template(template_name='verify_email.html')
@@ -55,6 +58,10 @@ class EmailGenerator(metaclass=SingletonMeta):
         template = self.get_jinja_template(template_name='reset_password.html')
         self.send_email(to_email, "Reset Password", template.render(**kwargs))
 
+    def get_plan_reminder_email(self, to_email: str, **kwargs: Any) -> None:
+        template = self.get_jinja_template(template_name='plan_reminder.html')
+        self.send_email(to_email, "Your plans are ending soon", template.render(**kwargs))
+
     @staticmethod
     def get_jinja_template(template_name: str)-> Template:
         env = Environment(
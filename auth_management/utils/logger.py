@@ -1,8 +1,26 @@
+import copy
 import logging
 
 
 import os
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+_listeners: list[QueueListener] = []
 
 
 def get_logger() -> Logger:
@@ -10,3 +28,158 @@ def get_logger() -> Logger:
     if os.getenv("ENVIRONMENT") == "local":
         logger.propagate = False
     return logger
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, usable as formatter class in the logging config files.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "function": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(data, default=str).decode("utf-8")
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Copies the id of the current request on the record while still on the calling task,
+    the listener thread has no access to the request context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        setattr(record, "request_id", request_id.get())
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Keeps only `rate` (0..1) of the DEBUG records, the other levels are always kept.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Never blocks the event loop: when the bounded queue is full the record is dropped, and
+    the number of dropped records is reported once the queue accepts records again.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Only merges the arguments into the message, which must happen before they change;
+        formatting is left to the handlers of the listener.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.LogRecord(record.name, logging.WARNING, __file__, 0,
+                                        f"Log queue full, dropped {dropped} records", None, None)
+            setattr(warning, "request_id", None)
+            try:
+                self.queue.put_nowait(warning)
+            except queue.Full:
+                self.dropped += dropped
+
+
+def start_log_listener() -> None:
+    """
+    Moves the handlers configured by the logging config file (files, stdout) behind a bounded
+    queue drained by a listener thread, so that formatting aside, logging from a request never
+    waits on I/O. Called once per worker, on startup.
+    """
+    if _listeners:
+        return
+    queue_size = int(os.getenv("LOG_QUEUE_SIZE", default=10000))
+    sample_rate = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", default=1))
+    loggers = [logging.getLogger()] + [logger for logger in logging.root.manager.loggerDict.values()
+                                       if isinstance(logger, Logger)]
+    for logger in loggers:
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, QueueHandler)]
+        if not handlers:
+            continue
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.addFilter(RequestIdFilter())
+        queue_handler.addFilter(DebugSamplingFilter(sample_rate))
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+
+
+def stop_log_listener() -> None:
+    """
+    Flushes the queued records, called last on shutdown.
+    """
+    while _listeners:
+        _listeners.pop().stop()
+
+
+class RequestIdMiddleware:
+    """
+    Uses the X-Request-ID sent by nginx or the client, or a new one, for the logs of the
+    request and echoes it in the response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        current_id = ""
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                current_id = value.decode("latin-1")[:64]
+                break
+        if not current_id:
+            current_id = uuid.uuid4().hex
+        token = request_id.set(current_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = current_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+                               generate_latest, multiprocess)
+from pymongo import monitoring
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency by route",
+                            ["method", "route", "status"])
+REQUESTS_IN_PROGRESS = Gauge("http_requests_in_progress", "HTTP requests being processed",
+                             ["method"], multiprocess_mode="livesum")
+REQUEST_MONGO_COMMANDS = Histogram("http_request_mongo_commands", "Mongo commands issued per HTTP request",
+                                   ["method", "route"],
+                                   buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500))
+REQUEST_MONGO_DURATION = Histogram("http_request_mongo_duration_seconds",
+                                   "Time spent in Mongo commands per HTTP request", ["method", "route"])
+MONGO_COMMANDS = Counter("mongo_commands_total", "Mongo commands by command and collection",
+                         ["command", "collection", "status"])
+MONGO_COMMAND_DURATION = Histogram("mongo_command_duration_seconds", "Mongo command latency",
+                                   ["command", "collection"])
+MONGO_POOL = Gauge("mongo_pool_connections", "Mongo connection pool state of the worker", ["state"],
+                   multiprocess_mode="liveall")
+REDIS_POOL = Gauge("redis_pool_connections", "Redis connection pool state of the worker", ["state"],
+                   multiprocess_mode="liveall")
+
+POOL_STATS_INTERVAL = 5.0
+
+IGNORED_COMMANDS = {"isMaster", "ismaster", "hello", "ping", "saslStart", "saslContinue", "endSessions"}
+
+
+class QueryStats:
+    """
+    Mongo commands issued while handling one request. Motor runs pymongo in executor threads
+    with a copy of the request context, so the command listener reaches this object through
+    the query_stats ContextVar.
+    """
+    __slots__ = ["count", "duration", "collections", "_lock"]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.collections: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, collection: str) -> None:
+        with self._lock:
+            self.count += 1
+            self.collections[collection] = self.collections.get(collection, 0) + 1
+
+    def add_duration(self, duration: float) -> None:
+        with self._lock:
+            self.duration += duration
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self._collections: dict[tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_collection(event: monitoring.CommandStartedEvent) -> str:
+        if event.command_name == "getMore":
+            return str(event.command.get("collection", ""))
+        value = event.command.get(event.command_name)
+        return value if isinstance(value, str) else ""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        collection = self.get_collection(event)
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection
+        stats = query_stats.get()
+        if stats is not None:
+            stats.add(collection)
+
+    def _finish(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent, status: str) -> None:
+        with self._lock:
+            collection = self._collections.pop((event.connection_id, event.request_id), None)
+        if collection is None:
+            return
+        duration = event.duration_micros / 1e6
+        MONGO_COMMANDS.labels(event.command_name, collection, status).inc()
+        MONGO_COMMAND_DURATION.labels(event.command_name, collection).observe(duration)
+        stats = query_stats.get()
+        if stats is not None:
+            stats.add_duration(duration)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, "succeeded")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, "failed")
+
+
+command_listener = MongoCommandListener()
+
+
+class MetricsMiddleware:
+    """
+    Records latency and the Mongo commands of every request, labelled by the route template
+    (e.g. /api/v1/auth/hello/{name}) rather than the raw path, and in-flight requests.
+    """
+
+    def __init__(self, app: ASGIApp, pool_stats: Callable[[], dict[str, dict[str, int]]] | None = None) -> None:
+        self.app = app
+        self.pool_stats = pool_stats
+        self._route_paths: dict[Any, str] = {}
+        self._pool_stats_at = 0.0
+
+    def get_route(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if not self._route_paths:
+            routes: list[BaseRoute] = scope["app"].routes
+            self._route_paths = {getattr(route, "endpoint", None): getattr(route, "path", "") for route in routes}
+        return self._route_paths.get(endpoint, "unmatched")
+
+    def update_pool_stats(self) -> None:
+        now = time.monotonic()
+        if self.pool_stats is None or now - self._pool_stats_at < POOL_STATS_INTERVAL:
+            return
+        self._pool_stats_at = now
+        stats = self.pool_stats()
+        for state, value in stats.get("mongo", {}).items():
+            MONGO_POOL.labels(state).set(value)
+        for state, value in stats.get("redis", {}).items():
+            REDIS_POOL.labels(state).set(value)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status_code = 500
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_PROGRESS.labels(method).dec()
+            query_stats.reset(token)
+            route = self.get_route(scope)
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(time.perf_counter() - start)
+            REQUEST_MONGO_COMMANDS.labels(method, route).observe(stats.count)
+            REQUEST_MONGO_DURATION.labels(method, route).observe(stats.duration)
+            self.update_pool_stats()
+
+
+def get_registry() -> CollectorRegistry:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    return Response(content=generate_latest(get_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_dead() -> None:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,88 @@
+import argparse
+import hashlib
+import json
+import os
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute
+
+OPENAPI_SPEC_PATH = "openapi/auth_management/openapi.json"
+
+
+def generate_openapi(app: FastAPI) -> dict[str, Any]:
+    return get_openapi(
+        title=app.title,
+        version=app.version,
+        openapi_version=app.openapi_version,
+        description=app.description,
+        routes=app.routes,
+    )
+
+
+def write_openapi(app: FastAPI, path: str = OPENAPI_SPEC_PATH) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(generate_openapi(app), f)
+
+
+class OpenAPIDocument:
+    """
+    Serves the OpenAPI specification generated at build time as precomputed bytes.
+    The specification is only generated in-process when the build step has not produced it. The
+    generated file is not tracked, so a checkout never serves the specification of older routes.
+    """
+    __slots__ = ["app", "path", "_content", "_etag"]
+
+    def __init__(self, app: FastAPI, path: str = OPENAPI_SPEC_PATH) -> None:
+        self.app = app
+        self.path = path
+        self._content: bytes | None = None
+        self._etag: str | None = None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    self._content = f.read()
+            else:
+                self._content = json.dumps(generate_openapi(self.app)).encode("utf-8")
+            self._etag = '"%s"' % hashlib.md5(self._content).hexdigest()
+        return self._content
+
+    async def endpoint(self, request: Request) -> Response:
+        content = self.content
+        headers = {"ETag": str(self._etag), "Cache-Control": "public, max-age=3600"}
+        if request.headers.get("if-none-match") == self._etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type="application/json", headers=headers)
+
+
+def mount_openapi(app: FastAPI, path: str = OPENAPI_SPEC_PATH) -> OpenAPIDocument:
+    """
+    Replaces the FastAPI openapi route, which regenerates and re-serializes the schema,
+    so that the docs pages load the precomputed document instead.
+    """
+    document = OpenAPIDocument(app, path)
+    routes: list[BaseRoute] = [route for route in app.router.routes
+                               if getattr(route, "path", None) != app.openapi_url]
+    app.router.routes = routes
+    app.add_route(str(app.openapi_url), document.endpoint, include_in_schema=False)
+    return document
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the OpenAPI specification of auth_app")
+    parser.add_argument("--output", default=OPENAPI_SPEC_PATH, help="path of the generated openapi.json")
+    args = parser.parse_args()
+
+    from auth_management.main import auth_app
+    write_openapi(auth_app, args.output)
+
+
+if __name__ == "__main__":
+    main()
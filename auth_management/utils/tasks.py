@@ -1,4 +1,5 @@
 import os
+from typing import Any
 
 from celery import Celery
 from pydantic import EmailStr
@@ -12,7 +13,8 @@ celery_app: Celery = Celery(
 )
 celery_app.conf.task_routes = {
     "auth_management.utils.tasks.send_account_verify_email": "send_verify_email",
-    "auth_management.utils.tasks.send_account_reset_password_email": "send_change_password_email"}
+    "auth_management.utils.tasks.send_account_reset_password_email": "send_change_password_email",
+    "auth_management.utils.tasks.send_plan_reminder_email": "send_plan_reminder_email"}
 
 celery: Celery = celery_app
 
@@ -30,3 +32,13 @@ def send_account_reset_password_email(email: EmailStr, token: str) -> None:
     email_handler.get_account_change_password_email(to_email=email,
                                                     url=str(os.getenv(
                                                         "FRONT_END_URL")) + "?reset_password=" + token)
+
+
+@celery_app.task(acks_late=True)
+def send_plan_reminder_email(email: EmailStr, plans: list[dict[str, Any]]) -> None:
+    """
+    Published by the plan reminder job of skill_management, by name, with the skill name, plan type and
+    end date of each plan.
+    """
+    email_handler = EmailGenerator()
+    email_handler.get_plan_reminder_email(to_email=email, plans=plans, url=str(os.getenv("FRONT_END_URL")))
@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import sys
+from typing import Any
+
+import httpx
+
+from benchmarks.driver import compare_with_baseline, format_report, load_results, run_scenario, write_results
+from benchmarks.scenarios import AuthBenchmark, SkillBenchmark
+
+
+def get_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the API endpoints in process against synthetic data")
+    parser.add_argument("service", choices=["skill", "auth"], help="service to benchmark")
+    parser.add_argument("--env-file", help="env file of the service (e.g. skill_management/dev.env) to load first")
+    parser.add_argument("--profiles", type=int, default=10000, help="synthetic profiles to seed (skill)")
+    parser.add_argument("--users", type=int, default=50, help="distinct users issuing the requests")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20, help="requests in flight per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the synthetic data and request mix")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the synthetic profiles already seeded")
+    parser.add_argument("--scenario", action="append", help="run only this scenario (repeatable)")
+    parser.add_argument("--output", help="write the results as json to this path")
+    parser.add_argument("--baseline", help="results json of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed p95/throughput change against the baseline (0.1 = 10%%)")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    """
+    The apps read their configuration from the environment at import time, so they are only
+    imported once the service is known. Only one service can be loaded per process.
+    """
+    benchmark: SkillBenchmark | AuthBenchmark
+    if args.service == "skill":
+        from skill_management.main import skill_app as app
+        benchmark = SkillBenchmark(app, profiles=args.profiles, users=args.users, seed=args.seed,
+                                   skip_seed=args.skip_seed)
+    else:
+        from auth_management.main import auth_app as app
+        benchmark = AuthBenchmark(app, users=args.users)
+
+    results: dict[str, dict[str, Any]] = {}
+    await app.router.startup()
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(app=app, base_url="http://benchmark", limits=limits) as client:
+            await benchmark.setup(client)
+            try:
+                for scenario in benchmark.scenarios(args.requests):
+                    if args.scenario and scenario.name not in args.scenario:
+                        continue
+                    if scenario.name == "file_download" and not getattr(benchmark, "uploaded_files", None):
+                        print("file_download skipped: it downloads the files of the file_upload scenario")
+                        continue
+                    result = await run_scenario(client, scenario.name, scenario.request, args.requests,
+                                                args.concurrency, scenario.expected_status)
+                    results[scenario.name] = result.summary()
+            finally:
+                await benchmark.teardown()
+    finally:
+        await app.router.shutdown()
+    return results
+
+
+def main() -> None:
+    args = get_arguments()
+    if args.env_file:
+        from dotenv import load_dotenv
+        load_dotenv(args.env_file, override=True)
+    results = asyncio.run(run(args))
+    print(format_report(results))
+    if args.output:
+        settings = {key: value for key, value in vars(args).items()
+                    if key not in ("output", "baseline", "env_file")}
+        write_results(args.output, results, settings)
+    if args.baseline:
+        regressions = compare_with_baseline(results, load_results(args.baseline), args.tolerance)
+        if regressions:
+            print("\nRegressions against " + args.baseline + ":")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print("\nNo regression against " + args.baseline)
+
+
+if __name__ == "__main__":
+    main()
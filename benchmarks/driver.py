@@ -0,0 +1,113 @@
+import asyncio
+import json
+import math
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+class ScenarioResult:
+    __slots__ = ["name", "latencies", "errors", "elapsed"]
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Nearest-rank percentile of the successful request latencies, in milliseconds.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1] * 1000
+
+    @property
+    def throughput(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.latencies) / self.elapsed
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "requests": len(self.latencies) + self.errors,
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "throughput_rps": round(self.throughput, 2),
+        }
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, request: Request, total_requests: int,
+                       concurrency: int, expected_status: int = 200) -> ScenarioResult:
+    """
+    Fires `total_requests` requests through `concurrency` workers sharing one counter, so the
+    app always has `concurrency` requests in flight until the end of the run.
+    """
+    result = ScenarioResult(name)
+    counter = iter(range(total_requests))
+
+    async def worker() -> None:
+        for index in counter:
+            start = time.perf_counter()
+            try:
+                response = await request(client, index)
+            except httpx.HTTPError:
+                result.errors += 1
+                continue
+            if response.status_code != expected_status:
+                result.errors += 1
+                continue
+            result.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def compare_with_baseline(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]],
+                          tolerance: float) -> list[str]:
+    """
+    Returns one message per scenario whose p95 latency grew, or whose throughput dropped,
+    by more than `tolerance` (0.1 = 10%) against the baseline run.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {previous['throughput_rps']}rps -> {current['throughput_rps']}rps")
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: errors {previous['errors']} -> {current['errors']}")
+    return regressions
+
+
+def format_report(results: dict[str, dict[str, Any]]) -> str:
+    header = f"{'scenario':<20}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}"
+    lines = [header, "-" * len(header)]
+    for name, summary in results.items():
+        lines.append(f"{name:<20}{summary['requests']:>10}{summary['errors']:>8}{summary['p50_ms']:>10}"
+                     f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}{summary['throughput_rps']:>10}")
+    return "\n".join(lines)
+
+
+def load_results(path: str) -> dict[str, dict[str, Any]]:
+    with open(path, 'r') as f:
+        return json.load(f)["results"]  # type: ignore
+
+
+def write_results(path: str, results: dict[str, dict[str, Any]], settings: dict[str, Any]) -> None:
+    with open(path, 'w') as f:
+        json.dump({"settings": settings, "results": results}, f, indent=2)
@@ -0,0 +1,168 @@
+import os
+import random
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from jose import jwt
+
+from benchmarks.driver import Request
+
+"""
+Smallest valid pdf, the resume upload only checks the extension
+"""
+RESUME_PDF = (b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+              b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n")
+SYNTHETIC_PASSWORD = "Synthetic#Pass1"
+
+
+class Scenario:
+    __slots__ = ["name", "request", "expected_status"]
+
+    def __init__(self, name: str, request: Request, expected_status: int = 200) -> None:
+        self.name = name
+        self.request = request
+        self.expected_status = expected_status
+
+
+def create_token(user_id: str, lifetime: int = 3600) -> str:
+    """
+    Signs the same claims as the JWT strategy of auth_management, so the skill service
+    can be benchmarked without a running auth service.
+    """
+    payload = {"user_id": user_id, "aud": "fastapi-users:auth", "exp": int(time.time()) + lifetime}
+    return str(jwt.encode(payload, str(os.getenv("VERIFY_TOKEN_SECRET_KEY")),
+                          algorithm=os.getenv("ENCRYPTION_ALGORITHM", default="HS256")))
+
+
+class SkillBenchmark:
+    """
+    Seeds synthetic profiles, registers `users` of them (plus an admin) in the Redis session
+    store read by the JWT bearers and drives the profile, skill and file endpoints as them.
+    """
+
+    def __init__(self, app: FastAPI, profiles: int, users: int, seed: int, skip_seed: bool = False) -> None:
+        self.app = app
+        self.profiles = profiles
+        self.users = users
+        self.seed = seed
+        self.skip_seed = skip_seed
+        self.rng = random.Random(seed)
+        self.profile_ids: list[str] = []
+        self.user_tokens: list[str] = []
+        self.admin_token = ""
+        self.session_keys: list[str] = []
+        self.uploaded_files: list[tuple[str, str, str]] = []
+
+    async def setup(self, client: httpx.AsyncClient) -> None:
+        from skill_management.utils.synthetic_data import find_synthetic_data, insert_synthetic_data, \
+            synthetic_email
+
+        if self.skip_seed:
+            seeded = await find_synthetic_data()
+        else:
+            seeded = await insert_synthetic_data(self.profiles, seed=self.seed)
+        if not seeded:
+            raise RuntimeError("No synthetic profiles found, run without --skip-seed first")
+        self.profiles = len(seeded)
+        self.profile_ids = [str(profile_id) for profile_id, _ in seeded]
+        redis = self.app.state.redis_connection
+        for profile_id, email in seeded[:self.users]:
+            user_id = f"synthetic-{profile_id}"
+            await redis.hset(name=user_id, mapping={"email": email, "is_admin": 0, "is_verified": 1})
+            self.session_keys.append(user_id)
+            self.user_tokens.append(create_token(user_id))
+        admin_id = "synthetic-admin"
+        await redis.hset(name=admin_id, mapping={"email": synthetic_email(0), "is_admin": 1, "is_verified": 1})
+        self.session_keys.append(admin_id)
+        self.admin_token = create_token(admin_id)
+
+    async def teardown(self) -> None:
+        from beanie import PydanticObjectId
+
+        from skill_management.models.file import Files
+
+        if self.session_keys:
+            await self.app.state.redis_connection.delete(*self.session_keys)
+        for file_id, path, _ in self.uploaded_files:
+            await Files.find({"_id": PydanticObjectId(file_id)}).delete()
+            if os.path.exists(path):
+                os.remove(path)
+
+    def headers(self, token: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {token}"}
+
+    def scenarios(self, total_requests: int) -> list[Scenario]:
+        pages = max(self.profiles // 10, 1)
+        page_numbers = [self.rng.randint(1, pages) for _ in range(total_requests)]
+        detail_ids = [self.rng.choice(self.profile_ids) for _ in range(total_requests)]
+
+        async def profile_listing(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            return await client.get("/api/v1/admin/profiles/",
+                                    params={"page-number": page_numbers[index], "page-size": 10},
+                                    headers=self.headers(self.admin_token))
+
+        async def profile_detail(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            return await client.get(f"/api/v1/admin/user-profiles/{detail_ids[index]}",
+                                    headers=self.headers(self.admin_token))
+
+        async def skill_upsert(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            body = {"skill_id": 1, "experience_year": index % 15, "number_of_projects": index % 30,
+                    "level": index % 10 + 1, "training_duration": index % 24}
+            return await client.post("/api/v1/profile/skills", json=body,
+                                     headers=self.headers(self.user_tokens[index % len(self.user_tokens)]))
+
+        async def file_upload(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            token = self.user_tokens[index % len(self.user_tokens)]
+            response = await client.post("/api/v1/profile/files/upload-resume",
+                                         files={"file": ("resume.pdf", RESUME_PDF, "application/pdf")},
+                                         headers=self.headers(token))
+            if response.status_code == 201:
+                data: dict[str, Any] = response.json()
+                path = os.getcwd() + str(os.getenv("FILE_UPLOAD_PATH", default="")) + data["file_name"]
+                self.uploaded_files.append((data["file_id"], path, token))
+            return response
+
+        async def file_download(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            file_id, _, token = self.uploaded_files[index % len(self.uploaded_files)]
+            return await client.get(f"/api/v1/profile/files/response/{file_id}", headers=self.headers(token))
+
+        return [
+            Scenario("profile_listing", profile_listing),
+            Scenario("profile_detail", profile_detail),
+            Scenario("skill_upsert", skill_upsert, expected_status=201),
+            Scenario("file_upload", file_upload, expected_status=201),
+            Scenario("file_download", file_download),
+        ]
+
+
+class AuthBenchmark:
+    """
+    Registers `users` accounts once and measures the password login.
+    """
+
+    def __init__(self, app: FastAPI, users: int) -> None:
+        self.app = app
+        self.users = users
+        self.emails = [f"synthetic-login-{index}@synthetic.example.com" for index in range(users)]
+
+    async def setup(self, client: httpx.AsyncClient) -> None:
+        for email in self.emails:
+            response = await client.post("/api/v1/auth/register",
+                                         json={"email": email, "password": SYNTHETIC_PASSWORD})
+            if response.status_code not in (201, 400):
+                raise RuntimeError(f"Could not register {email}: {response.status_code} {response.text}")
+
+    async def teardown(self) -> None:
+        from auth_management.entities.user import User
+
+        await User.find({"email": {"$in": self.emails}}).delete()
+
+    def scenarios(self, total_requests: int) -> list[Scenario]:
+        async def login(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            return await client.post("/api/v1/auth/jwt/login",
+                                     data={"username": self.emails[index % len(self.emails)],
+                                           "password": SYNTHETIC_PASSWORD})
+
+        return [Scenario("login", login)]
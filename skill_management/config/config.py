@@ -1,40 +1,38 @@
-import os
-
-import aioredis
 from aioredis import Redis
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
 
+from skill_management.config.database import database_manager
+from skill_management.config.redis_pool import redis_manager
+from skill_management.models.counter import Counters
 from skill_management.models.designation import Designations, CustomDesignations
 from skill_management.models.enums import (PlanType, Status, UserStatus, FileType, SkillCategory, SkillType, \
-                                           DesignationStatus, Gender, EnumInitializer, ProfileStatus)
+                                           DesignationStatus, Gender, SeedState, ProfileStatus)
 from skill_management.models.file import Files
 from skill_management.models.plan import Plans
 from skill_management.models.profile import Profiles
 from skill_management.models.skill import Skills
-from skill_management.utils.initial_data import initialize_database
 
 
 async def initiate_database() -> None:
-    if os.getenv("ENVIRONMENT") == "local":
-        client = AsyncIOMotorClient(os.getenv("LOCAL_DATABASE_URL"))
-    else:
-        client = AsyncIOMotorClient(os.getenv("DATABASE_URL"))
-    await init_beanie(database=client.get_default_database(),
-                      document_models=[EnumInitializer, PlanType, Status, UserStatus, FileType, SkillCategory, # type: ignore
+    await init_beanie(database=await database_manager.connect(),
+                      document_models=[SeedState, PlanType, Status, UserStatus, FileType, SkillCategory, # type: ignore
                                        SkillType, DesignationStatus, Gender, Designations, Files, Profiles, Plans, # type: ignore
-                                       ProfileStatus, Skills, CustomDesignations])  # type: ignore
+                                       ProfileStatus, Skills, CustomDesignations, Counters])  # type: ignore
     # , Files, Plans,
     # Profiles, Skills
-    await initialize_database()
+
+
+async def close_database() -> None:
+    await database_manager.close()
 
 
 async def initiate_redis_pool() -> Redis:
-    redis_connection = await aioredis.from_url(
-        os.getenv("REDIS_AUTH_URL"),
-        password=os.getenv("REDIS_PASSWORD"),
-        encoding="utf-8",
-        db=os.getenv("REDIS_USER_DB"),
-        decode_responses=True,
-    )
-    return redis_connection
+    return await redis_manager.connect()
+
+
+async def close_redis_pool() -> None:
+    await redis_manager.close()
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+    return {"mongo": database_manager.get_pool_stats(), "redis": redis_manager.get_pool_stats()}
@@ -10,8 +10,10 @@ from skill_management.schemas.designation import DesignationDataResponse, Profil
     DesignationCreateRequest, DesignationCreateAdminRequest, ProfileDesignationDetailsResponse
 from skill_management.services.designation import DesignationService
 from skill_management.utils.auth_manager import JWTBearer, JWTBearerAdmin
+from skill_management.utils.etag import revision_response
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.trusted_response import TrustedResponse
 
 designation_router: APIRouter = APIRouter(tags=["designation"])
 logger = get_logger()
@@ -57,7 +59,7 @@ async def get_designation_list(request: Request,
                                                                     alias="designation-name"),
                                user_id: str = Depends(JWTBearer()),
                                service: DesignationService = Depends()):
-    return await service.get_master_designation_list(designation_name)
+    return TrustedResponse(await service.get_master_designation_list(designation_name))
 
 
 @designation_router.post("/profile/designations",
@@ -178,7 +180,8 @@ async def get_profile_designation_by_admin(request: Request,  # type: ignore
                                                                                description="input profile id of the user",
                                                                                alias="profile_id"),
                                            service: DesignationService = Depends()):
-    return await service.get_designation_details_by_admin(profile_id=profile_id)
+    return await revision_response(request, {"_id": profile_id},
+                                   lambda: service.get_designation_details_by_admin(profile_id=profile_id))
 
 
 @designation_router.get("/profile/user-profiles/designation",
@@ -198,4 +201,5 @@ async def get_profile_designation_by_user(request: Request,  # type: ignore
                                           user_id: str = Depends(JWTBearer()),
                                           service: DesignationService = Depends()):
     email = await get_profile_email(user_id=user_id, request=request)
-    return await service.get_designation_details_by_user(email=email)
+    return await revision_response(request, {"user_id": email},
+                                   lambda: service.get_designation_details_by_user(email=email), active_only=True)
@@ -11,8 +11,10 @@ from skill_management.schemas.education import EducationCreateRequest, Education
 from skill_management.schemas.skill import ProfileSkillDetailsResponse
 from skill_management.services.education import EducationService
 from skill_management.utils.auth_manager import JWTBearer, JWTBearerAdmin
+from skill_management.utils.etag import revision_response
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.query_budget import query_budget
 
 education_router: APIRouter = APIRouter(tags=["education"])
 logger = get_logger()
@@ -32,6 +34,7 @@ logger = get_logger()
                            },
                        },
                        )
+@query_budget(5)
 async def create_education_by_user(request: Request,  # type: ignore
                                    education_request: EducationCreateRequest = Body(
                                        examples={
@@ -94,6 +97,7 @@ async def create_education_by_user(request: Request,  # type: ignore
                            },
                        },
                        )
+@query_budget(5)
 async def create_education_by_admin(request: Request,  # type: ignore
                                     education_request: EducationCreateAdminRequest = Body(
                                         examples={
@@ -161,7 +165,8 @@ async def get_profile_educations_by_admin(request: Request,  # type: ignore
                                                                               description="input profile id of the user",
                                                                               alias="profile_id"),
                                           service: EducationService = Depends()):
-    return await service.get_education_details_by_admin(profile_id=profile_id)
+    return await revision_response(request, {"_id": profile_id},
+                                   lambda: service.get_education_details_by_admin(profile_id=profile_id))
 
 
 @education_router.get("/profile/user-profiles/educations",
@@ -181,4 +186,6 @@ async def get_profile_educations_by_user(request: Request,  # type: ignore
                                          user_id: str = Depends(JWTBearer()),
                                          service: EducationService = Depends()):
     email = await get_profile_email(user_id=user_id, request=request)
-    return await service.get_education_details_by_user(email=cast(str, email))
+    return await revision_response(request, {"user_id": email},
+                                   lambda: service.get_education_details_by_user(email=cast(str, email)),
+                                   active_only=True)
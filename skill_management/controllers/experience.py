@@ -9,10 +9,13 @@ from fastapi.responses import ORJSONResponse
 from skill_management.schemas.base import ErrorMessage
 from skill_management.schemas.experience import ExperienceCreateRequest, ExperienceListDataResponse, \
     ExperienceCreateAdminRequest, ProfileExperienceDetailsResponse
-from skill_management.services.experience import ExperienceService
+from skill_management.services.experience import ExperienceService, PROFILE_EXPERIENCE_FIELDS
 from skill_management.utils.auth_manager import JWTBearer, JWTBearerAdmin
+from skill_management.utils.etag import revision_response
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.query_budget import query_budget
+from skill_management.utils.sparse_fields import SparseFields, sparse_fields, sparse_response
 
 experience_router: APIRouter = APIRouter(tags=["experience"])
 logger = get_logger()
@@ -32,6 +35,7 @@ logger = get_logger()
                             },
                         },
                         )
+@query_budget(9)
 async def create_experience_by_user(request: Request,  # type: ignore
                                     experience_request: ExperienceCreateRequest = Body(..., examples={
                                         "CREATE": {
@@ -98,6 +102,7 @@ async def create_experience_by_user(request: Request,  # type: ignore
                             },
                         },
                         )
+@query_budget(9)
 async def create_or_update_experience_by_admin(request: Request,  # type: ignore
                                                experience_request: ExperienceCreateAdminRequest = Body(..., examples={
                                                    "CREATE": {
@@ -160,8 +165,13 @@ async def get_profile_educations_by_admin(request: Request,  # type: ignore
                                           profile_id: PydanticObjectId = Path(...,
                                                                               description="input profile id of the user",
                                                                               alias="profile_id"),
+                                          fields: SparseFields | None = Depends(
+                                              sparse_fields(PROFILE_EXPERIENCE_FIELDS)),
                                           service: ExperienceService = Depends()):
-    return await service.get_experiences_details_by_admin(profile_id=profile_id)
+    return await revision_response(
+        request, {"_id": profile_id},
+        lambda: sparse_response(service.get_experiences_details_by_admin(profile_id=profile_id, fields=fields),
+                                fields, items="experiences"))
 
 
 @experience_router.get("/profile/user-profiles/experiences",
@@ -179,6 +189,12 @@ async def get_profile_educations_by_admin(request: Request,  # type: ignore
                        })
 async def get_profile_educations_by_user(request: Request,  # type: ignore
                                          user_id: str = Depends(JWTBearer()),
+                                         fields: SparseFields | None = Depends(
+                                             sparse_fields(PROFILE_EXPERIENCE_FIELDS)),
                                          service: ExperienceService = Depends()):
     email = await get_profile_email(user_id=user_id, request=request)
-    return await service.get_experiences_details_by_user(email=cast(str, email))
+    return await revision_response(
+        request, {"user_id": email},
+        lambda: sparse_response(service.get_experiences_details_by_user(email=cast(str, email), fields=fields),
+                                fields, items="experiences"),
+        active_only=True)
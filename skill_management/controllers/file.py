@@ -165,5 +165,5 @@ async def get_profile_picture_response(request: Request, # type: ignore
                                        profile_id: PydanticObjectId = Path(...,
                                                               description="input file id for file response"),
                                        service: FileService = Depends(FileService)):
-    print("profile_id: ", profile_id)
+    logger.debug(f"profile_id: {profile_id}")
     return await service.get_profile_picture_response(cast(PydanticObjectId, profile_id), request)
\ No newline at end of file
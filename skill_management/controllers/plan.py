@@ -12,6 +12,7 @@ from skill_management.services.plan import PlanService
 from skill_management.utils.auth_manager import JWTBearer, JWTBearerAdmin
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.trusted_response import TrustedResponse
 
 plan_router: APIRouter = APIRouter(tags=["plan"])
 logger = get_logger()
@@ -183,7 +184,7 @@ async def get_profile_plans_by_admin(request: Request,  # type: ignore
                                                                          description="input profile id of the user",
                                                                          alias="profile_id"),
                                      service: PlanService = Depends()):
-    return await service.get_plan_details_by_admin(profile_id=profile_id)
+    return TrustedResponse(await service.get_plan_details_by_admin(profile_id=profile_id))
 
 
 @plan_router.get("/profile/user-profiles/plans",
@@ -203,4 +204,4 @@ async def get_profile_plans_by_user(request: Request,  # type: ignore
                                     user_id: str = Depends(JWTBearer()),
                                     service: PlanService = Depends()):
     email = await get_profile_email(user_id=user_id, request=request)
-    return await service.get_plan_details_by_user(email=cast(str, email))
+    return TrustedResponse(await service.get_plan_details_by_user(email=cast(str, email)))
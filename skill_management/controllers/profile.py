@@ -10,11 +10,15 @@ from starlette.requests import Request
 from skill_management.enums import ProfileStatusEnum
 from skill_management.schemas.base import ErrorMessage
 from skill_management.schemas.profile import ProfileResponse, PaginatedProfileResponse, ProfileBasicRequest, \
-    ProfileBasicForAdminRequest, ProfileDetailsResponse
-from skill_management.services.profile import ProfileService
+    ProfileBasicForAdminRequest, ProfileDetailsResponse, ProfileFullResponse
+from skill_management.services.profile import ProfileService, PROFILE_BASIC_FIELDS, PROFILE_DETAILS_FIELDS
 from skill_management.utils.auth_manager import JWTBearerAdmin, JWTBearer, JWTBearerInactive
+from skill_management.utils.etag import revision_response, if_match_revision
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.query_budget import query_budget
+from skill_management.utils.sparse_fields import SparseFields, sparse_fields, sparse_response
+from skill_management.utils.trusted_response import TrustedResponse
 
 profile_router: APIRouter = APIRouter(tags=["profile"])
 logger = get_logger()
@@ -43,6 +47,7 @@ async def get_profile(request: Request, user_id: str = Depends(JWTBearerInactive
                         },
                     }
                     )
+@query_budget(2)
 async def get_user_profiles_for_admin(request: Request,  # type: ignore
                                       skill_ids: list[int] | None = Query(default=None,
                                                                    description="input skill id as integer",
@@ -64,16 +69,19 @@ async def get_user_profiles_for_admin(request: Request,  # type: ignore
                                                                alias="page-number"),
                                       page_size: int = Query(default=10, description="number of element in page", gt=0,
                                                              alias="page-size"),
+                                      fields: SparseFields | None = Depends(sparse_fields(PROFILE_BASIC_FIELDS)),
                                       admin_user_id: str = Depends(JWTBearerAdmin()),
                                       service: ProfileService = Depends(),
                                       ):
-    return await service.get_user_profiles_for_admin(skill_ids=skill_ids,
-                                                     employee_name=employee_name,
-                                                     mobile=mobile,
-                                                     email=email,
-                                                     profile_status=profile_status,
-                                                     page_number=page_number,
-                                                     page_size=page_size)
+    response = service.get_user_profiles_for_admin(skill_ids=skill_ids,
+                                                   employee_name=employee_name,
+                                                   mobile=mobile,
+                                                   email=email,
+                                                   profile_status=profile_status,
+                                                   page_number=page_number,
+                                                   page_size=page_size,
+                                                   fields=fields)
+    return TrustedResponse(await sparse_response(response, fields, items="items"))
 
 
 @profile_router.get("/admin/user-profiles/{profile_id}",
@@ -90,13 +98,17 @@ async def get_user_profiles_for_admin(request: Request,  # type: ignore
                         },
                     }
                     )
+@query_budget(3)
 async def get_user_profile_by_id_for_admin(request: Request,  # type: ignore
                                            profile_id: PydanticObjectId = Path(...,
                                                                                description="input profile id of the user"),
+                                           fields: SparseFields | None = Depends(sparse_fields(PROFILE_DETAILS_FIELDS)),
                                            admin_user_id: str = Depends(JWTBearerAdmin()),
                                            service: ProfileService = Depends(),
                                            ):
-    return await service.get_user_profile_by_admin(profile_id)
+    return await revision_response(
+        request, {"_id": profile_id},
+        lambda: sparse_response(service.get_user_profile_by_admin(profile_id, fields), fields))
 
 
 @profile_router.get("/profile/user-profiles/",
@@ -113,12 +125,73 @@ async def get_user_profile_by_id_for_admin(request: Request,  # type: ignore
                         },
                     }
                     )
+@query_budget(3)
 async def get_user_profile_by_user(request: Request,  # type: ignore
+                                   fields: SparseFields | None = Depends(sparse_fields(PROFILE_DETAILS_FIELDS)),
                                    user_id: str = Depends(JWTBearer()),
                                    service: ProfileService = Depends(),
                                    ):
     email = await get_profile_email(request=request, user_id=user_id)
-    return await service.get_user_profile_by_user(cast(str, email))
+    return await revision_response(
+        request, {"user_id": email},
+        lambda: sparse_response(service.get_user_profile_by_user(cast(str, email), fields), fields),
+        active_only=True)
+
+
+@profile_router.get("/admin/user-profiles/{profile_id}/full",
+                    response_class=ORJSONResponse,
+                    response_model=ProfileFullResponse,
+                    status_code=200,
+                    responses={
+                        400: {
+                            "model": ErrorMessage,
+                            "description": "The profile is not available"
+                        },
+                        200: {
+                            "description": "The profile with its skills, experiences, educations, designation "
+                                           "and plans is requested",
+                        },
+                    }
+                    )
+@query_budget(1)
+async def get_full_profile_by_id_for_admin(request: Request,  # type: ignore
+                                           profile_id: PydanticObjectId = Path(...,
+                                                                               description="input profile id of the user"),
+                                           admin_user_id: str = Depends(JWTBearerAdmin()),
+                                           service: ProfileService = Depends(),
+                                           ):
+    """
+    The details, skills, experiences, educations, designation and plans of a profile, from one aggregation
+    """
+    return TrustedResponse(await service.get_full_profile_by_admin(profile_id))
+
+
+@profile_router.get("/profile/user-profiles/full",
+                    response_class=ORJSONResponse,
+                    response_model=ProfileFullResponse,
+                    status_code=200,
+                    responses={
+                        404: {
+                            "model": ErrorMessage,
+                            "description": "The profile is not available"
+                        },
+                        200: {
+                            "description": "The profile with its skills, experiences, educations, designation "
+                                           "and plans is requested",
+                        },
+                    }
+                    )
+@query_budget(1)
+async def get_full_profile_by_user(request: Request,  # type: ignore
+                                   user_id: str = Depends(JWTBearer()),
+                                   service: ProfileService = Depends(),
+                                   ):
+    """
+    The details, skills, experiences, educations, designation and plans of the user profile, from one
+    aggregation
+    """
+    email = await get_profile_email(request=request, user_id=user_id)
+    return TrustedResponse(await service.get_full_profile_by_user(cast(str, email)))
 
 
 # ProfileBasicRequest
@@ -131,11 +204,16 @@ async def get_user_profile_by_user(request: Request,  # type: ignore
                              "model": ErrorMessage,
                              "description": "The profile details is not available"
                          },
+                         412: {
+                             "model": ErrorMessage,
+                             "description": "The profile was changed since the read of If-Match"
+                         },
                          200: {
                              "description": "The profile details is requested",
                          },
                      }
                      )
+@query_budget(5)
 async def create_user_profile_by_user(request: Request,  # type: ignore
                                       profile: ProfileBasicRequest = Body(
                                           examples={
@@ -182,10 +260,12 @@ async def create_user_profile_by_user(request: Request,  # type: ignore
 
 
     **Update:** Must provide *"profile_id"*. Should not provide *"email"*, *"name"*, *"designation_id"*. Other attributes are optional.
+    With an *If-Match* header holding the *ETag* of a read of the profile, the update fails with 412 if the profile was changed since.
     """
+    revision_id = if_match_revision(request.headers.get("if-match"))
     email = await get_profile_email(request=request, user_id=user_id)
 
-    return await service.create_or_update_user_profile_by_user(profile, email)
+    return await service.create_or_update_user_profile_by_user(profile, email, revision_id)
 
 
 @profile_router.post("/admin/user-profiles/",
@@ -201,11 +281,16 @@ async def create_user_profile_by_user(request: Request,  # type: ignore
                              "model": ErrorMessage,
                              "description": "The profile details is not available"
                          },
+                         412: {
+                             "model": ErrorMessage,
+                             "description": "The profile was changed since the read of If-Match"
+                         },
                          200: {
                              "description": "The profile details is requested",
                          },
                      }
                      )
+@query_budget(5)
 async def create_or_update_user_profile_by_admin(  # type: ignore
         request: Request,
         profile: ProfileBasicForAdminRequest = Body(
@@ -266,5 +351,7 @@ async def create_or_update_user_profile_by_admin(  # type: ignore
 
 
     **Update:** Must provide *"profile_id"*. Should not provide *"email"*. Other attributes are optional.
+    With an *If-Match* header holding the *ETag* of a read of the profile, the update fails with 412 if the profile was changed since.
     """
-    return await service.create_or_update_user_profile_by_admin(profile)
+    revision_id = if_match_revision(request.headers.get("if-match"))
+    return await service.create_or_update_user_profile_by_admin(profile, revision_id)
@@ -11,10 +11,14 @@ from skill_management.schemas.file import SkillCertificateResponse
 from skill_management.schemas.skill import CreateSkillDataRequest, GetSkillDataResponse, \
     GetSkillDataResponseList, CreateSkillListDataResponse, CreateSkillDataAdminRequest, ProfileSkillDetailsResponse, \
     PaginatedSkillResponse, MasterSkillRequest
-from skill_management.services.skill import SkillService
+from skill_management.services.skill import SkillService, PROFILE_SKILL_FIELDS
 from skill_management.utils.auth_manager import JWTBearer, JWTBearerAdmin
+from skill_management.utils.etag import revision_response
 from skill_management.utils.logger import get_logger
 from skill_management.utils.profile_manager import get_profile_email
+from skill_management.utils.query_budget import query_budget
+from skill_management.utils.sparse_fields import SparseFields, sparse_fields, sparse_response
+from skill_management.utils.trusted_response import TrustedResponse
 
 skill_router: APIRouter = APIRouter(tags=["skill"])
 logger = get_logger()
@@ -33,6 +37,7 @@ logger = get_logger()
                            "description": "The skill is successfully created",
                        },
                    })
+@query_budget(8)
 async def create_skill(request: Request,  # type: ignore
                        skill: CreateSkillDataRequest = Body(..., examples={
                            "CREATE": {
@@ -96,6 +101,7 @@ async def create_skill(request: Request,  # type: ignore
                            "description": "The skill is successfully created",
                        },
                    })
+@query_budget(7)
 async def create_skill_by_admin(request: Request,  # type: ignore
                                 skill_request: CreateSkillDataAdminRequest = Body(..., examples={
                                     "CREATE": {
@@ -186,7 +192,7 @@ async def get_skill(request: Request,  # type: ignore
                     skill_id: int = Path(..., description="provide skill id to get skill information"),
                     user_id: str = Depends(JWTBearer()),
                     service: SkillService = Depends()):
-    return await service.get_skill_details(skill_id=skill_id)
+    return TrustedResponse(await service.get_skill_details(skill_id=skill_id))
 
 
 @skill_router.get("/skills",
@@ -207,7 +213,7 @@ async def get_skill_list(request: Request,  # type: ignore
                          user_id: str = Depends(JWTBearer()),
                          service: SkillService = Depends()
                          ):
-    return await service.get_skill_list()
+    return TrustedResponse(await service.get_skill_list())
 
 
 @skill_router.post("/skills",
@@ -315,11 +321,11 @@ async def get_skill_paginated_list(request: Request,  # type: ignore
                                                           alias="page-size"),
                                    admin_user_id: str = Depends(JWTBearerAdmin()),
                                    service: SkillService = Depends()):
-    return await service.get_paginated_skills_by_admin(skill_categories=skill_categories,
-                                                       skill_name=skill_name,
-                                                       skill_types=skill_types,
-                                                       page_size=page_size,
-                                                       page_number=page_number)
+    return TrustedResponse(await service.get_paginated_skills_by_admin(skill_categories=skill_categories,
+                                                                       skill_name=skill_name,
+                                                                       skill_types=skill_types,
+                                                                       page_size=page_size,
+                                                                       page_number=page_number))
 
 
 @skill_router.get("/profile/admin/user-profiles/{profile_id}/skills",
@@ -340,8 +346,12 @@ async def get_profile_skills_by_admin(request: Request,  # type: ignore
                                       profile_id: PydanticObjectId = Path(...,
                                                                           description="input profile id of the user",
                                                                           alias="profile_id"),
+                                      fields: SparseFields | None = Depends(sparse_fields(PROFILE_SKILL_FIELDS)),
                                       service: SkillService = Depends()):
-    return await service.get_skill_details_by_admin(profile_id=profile_id)
+    return await revision_response(
+        request, {"_id": profile_id},
+        lambda: sparse_response(service.get_skill_details_by_admin(profile_id=profile_id, fields=fields),
+                                fields, items="skills"))
 
 
 @skill_router.get("/profile/user-profiles/skills",
@@ -359,6 +369,11 @@ async def get_profile_skills_by_admin(request: Request,  # type: ignore
                   })
 async def get_profile_skills_by_user(request: Request,  # type: ignore
                                      user_id: str = Depends(JWTBearer()),
+                                     fields: SparseFields | None = Depends(sparse_fields(PROFILE_SKILL_FIELDS)),
                                      service: SkillService = Depends()):
     email = await get_profile_email(user_id=user_id, request=request)
-    return await service.get_skill_details_by_user(email=cast(str, email))
+    return await revision_response(
+        request, {"user_id": email},
+        lambda: sparse_response(service.get_skill_details_by_user(email=cast(str, email), fields=fields),
+                                fields, items="skills"),
+        active_only=True)
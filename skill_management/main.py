@@ -1,14 +1,19 @@
-import json
 import os
 
 from fastapi import FastAPI
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
 
-from skill_management.config.config import initiate_database, initiate_redis_pool
+from skill_management.config.config import initiate_database, initiate_redis_pool, close_database, close_redis_pool, \
+    get_pool_stats
 from skill_management.controllers.router import api_router
-from skill_management.utils.logger import get_logger
+from skill_management.utils.compression import CompressionMiddleware
+from skill_management.utils.file_gc import file_gc_scheduler
+from skill_management.utils.initial_data import initialize_database
+from skill_management.utils.logger import get_logger, RequestIdMiddleware, start_log_listener, stop_log_listener
+from skill_management.utils.metrics import MetricsMiddleware, metrics_endpoint, mark_worker_dead
+from skill_management.utils.openapi import mount_openapi
+from skill_management.utils.plan_reminder import plan_reminder_scheduler
+from skill_management.utils.profiling import ProfilingMiddleware, is_profiling_enabled
 
 # API Doc
 if os.getenv("ENVIRONMENT") == "local":
@@ -32,7 +37,14 @@ else:
         debug=True
         # root_path="/api/v1"
     )
-skill_app.add_middleware(GZipMiddleware)
+if is_profiling_enabled():
+    skill_app.add_middleware(ProfilingMiddleware,
+                             interval=float(os.getenv("PROFILING_INTERVAL", default=0.001)),
+                             report_dir=os.getenv("PROFILING_REPORT_DIR") or None)
+skill_app.add_middleware(CompressionMiddleware,
+                         minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", default=1024)),
+                         cache_size=int(os.getenv("COMPRESSION_CACHE_SIZE", default=128)))
+skill_app.add_middleware(MetricsMiddleware, pool_stats=get_pool_stats)
 skill_app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -40,34 +52,41 @@ skill_app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+skill_app.add_middleware(RequestIdMiddleware)
 skill_app.include_router(api_router, prefix='/api/v1')
-
+mount_openapi(skill_app)
+skill_app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 @skill_app.on_event("startup")
 async def start_database() -> None:
+    start_log_listener()
     logger = get_logger()
     logger.info("Initiating database........")
     await initiate_database()
     logger.info("Initiating database completed........")
-    with open('openapi/skill_management/openapi.json', 'w') as f:
-        json.dump(get_openapi(
-            title=skill_app.title,
-            version=skill_app.version,
-            openapi_version=skill_app.openapi_version,
-            description=skill_app.description,
-            routes=skill_app.routes,
-        ), f)
-
-    logger.info("OpenAPI specification created.........")
     logger.info("Connecting to redis.........")
     skill_app.state.redis_connection = await initiate_redis_pool()
     logger.info("Redis Connected.........")
+    if os.getenv("SEED_ON_STARTUP", default="1") == "1":
+        await initialize_database(skill_app.state.redis_connection)
+    if os.getenv("PLAN_REMINDER_ENABLED", default="0") == "1":
+        plan_reminder_scheduler.start(skill_app.state.redis_connection)
+    if os.getenv("FILE_GC_ENABLED", default="0") == "1":
+        file_gc_scheduler.start(skill_app.state.redis_connection)
 
-# @app.on_event("shutdown")
-# async def shutdown_event():
-#     logger.info("Closing Redis...")
-#     await app.state.redis_connection.close()
+
+@skill_app.on_event("shutdown")
+async def shutdown_connections() -> None:
+    logger = get_logger()
+    plan_reminder_scheduler.stop()
+    file_gc_scheduler.stop()
+    logger.info("Closing redis.........")
+    await close_redis_pool()
+    logger.info("Closing database connections........")
+    await close_database()
+    mark_worker_dead()
+    stop_log_listener()
 
 #
 # PORT = 8000
@@ -0,0 +1,9 @@
+from beanie import Document
+
+
+class Counters(Document):
+    id: str  # type: ignore
+    sequence: int = 0
+
+    class Settings:
+        use_revision = False
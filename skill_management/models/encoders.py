@@ -0,0 +1,17 @@
+from datetime import date, datetime, time
+
+
+def date_to_datetime(value: date) -> datetime:
+    """
+    BSON has no date type: dates are stored as native datetimes at midnight UTC, so that range
+    filters, sorts and indexes on them compare dates instead of strings. Beanie also applies the
+    `date` encoder to the datetime subclass, which is kept as it is.
+    """
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time.min)
+
+
+DATE_ENCODERS = {
+    date: date_to_datetime
+}
@@ -2,8 +2,17 @@ from beanie import Document
 from pydantic import BaseModel
 
 
-class EnumInitializer(Document):
-    is_uploaded: bool = False
+class SeedState(Document):
+    """
+    Content hash of each seeded master data collection, keyed by collection name, with the hash of
+    each document as it was last seeded, keyed by its id
+    """
+    id: str  # type: ignore
+    source_hash: str
+    rows: dict[str, str] = {}
+
+    class Settings:
+        use_revision = False
 
 
 class EnumType(BaseModel):
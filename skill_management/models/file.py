@@ -2,6 +2,7 @@ from datetime import datetime
 
 from beanie import Document, PydanticObjectId
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from skill_management.enums import StatusEnum, FileTypeEnum
 
@@ -15,8 +16,15 @@ class Files(Document):
     owner: PydanticObjectId = Field(description="owner of the file")
     skill_id: int|None = Field(None, description="skill id of the file that is a certificate")
     created_at: datetime = Field(description="creation time of the file")
+    deleted_at: datetime | None = Field(None, description="deletion time of the file")
 
     class Settings:
         use_revision = True
         use_state_management = True
         validate_on_save = True
+        indexes = [
+            IndexModel([("created_at", ASCENDING)], name="created_at"),
+            IndexModel([("owner", ASCENDING), ("created_at", DESCENDING)], name="owner_created_at"),
+            IndexModel([("status", ASCENDING), ("deleted_at", ASCENDING)], name="status_deleted_at"),
+            IndexModel([("file_name", ASCENDING)], name="file_name")
+        ]
@@ -1,24 +1,28 @@
-from datetime import datetime, date
+from datetime import date
 from typing import Any
 
 from beanie import Document, Link
 from pydantic import Field, validator
+from pymongo import ASCENDING, IndexModel
 
 from skill_management.enums import PlanTypeEnum, StatusEnum
+from skill_management.models.encoders import DATE_ENCODERS
 from skill_management.models.profile import Profiles
 from skill_management.models.skill import Skills
-from skill_management.schemas.plan import Task
+from skill_management.schemas.plan import Task, PlanSkill
 
 
 class Plans(Document):
     skill: Link[Skills]
     profile: Link[Profiles]
+    skill_snapshot: PlanSkill | None = Field(None, description="copy of the linked skill, kept in sync on write")
     plan_type: PlanTypeEnum = Field(PlanTypeEnum.course, description="the type of the plan")
     notes: str|None = Field(max_length=255, description="notes on the plan")
     start_date: date | None = Field(description="start date of plan")
     end_date: date | None = Field(description="end date of plan")
     task: list[Task]|None
     status: StatusEnum = Field(StatusEnum.active, description="status of skill from fixed list of values")
+    reminded_end_date: date | None = Field(None, description="end date the owner was last reminded of")
 
     @validator("end_date", always=True)
     def validate_end_date(cls, value: date, values: dict[str, Any]) -> date | None:
@@ -32,3 +36,8 @@ class Plans(Document):
         use_revision = True
         use_state_management = True
         validate_on_save = True
+        bson_encoders = DATE_ENCODERS
+        indexes = [
+            IndexModel([("profile.$id", ASCENDING)], name="profile_id"),
+            IndexModel([("status", ASCENDING), ("end_date", ASCENDING), ("_id", ASCENDING)], name="status_end_date")
+        ]
@@ -1,9 +1,9 @@
-from datetime import date
-
 from beanie import Document, Link, Indexed
 from pydantic import EmailStr, Field
+from pymongo import ASCENDING, IndexModel
 
 from skill_management.enums import ProfileStatusEnum
+from skill_management.models.encoders import DATE_ENCODERS
 from skill_management.models.file import Files
 from skill_management.schemas.designation import ProfileDesignation
 from skill_management.schemas.education import ProfileEducation
@@ -21,11 +21,15 @@ class Profiles(Document):
     experiences: list[ProfileExperience]
     educations: list[ProfileEducation]
     cv_files: list[Link[Files]]
+    experiences_sequence: int | None = Field(default=None)
+    educations_sequence: int | None = Field(default=None)
 
     class Settings:
         use_revision = True
         use_state_management = True
         validate_on_save = True
-        bson_encoders = {
-          date: str
-        }
+        bson_encoders = DATE_ENCODERS
+        indexes = [
+            IndexModel([("experiences.start_date", ASCENDING), ("experiences.end_date", ASCENDING)],
+                       name="experience_period")
+        ]
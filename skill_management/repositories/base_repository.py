@@ -1,3 +1,4 @@
+import uuid
 from typing import Optional, Type, Any, Sequence, TypeVar
 
 from beanie import PydanticObjectId, Document
@@ -5,12 +6,22 @@ from beanie.odm.operators.update.array import Push
 from beanie.odm.operators.update.general import Set
 from beanie.odm.queries.find import FindQueryProjectionType, FindMany
 from beanie.odm.queries.update import UpdateMany
+from beanie.odm.utils.encoder import Encoder
 from pydantic import BaseModel, UUID4
+from pymongo import ReturnDocument
 from pymongo.results import DeleteResult
 
 T = TypeVar("T", bound=Document)
 
 
+def to_dotted_fields(prefix: str, values: dict[str, Any]) -> dict[str, Any]:
+    """
+    {"mobile": ...} with prefix "personal_detail" -> {"personal_detail.mobile": ...}, so that a
+    $set only touches the given fields of the subdocument.
+    """
+    return {f"{prefix}.{key}": value for key, value in values.items()}
+
+
 class TableRepository:
     __slots__ = ["entity_collection"]
 
@@ -59,6 +70,15 @@ class TableRepository:
             return None
         return await document_object.delete()
 
+    def with_new_revision(self, item_dict: dict[str, Any] | None) -> dict[str, Any] | None:
+        """
+        Beanie renews the revision on save and replace only, partial updates set a new one themselves
+        for the revision to change with every write.
+        """
+        if not self.entity_collection.get_settings().use_revision:
+            return item_dict
+        return {**(item_dict or {}), "revision_id": uuid.uuid4()}
+
     async def update(self,
                      id_: PydanticObjectId | UUID4 | int | None = None,
                      item_dict: dict[str, Any] | None = None,
@@ -67,6 +87,7 @@ class TableRepository:
         document_object: Document | None = await self.entity_collection.get(PydanticObjectId(id_))  # type: ignore
         if document_object is None:
             return None
+        item_dict = self.with_new_revision(item_dict)
         if push_item is not None and item_dict is not None:
             await document_object.update(Set(item_dict), Push(push_item))
         elif item_dict is None and push_item is not None:
@@ -75,6 +96,85 @@ class TableRepository:
             await document_object.update(Set(item_dict))
         return await self.entity_collection.get(PydanticObjectId(id_))  # type: ignore
 
+    async def update_fields(self,
+                            id_: Any,
+                            set_fields: dict[str, Any] | None = None,
+                            push_item: dict[str, Any] | None = None,
+                            revision_id: UUID4 | None = None) -> Optional[Document]:
+        """
+        Applies $set/$push in one find_one_and_update, without reading the document first, and
+        returns the updated document (None when nothing matched). `set_fields` may use dotted
+        paths so that concurrent updates of different fields do not overwrite each other.
+        With `revision_id` (the stored one, `_previous_revision_id` of a loaded document), the write
+        only happens if it still matches; documents using revisions get a new one on every write,
+        which also fails stale beanie saves.
+        """
+        settings = self.entity_collection.get_settings()
+        encoder = Encoder(custom_encoders=settings.bson_encoders)
+        query: dict[str, Any] = {"_id": id_}
+        if revision_id is not None:
+            query["revision_id"] = encoder.encode(revision_id)
+        update: dict[str, Any] = {}
+        set_fields = dict(set_fields or {})
+        if settings.use_revision and (set_fields or push_item):
+            set_fields["revision_id"] = uuid.uuid4()
+        if set_fields:
+            update["$set"] = encoder.encode(set_fields)
+        if push_item:
+            update["$push"] = encoder.encode(push_item)
+        if not update:
+            raw_document = await self.entity_collection.get_motor_collection().find_one(query)
+        else:
+            raw_document = await self.entity_collection.get_motor_collection().find_one_and_update(
+                query, update, return_document=ReturnDocument.AFTER)
+        if raw_document is None:
+            return None
+        return self.entity_collection.parse_obj(raw_document)
+
+    async def push_with_sequence(self,
+                                 id_: Any,
+                                 field: str,
+                                 item: dict[str, Any],
+                                 id_field: str,
+                                 set_fields: dict[str, Any] | None = None,
+                                 revision_id: UUID4 | None = None) -> Optional[Document]:
+        """
+        Appends `item` to the array `field` with the next value of the `<field>_sequence` counter of
+        the document as its `id_field`, incrementing the counter in the same write (a pipeline
+        find_one_and_update), so ids are allocated without reading the array and never collide under
+        concurrent writes. Documents without the counter yet start from the highest id in the array.
+        `set_fields` are written in the same update. Returns the updated document, or None.
+        `revision_id` makes the write conditional, as in `update_fields`.
+        """
+        settings = self.entity_collection.get_settings()
+        encoder = Encoder(custom_encoders=settings.bson_encoders)
+        sequence_field = f"{field}_sequence"
+        """
+        Values are wrapped in $literal, strings starting with $ would be read as field paths otherwise
+        """
+        element: dict[str, Any] = {key: {"$literal": value} for key, value in encoder.encode(item).items()}
+        element[id_field] = f"${sequence_field}"
+        set_stage: dict[str, Any] = {
+            key: {"$literal": value} for key, value in encoder.encode(dict(set_fields or {})).items()
+        }
+        set_stage[field] = {"$concatArrays": [{"$ifNull": [f"${field}", []]}, [element]]}
+        if settings.use_revision:
+            set_stage["revision_id"] = {"$literal": encoder.encode(uuid.uuid4())}
+        pipeline = [
+            {"$set": {sequence_field: {"$add": [
+                {"$ifNull": [f"${sequence_field}", {"$ifNull": [{"$max": f"${field}.{id_field}"}, 0]}]}, 1
+            ]}}},
+            {"$set": set_stage},
+        ]
+        query: dict[str, Any] = {"_id": id_}
+        if revision_id is not None:
+            query["revision_id"] = encoder.encode(revision_id)
+        raw_document = await self.entity_collection.get_motor_collection().find_one_and_update(
+            query, pipeline, return_document=ReturnDocument.AFTER)
+        if raw_document is None:
+            return None
+        return self.entity_collection.parse_obj(raw_document)
+
     async def update_by_query(self,
                               query: dict[str, Any],
                               item_dict: dict[str, Any] | None = None,
@@ -82,9 +182,11 @@ class TableRepository:
 
         document_object = self.entity_collection.find(query)
 
-        if await document_object.to_list() is None or await document_object.to_list() == []:
+        document = await self.entity_collection.find_one(query)
+        if document is None:
             return None
-        id_ = (await document_object.to_list())[0].id
+        id_ = document.id
+        item_dict = self.with_new_revision(item_dict)
         if push_item is not None and item_dict is not None:
             await document_object.update(Set(item_dict), Push(push_item))
         elif item_dict is None and push_item is not None:
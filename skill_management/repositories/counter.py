@@ -0,0 +1,74 @@
+import asyncio
+import os
+from typing import Type
+
+from beanie import Document
+from pymongo import ReturnDocument
+
+from skill_management.models.counter import Counters
+from skill_management.models.designation import Designations, CustomDesignations
+from skill_management.models.skill import Skills
+from skill_management.repositories.base_repository import TableRepository
+
+
+class CounterRepository(TableRepository):
+    def __init__(self) -> None:
+        super().__init__(entity_collection=Counters)
+
+    async def raise_to(self, name: str, value: int) -> None:
+        """
+        Makes sure the counter is at least `value`, creating it if needed; safe to run concurrently.
+        """
+        await Counters.get_motor_collection().update_one({"_id": name}, {"$max": {"sequence": value}}, upsert=True)
+
+    async def allocate(self, name: str, count: int = 1) -> int:
+        """
+        Reserves `count` ids in one atomic $inc and returns the last of them.
+        """
+        counter = await Counters.get_motor_collection().find_one_and_update(
+            {"_id": name}, {"$inc": {"sequence": count}}, upsert=True, return_document=ReturnDocument.AFTER)
+        return int(counter["sequence"])
+
+
+class IdAllocator:
+    """
+    Integer ids for the documents keyed by `_id: int`, taken from the `counters` collection instead
+    of reading the current max id. With `block_size` > 1 every worker reserves that many ids at once
+    and hands them out from memory, so ids stay unique but are not gapless nor ordered across workers.
+    """
+
+    def __init__(self, entity_collection: Type[Document], block_size: int = 1) -> None:
+        self.entity_collection = entity_collection
+        self.name = entity_collection.__name__
+        self.block_size = max(block_size, 1)
+        self.next_id = 0
+        self.last_id = -1
+        self.is_seeded = False
+        self.lock = asyncio.Lock()
+
+    async def seed(self) -> None:
+        """
+        Documents inserted before the counter existed (e.g. from the csv files) keep their ids.
+        """
+        max_document = await self.entity_collection.get_motor_collection().find_one(
+            {}, projection={"_id": 1}, sort=[("_id", -1)])
+        await CounterRepository().raise_to(self.name, int(max_document["_id"]) if max_document is not None else 0)
+        self.is_seeded = True
+
+    async def next(self) -> int:
+        async with self.lock:
+            if not self.is_seeded:
+                await self.seed()
+            if self.next_id > self.last_id:
+                self.last_id = await CounterRepository().allocate(self.name, self.block_size)
+                self.next_id = self.last_id - self.block_size + 1
+            allocated_id = self.next_id
+            self.next_id += 1
+            return allocated_id
+
+
+ID_BLOCK_SIZE = int(os.getenv("ID_BLOCK_SIZE", default=1))
+
+skill_ids = IdAllocator(Skills, block_size=ID_BLOCK_SIZE)
+designation_ids = IdAllocator(Designations, block_size=ID_BLOCK_SIZE)
+custom_designation_ids = IdAllocator(CustomDesignations, block_size=ID_BLOCK_SIZE)
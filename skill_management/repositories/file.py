@@ -1,3 +1,7 @@
+from datetime import datetime
+
+from beanie import PydanticObjectId
+
 from skill_management.models.file import Files
 from skill_management.repositories.base_repository import TableRepository
 
@@ -5,3 +9,13 @@ from skill_management.repositories.base_repository import TableRepository
 class FileRepository(TableRepository):
     def __init__(self) -> None:
         super().__init__(entity_collection=Files)
+
+    async def get_files_created_since(self, since: datetime,
+                                      owner: PydanticObjectId | None = None) -> list[Files]:
+        """
+        Range on the created_at index, or on the owner_created_at one when an owner is given.
+        """
+        query: dict[str, object] = {"created_at": {"$gte": since}}
+        if owner is not None:
+            query["owner"] = owner
+        return await Files.find(query).sort("-created_at").to_list()
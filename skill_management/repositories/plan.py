@@ -1,7 +1,83 @@
+from datetime import date
+
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from skill_management.enums import StatusEnum
+from skill_management.models.encoders import date_to_datetime
 from skill_management.models.plan import Plans
+from skill_management.models.skill import Skills
 from skill_management.repositories.base_repository import TableRepository
+from skill_management.schemas.plan import PlanSkill
+
+
+def skill_snapshot(skill: Skills) -> PlanSkill:
+    return PlanSkill(skill_id=skill.id, skill_name=skill.skill_name, skill_type=skill.skill_type)
 
 
 class PlanRepository(TableRepository):
     def __init__(self) -> None:
         super().__init__(entity_collection=Plans)
+
+    async def get_profile_plans(self, profile_id: PydanticObjectId) -> list[Plans]:
+        """
+        Plans of the profile through the profile_id index, without resolving the skill and profile links.
+        """
+        return await self.with_skill_snapshots(await Plans.find({"profile.$id": profile_id}).to_list())
+
+    async def with_skill_snapshots(self, plans: list[Plans]) -> list[Plans]:
+        """
+        Plans stored before the skill snapshot existed get it from a single Skills query and keep it;
+        those whose skill was deleted since are left out, as their skill can not be shown.
+        """
+        missing = [plan for plan in plans if plan.skill_snapshot is None]
+        if not missing:
+            return plans
+        skill_ids = {plan.skill.ref.id for plan in missing}
+        skills = {skill.id: skill for skill in await Skills.find({"_id": {"$in": list(skill_ids)}}).to_list()}
+        operations = []
+        for plan in missing:
+            skill = skills.get(plan.skill.ref.id)
+            if skill is None:
+                continue
+            plan.skill_snapshot = skill_snapshot(skill)
+            operations.append(UpdateOne({"_id": plan.id},
+                                        {"$set": {"skill_snapshot": plan.skill_snapshot.dict()}}))
+        if operations:
+            await Plans.get_motor_collection().bulk_write(operations, ordered=False)
+        return [plan for plan in plans if plan.skill_snapshot is not None]
+
+    async def update_skill_snapshots(self, skill: Skills) -> None:
+        await Plans.get_motor_collection().update_many(
+            {"skill_snapshot.skill_id": skill.id},
+            {"$set": {"skill_snapshot": skill_snapshot(skill).dict()}}
+        )
+
+    async def set_reminded(self, plans: list[Plans]) -> None:
+        """
+        Records the stored end date of each plan as the one it was reminded of, in one update with a pipeline.
+        """
+        await Plans.get_motor_collection().update_many({"_id": {"$in": [plan.id for plan in plans]}},
+                                                       [{"$set": {"reminded_end_date": "$end_date"}}])
+
+    async def get_plans_ending_between(self, start_date: date, end_date: date,
+                                       profile_id: PydanticObjectId | None = None,
+                                       not_reminded: bool = False,
+                                       limit: int | None = None) -> list[Plans]:
+        """
+        Active plans whose end date is in [start_date, end_date], soonest first, through the status_end_date
+        index; the links are not resolved, the skill snapshot is enough to show them. With `not_reminded`,
+        only the plans whose owner was not reminded of their current end date yet.
+        """
+        query: dict[str, object] = {
+            "status": StatusEnum.active,
+            "end_date": {"$gte": date_to_datetime(start_date), "$lte": date_to_datetime(end_date)}
+        }
+        if profile_id is not None:
+            query["profile.$id"] = profile_id
+        if not_reminded:
+            query["$expr"] = {"$ne": ["$reminded_end_date", "$end_date"]}
+        query_object = Plans.find(query).sort("end_date", "_id")
+        if limit is not None:
+            query_object = query_object.limit(limit)
+        return await query_object.to_list()
@@ -1,7 +1,93 @@
+import uuid
+from datetime import date
+from typing import Any, Type
+
+from beanie import PydanticObjectId
+from beanie.odm.queries.find import FindQueryProjectionType
+from beanie.odm.utils.encoder import Encoder
+
+from skill_management.enums import FileTypeEnum, StatusEnum
+from skill_management.models.encoders import date_to_datetime
+from skill_management.models.file import Files
+from skill_management.models.plan import Plans
 from skill_management.models.profile import Profiles
 from skill_management.repositories.base_repository import TableRepository
+from skill_management.schemas.profile import ProfileRevisionView
 
 
 class ProfileRepository(TableRepository):
     def __init__(self) -> None:
         super().__init__(entity_collection=Profiles)
+
+    async def get_profiles_with_experience_in(self, start_date: date, end_date: date,
+                                              projection_model: Type[FindQueryProjectionType] | None = None
+                                              ) -> list[Profiles] | list[FindQueryProjectionType]:
+        """
+        Profiles with an experience overlapping [start_date, end_date]: started on or before the end of
+        the period and not ended before its start, an experience without end date being a current one.
+        Served by the experience_period multikey index.
+        """
+        query_object = Profiles.find({
+            "experiences": {
+                "$elemMatch": {
+                    "start_date": {"$lte": date_to_datetime(end_date)},
+                    "$or": [
+                        {"end_date": None},
+                        {"end_date": {"$gte": date_to_datetime(start_date)}}
+                    ]
+                }
+            }
+        })
+        if projection_model is None:
+            return await query_object.to_list()
+        return await query_object.project(projection_model=projection_model).to_list()
+
+    async def get_emails(self, profile_ids: list[PydanticObjectId]) -> dict[PydanticObjectId, str]:
+        """
+        user_id (the email of the user) of each profile, projected from the profiles themselves.
+        """
+        cursor = Profiles.get_motor_collection().find({"_id": {"$in": profile_ids}}, {"user_id": 1})
+        return {document["_id"]: document["user_id"] async for document in cursor}
+
+    async def get_revision(self, query: dict[str, Any]) -> ProfileRevisionView | None:
+        """
+        Revision of the profile matching `query`, read alone by projection.
+        """
+        return await Profiles.find(query, projection_model=ProfileRevisionView).first_or_none()
+
+    async def renew_revision(self, profile_id: PydanticObjectId) -> None:
+        """
+        Gives the profile a new revision for a change of its files, which are shown with it.
+        """
+        encoder = Encoder(custom_encoders=Profiles.get_settings().bson_encoders)
+        await Profiles.get_motor_collection().update_one({"_id": profile_id},
+                                                         {"$set": {"revision_id": encoder.encode(uuid.uuid4())}})
+
+    async def get_full_profile(self, query: dict[str, Any],
+                               statuses: list[StatusEnum]) -> tuple[Profiles, list[Files], list[Plans]] | None:
+        """
+        The profile matching `query` with its active resumes, its certificates and its plans in `statuses`,
+        in one aggregation. Only the files and the plans to show are joined: the files through the owner
+        index, matched with $expr on the profile id given by `let`, and the plans through the profile.$id
+        index, as localField/foreignField, since a field path cannot name $id inside $expr.
+        """
+        pipeline: list[dict[str, Any]] = [
+            {"$match": query},
+            {"$limit": 1},
+            {"$lookup": {"from": Files.get_motor_collection().name, "let": {"profile_id": "$_id"}, "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$owner", "$$profile_id"]}, "$or": [
+                    {"file_type": FileTypeEnum.resume, "status": StatusEnum.active},
+                    {"file_type": FileTypeEnum.certificate, "status": {"$in": statuses}}
+                ]}}
+            ], "as": "files"}},
+            {"$lookup": {"from": Plans.get_motor_collection().name, "localField": "_id",
+                         "foreignField": "profile.$id", "pipeline": [{"$match": {"status": {"$in": statuses}}}],
+                         "as": "plans"}}
+        ]
+        documents = await Profiles.get_motor_collection().aggregate(pipeline).to_list(1)
+        if not documents:
+            return None
+        document = documents[0]
+        files = [Files.parse_obj(file) for file in document.pop("files")]
+        plans = [Plans.parse_obj(plan) for plan in document.pop("plans")]
+        return Profiles.parse_obj(document), files, plans
@@ -1,8 +1,11 @@
+import enum
 from datetime import datetime
 from typing import Any, Optional
 
 from pydantic import BaseModel, root_validator, dataclasses, Field
 
+from skill_management import enums
+
 
 @dataclasses.dataclass
 class EnumData:
@@ -14,6 +17,27 @@ class ResponseEnumData(BaseModel):
     id: int | None = Field(gt=0, description="id is enum value")
     name: str | None = Field(description="name is enum key")
 
+    class Config:
+        allow_mutation = False
+        copy_on_model_validation = 'none'
+
+
+"""
+One shared, immutable ResponseEnumData per member of every enum of skill_management.enums, built at import
+"""
+ENUM_RESPONSE_DATA: dict[type[enum.IntEnum], dict[int, ResponseEnumData]] = {
+    enum_class: {member.value: ResponseEnumData(id=member.value, name=member.name) for member in enum_class}
+    for enum_class in vars(enums).values()
+    if isinstance(enum_class, type) and issubclass(enum_class, enum.IntEnum)
+}
+
+
+def enum_data(enum_class: type[enum.IntEnum], value: int) -> ResponseEnumData:
+    """
+    `value` is the member or its int value as stored in the database.
+    """
+    return ENUM_RESPONSE_DATA[enum_class][int(value)]
+
 
 class DateMixin(BaseModel):
     created_at: datetime = datetime.now()
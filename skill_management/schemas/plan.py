@@ -4,7 +4,7 @@ from typing import Optional, Any
 from beanie import PydanticObjectId
 from pydantic import BaseModel, Field, validator, UUID4, root_validator
 
-from skill_management.enums import PlanTypeEnum, StatusEnum, UserStatusEnum, TaskStatusEnum
+from skill_management.enums import PlanTypeEnum, StatusEnum, UserStatusEnum, TaskStatusEnum, SkillTypeEnum
 from skill_management.schemas.base import ResponseEnumData
 
 
@@ -44,6 +44,12 @@ class Task(BaseModel):
     spend_time: int | None = Field(None, description="spend time of task in hours")
 
 
+class PlanSkill(BaseModel):
+    skill_id: int = Field(description="id of the linked skill")
+    skill_name: str = Field(description="name of the linked skill")
+    skill_type: SkillTypeEnum = Field(description="type of the linked skill")
+
+
 class PlanBase(BaseModel):
     plan_type: PlanTypeEnum | None = Field(None, description='''the type of the plan
     
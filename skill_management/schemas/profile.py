@@ -13,6 +13,7 @@ from skill_management.schemas.designation import DesignationDataResponse, Profil
 from skill_management.schemas.education import ProfileEducationResponse, ProfileEducation
 from skill_management.schemas.experience import ProfileExperienceResponse, ProfileExperience
 from skill_management.schemas.file import FileResponse
+from skill_management.schemas.plan import PlanCreateResponse
 from skill_management.schemas.skill import ProfileSkillDataResponse, ProfileSkillResponse, ProfileSkill
 
 
@@ -280,6 +281,10 @@ class ProfileResponse(BaseModel):
         }
 
 
+class ProfileFullResponse(ProfileResponse):
+    plans: list[PlanCreateResponse] = Field(description="plans of the user")
+
+
 class PaginatedProfileResponse(PaginatedResponse):
     items: list[ProfileBasicResponse] | None
 
@@ -491,3 +496,18 @@ class ProfileProfileDetailsView(BaseModel):
     personal_detail: ProfilePersonalDetails
     user_id: str
     profile_status: ProfileStatusEnum
+
+
+class ProfileRevisionView(BaseModel):
+    id: PydanticObjectId = Field(alias='_id')
+    revision_id: uuid.UUID | None = Field(default=None)
+    profile_status: ProfileStatusEnum
+
+
+class ProfileBasicView(BaseModel):
+    id: PydanticObjectId = Field(alias='_id')
+    user_id: str
+    personal_detail: ProfilePersonalDetails
+    designation: ProfileDesignation
+    skills: list[ProfileSkill]
+    profile_status: ProfileStatusEnum
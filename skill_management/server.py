@@ -0,0 +1,62 @@
+import os
+import shutil
+from typing import Any
+
+import uvicorn
+
+APP = "skill_management.main:skill_app"
+
+
+def get_worker_count() -> int:
+    workers = os.getenv("SERVER_WORKERS")
+    if workers:
+        return int(workers)
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 1
+    return cpu_count * int(os.getenv("SERVER_WORKERS_PER_CORE", default=1))
+
+
+def get_server_options() -> dict[str, Any]:
+    """
+    Uvicorn picks uvloop and httptools on its own ("auto") whenever they are installed,
+    and falls back to asyncio and h11 otherwise.
+    """
+    limit_concurrency = os.getenv("SERVER_LIMIT_CONCURRENCY")
+    limit_max_requests = os.getenv("SERVER_LIMIT_MAX_REQUESTS")
+    return {
+        "host": os.getenv("SERVER_HOST", default="0.0.0.0"),
+        "port": int(os.getenv("SERVER_PORT", default=7004)),
+        "workers": get_worker_count(),
+        "loop": os.getenv("SERVER_LOOP", default="auto"),
+        "http": os.getenv("SERVER_HTTP", default="auto"),
+        "backlog": int(os.getenv("SERVER_BACKLOG", default=2048)),
+        "timeout_keep_alive": int(os.getenv("SERVER_KEEP_ALIVE", default=5)),
+        "limit_concurrency": int(limit_concurrency) if limit_concurrency else None,
+        "limit_max_requests": int(limit_max_requests) if limit_max_requests else None,
+        "log_config": os.getenv("SERVER_LOG_CONFIG", default="skill_management/logging.conf"),
+        "access_log": os.getenv("SERVER_ACCESS_LOG", default="0") == "1",
+        "proxy_headers": True,
+        "forwarded_allow_ips": os.getenv("SERVER_FORWARDED_ALLOW_IPS", default="*"),
+        "server_header": False,
+    }
+
+
+def run() -> None:
+    """
+    SIGTERM/SIGINT are handled by the uvicorn supervisor: every worker stops accepting
+    connections, drains in-flight requests and runs the shutdown handlers before exiting.
+    """
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        """
+        Metrics of the previous run must not leak into the new set of workers
+        """
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir)
+    uvicorn.run(APP, **get_server_options())
+
+
+if __name__ == "__main__":
+    run()
@@ -8,7 +8,7 @@ from skill_management.models.designation import Designations
 from skill_management.models.profile import Profiles
 from skill_management.repositories.designation import DesignationRepository
 from skill_management.repositories.profile import ProfileRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.designation import DesignationCreateRequest, ProfileDesignationResponse, \
     DesignationCreateAdminRequest, DesignationDataResponse, ProfileDesignationDetailsResponse
 from skill_management.schemas.experience import ProfileExperience, ExperienceDesignation
@@ -91,25 +91,11 @@ class DesignationService:
                 )
             )
         else:
-            all_experience_id = [
-                experience.experience_id for experience in
-                cast(list[ProfileExperience], profile_designation_experiences.experiences)
-            ]
-
-            if not all_experience_id:
-                new_experience_id = 1
-
-            else:
-                """
-                Calculate new experience id
-                """
-                new_experience_id = max(all_experience_id) + 1
-
             """
-            Create new experience from the designation id provided
+            Create new experience from the designation id provided, its id is allocated on insert
             """
             new_experience = ProfileExperience(
-                experience_id=new_experience_id,
+                experience_id=1,
                 company_name="iXora Solution Ltd.",
                 designation=ExperienceDesignation(
                     designation=profile_designation_experiences.designation.designation,
@@ -120,17 +106,15 @@ class DesignationService:
                 status=StatusEnum.active
             )
             db_profile = cast(
-                Profiles, await profile_crud_manager.update_by_query(
-                    query={
-                        "_id": profile_designation_experiences.id
-                    },
-                    item_dict={
+                Profiles, await profile_crud_manager.push_with_sequence(
+                    id_=profile_designation_experiences.id,
+                    field="experiences",
+                    item=new_experience.dict(
+                        exclude_unset=True,
+                    ),
+                    id_field="experience_id",
+                    set_fields={
                         "designation": old_designation_data
-                    },
-                    push_item={
-                        "experiences": new_experience.dict(
-                            exclude_unset=True,
-                        )
                     }
                 )
             )
@@ -138,10 +122,7 @@ class DesignationService:
         return ProfileDesignationResponse(
             designation=db_profile.designation.designation,
             designation_id=db_profile.designation.designation_id,
-            designation_status=ResponseEnumData(
-                id=db_profile.designation.designation_status,
-                name=DesignationStatusEnum(db_profile.designation.designation_status).name
-            ),
+            designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status),
             end_date=db_profile.designation.end_date,
             start_date=db_profile.designation.start_date,
         )
@@ -225,25 +206,11 @@ class DesignationService:
                 )
                                   )
             else:
-                all_experience_id = [
-                    experience.experience_id for experience in
-                    cast(list[ProfileExperience], profile_designation_experiences.experiences)
-                ]
-
-                if not all_experience_id:
-                    new_experience_id = 1
-
-                else:
-                    """
-                    Calculate new experience id
-                    """
-                    new_experience_id = max(all_experience_id) + 1
-
                 """
-                Create new experience from the designation id provided
+                Create new experience from the designation id provided, its id is allocated on insert
                 """
                 new_experience = ProfileExperience(
-                    experience_id=new_experience_id,
+                    experience_id=1,
                     company_name="iXora Solution Ltd.",
                     designation=ExperienceDesignation(
                         designation=profile_designation_experiences.designation.designation,
@@ -254,17 +221,15 @@ class DesignationService:
                     status=StatusEnum.active
                 )
                 db_profile = cast(
-                    Profiles, await profile_crud_manager.update_by_query(
-                        query={
-                            "_id": designation_request.profile_id
-                        },
-                        item_dict={
+                    Profiles, await profile_crud_manager.push_with_sequence(
+                        id_=designation_request.profile_id,
+                        field="experiences",
+                        item=new_experience.dict(
+                            exclude_unset=True,
+                        ),
+                        id_field="experience_id",
+                        set_fields={
                             "designation": old_designation_data
-                        },
-                        push_item={
-                            "experiences": new_experience.dict(
-                                exclude_unset=True,
-                            )
                         }
                     )
                 )
@@ -315,10 +280,7 @@ class DesignationService:
         return ProfileDesignationResponse(
             designation=db_profile.designation.designation,
             designation_id=db_profile.designation.designation_id,
-            designation_status=ResponseEnumData(
-                id=db_profile.designation.designation_status,
-                name=DesignationStatusEnum(db_profile.designation.designation_status).name
-            ),
+            designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status),
             end_date=db_profile.designation.end_date,
             start_date=db_profile.designation.start_date,
         )
@@ -336,7 +298,7 @@ class DesignationService:
 
         designation_crud_manager = DesignationRepository()
         designation_list = cast(list[Designations], await designation_crud_manager.gets(query))
-        response = [DesignationDataResponse(designation_id=data.id,
+        response = [DesignationDataResponse.construct(designation_id=data.id,
                                             designation=data.designation) for data in designation_list]
         return response
 
@@ -356,16 +318,13 @@ class DesignationService:
         if db_profiles is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Must provide a valid profile id")
-        return ProfileDesignationDetailsResponse(
-            designation=ProfileDesignationResponse(
+        return ProfileDesignationDetailsResponse.construct(
+            designation=ProfileDesignationResponse.construct(
                 designation_id=db_profiles.designation.designation_id,
                 designation=db_profiles.designation.designation,
                 start_date=db_profiles.designation.start_date,
                 end_date=db_profiles.designation.end_date,
-                designation_status=ResponseEnumData(
-                    id=db_profiles.designation.designation_status,
-                    name=DesignationStatusEnum(db_profiles.designation.designation_status).name
-                )
+                designation_status=enum_data(DesignationStatusEnum, db_profiles.designation.designation_status)
             )
         )
 
@@ -389,15 +348,12 @@ class DesignationService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Must be an active profile"
             )
-        return ProfileDesignationDetailsResponse(
-            designation=ProfileDesignationResponse(
+        return ProfileDesignationDetailsResponse.construct(
+            designation=ProfileDesignationResponse.construct(
                 designation_id=db_profiles.designation.designation_id,
                 designation=db_profiles.designation.designation,
                 start_date=db_profiles.designation.start_date,
                 end_date=db_profiles.designation.end_date,
-                designation_status=ResponseEnumData(
-                    id=db_profiles.designation.designation_status,
-                    name=DesignationStatusEnum(db_profiles.designation.designation_status).name
-                )
+                designation_status=enum_data(DesignationStatusEnum, db_profiles.designation.designation_status)
             )
         )
@@ -7,10 +7,10 @@ from fastapi import HTTPException, status
 from skill_management.enums import StatusEnum, ProfileStatusEnum
 from skill_management.models.profile import Profiles
 from skill_management.repositories.profile import ProfileRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.education import EducationCreateRequest, EducationCreateResponse, ProfileEducation, \
     EducationListDataResponse, EducationCreateAdminRequest, ProfileEducationResponse, ProfileEducationDetailsResponse
-from skill_management.schemas.profile import ProfileEducationView
+from skill_management.schemas.profile import ProfileEducationView, ProfileView
 
 
 class EducationService:
@@ -115,10 +115,7 @@ class EducationService:
                     school_name=education.school_name,
                     passing_year=education.passing_year,
                     grade=education.grade,
-                    status=ResponseEnumData(
-                        id=education.status,
-                        name=StatusEnum(education.status).name
-                    ),
+                    status=enum_data(StatusEnum, education.status),
                 )
                 for education in db_profile.educations if education.status == StatusEnum.active
             ]
@@ -129,12 +126,12 @@ class EducationService:
                                         email: str) -> EducationListDataResponse:
         profile_crud_manager = ProfileRepository()
         profile_educations = cast(
-            ProfileEducationView,
+            ProfileView,
             await profile_crud_manager.get_by_query(
                 query={
                     "user_id": email
                 },
-                projection_model=ProfileEducationView
+                projection_model=ProfileView
             )
         )
         if profile_educations is None:
@@ -148,19 +145,11 @@ class EducationService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You can only update education for profile that is active.")
 
-        all_education_ids: list[int] = [
-            education.education_id for education in profile_educations.educations
-        ]
-        if not all_education_ids:
-            new_education_id = 1
-
-        else:
-            """
-            Calculate new experience id
-            """
-            new_education_id = max(all_education_ids) + 1
+        """
+        The education id is allocated on insert, from the counter of the profile
+        """
         new_education = ProfileEducation(
-            education_id=new_education_id,
+            education_id=1,
             degree_name=education_request.degree_name,
             grade=education_request.grade,
             passing_year=education_request.passing_year,
@@ -168,13 +157,11 @@ class EducationService:
             status=cast(StatusEnum,
                         education_request.status) if education_request.status is not None else StatusEnum.active
         )
-        db_profile: Profiles = cast(Profiles, await profile_crud_manager.update_by_query(
-            query={
-                "_id": profile_educations.id
-            },
-            push_item={
-                "educations": new_education.dict()
-            }
+        db_profile: Profiles = cast(Profiles, await profile_crud_manager.push_with_sequence(
+            id_=profile_educations.id,
+            field="educations",
+            item=new_education.dict(),
+            id_field="education_id"
         )
                                     )
         return EducationListDataResponse(
@@ -185,10 +172,7 @@ class EducationService:
                     school_name=education.school_name,
                     passing_year=education.passing_year,
                     grade=education.grade,
-                    status=ResponseEnumData(
-                        id=education.status,
-                        name=StatusEnum(education.status).name
-                    )
+                    status=enum_data(StatusEnum, education.status)
                 )
                 for education in db_profile.educations if education.status == StatusEnum.active
             ]
@@ -270,8 +254,7 @@ class EducationService:
                     school_name=education.school_name,
                     passing_year=education.passing_year,
                     grade=education.grade,
-                    status=ResponseEnumData(id=education.status,
-                                            name=StatusEnum(education.status).name),
+                    status=enum_data(StatusEnum, education.status),
                 )
                 for education in db_profile.educations if education.status in [StatusEnum.active, StatusEnum.cancel]
             ]
@@ -281,12 +264,12 @@ class EducationService:
     async def _create_education_by_admin(education_request: EducationCreateAdminRequest) -> EducationListDataResponse:
         profile_crud_manager = ProfileRepository()
         profile_educations = cast(
-            ProfileEducationView,
+            ProfileView,
             await profile_crud_manager.get_by_query(
                 query={
                     "_id": education_request.profile_id
                 },
-                projection_model=ProfileEducationView
+                projection_model=ProfileView
             )
         )
         if profile_educations is None:
@@ -300,32 +283,22 @@ class EducationService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You can only update education for profile that is active.")
 
-        all_education_ids = [
-            education.education_id for education in profile_educations.educations
-        ]
-        if not all_education_ids:
-            new_education_id = 1
-
-        else:
-            """
-            Calculate new experience id
-            """
-            new_education_id = max(all_education_ids) + 1
+        """
+        The education id is allocated on insert, from the counter of the profile
+        """
         new_education = ProfileEducation(
-            education_id=new_education_id,
+            education_id=1,
             degree_name=education_request.degree_name,
             grade=education_request.grade,
             passing_year=education_request.passing_year,
             school_name=education_request.school_name,
             status=education_request.status if education_request.status is not None else StatusEnum.active
         )
-        db_profile: Profiles = cast(Profiles, await profile_crud_manager.update_by_query(
-            query={
-                "_id": profile_educations.id
-            },
-            push_item={
-                "educations": new_education.dict()
-            }
+        db_profile: Profiles = cast(Profiles, await profile_crud_manager.push_with_sequence(
+            id_=profile_educations.id,
+            field="educations",
+            item=new_education.dict(),
+            id_field="education_id"
         )
                                     )
         return EducationListDataResponse(
@@ -336,8 +309,7 @@ class EducationService:
                     school_name=education.school_name,
                     passing_year=education.passing_year,
                     grade=education.grade,
-                    status=ResponseEnumData(id=education.status,
-                                            name=StatusEnum(education.status).name),
+                    status=enum_data(StatusEnum, education.status),
                 )
                 for education in db_profile.educations if education.status in [StatusEnum.active, StatusEnum.cancel]
             ]
@@ -356,18 +328,15 @@ class EducationService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Must provide a valid profile id")
 
-        return ProfileEducationDetailsResponse(
+        return ProfileEducationDetailsResponse.construct(
             educations=[
-                ProfileEducationResponse(
+                ProfileEducationResponse.construct(
                     degree_name=data.degree_name,
                     school_name=data.school_name,
                     passing_year=data.passing_year,
                     grade=data.grade,
                     education_id=data.education_id,
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    )
+                    status=enum_data(StatusEnum, data.status)
                 ) for data in db_profiles.educations if data.status in [StatusEnum.active, StatusEnum.cancel]]
         )
 
@@ -391,18 +360,15 @@ class EducationService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Must be an active profile"
             )
-        return ProfileEducationDetailsResponse(
+        return ProfileEducationDetailsResponse.construct(
             educations=[
-                ProfileEducationResponse(
+                ProfileEducationResponse.construct(
                     degree_name=data.degree_name,
                     school_name=data.school_name,
                     passing_year=data.passing_year,
                     grade=data.grade,
                     education_id=data.education_id,
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    )
+                    status=enum_data(StatusEnum, data.status)
                 ) for data in db_profiles.educations if data.status == StatusEnum.active
             ]
         )
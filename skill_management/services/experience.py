@@ -8,12 +8,22 @@ from skill_management.enums import StatusEnum, ProfileStatusEnum, DesignationSta
 from skill_management.models.designation import Designations
 from skill_management.models.profile import Profiles
 from skill_management.repositories.profile import ProfileRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.designation import DesignationDataResponse, ProfileDesignation
 from skill_management.schemas.experience import ExperienceCreateRequest, ExperienceListDataResponse, \
     ExperienceCreateAdminRequest, ExperienceCreateResponse, ProfileExperienceDesignationResponse, ProfileExperience, \
     ExperienceDesignation, ProfileExperienceDetailsResponse, ProfileExperienceResponse
-from skill_management.schemas.profile import ProfileExperienceView, ProfileDesignationExperiencesView
+from skill_management.schemas.profile import ProfileExperienceView, ProfileDesignationExperiencesView, ProfileView
+from skill_management.utils.sparse_fields import DocumentFields, SparseFields, sparse_construct, sparse_view
+
+"""
+Fields of the experiences of a profile selectable with `fields=`, with the view fields they are read from
+"""
+PROFILE_EXPERIENCE_FIELDS: dict[str, DocumentFields] = {
+    name: {"experiences": {name}}
+    for name in ["experience_id", "company_name", "job_responsibility", "designation", "start_date", "end_date",
+                 "status"]
+}
 
 
 class ExperienceService:
@@ -159,8 +169,7 @@ class ExperienceService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(id=experience.status,
-                                            name=StatusEnum(experience.status).name)
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences if experience.status == StatusEnum.active
             ]
@@ -171,12 +180,12 @@ class ExperienceService:
                                          email: str) -> ExperienceListDataResponse:
         profile_crud_manager = ProfileRepository()
         profile_experiences = cast(
-            ProfileExperienceView,
+            ProfileView,
             await profile_crud_manager.get_by_query(
                 query={
                     "user_id": email
                 },
-                projection_model=ProfileExperienceView
+                projection_model=ProfileView
             )
         )
         if profile_experiences is None:
@@ -190,19 +199,11 @@ class ExperienceService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You can only update education for profile that is active.")
 
-        all_experience_ids = [
-            experience.experience_id for experience in profile_experiences.experiences
-        ]
-        if not all_experience_ids:
-            new_experience_id = 1
-
-        else:
-            """
-            Calculate new experience id
-            """
-            new_experience_id = max(all_experience_ids) + 1
+        """
+        The experience id is allocated on insert, from the counter of the profile
+        """
         new_experience = ProfileExperience(
-            experience_id=new_experience_id,
+            experience_id=1,
             company_name=cast(str, experience_request.company_name),
             designation=ExperienceDesignation(
                 designation=experience_request.designation,
@@ -214,13 +215,11 @@ class ExperienceService:
             status=cast(StatusEnum,
                         experience_request.status) if experience_request.status is not None else StatusEnum.active
         )
-        db_profile: Profiles = cast(Profiles, await profile_crud_manager.update_by_query(
-            query={
-                "_id": profile_experiences.id
-            },
-            push_item={
-                "experiences": new_experience.dict()
-            }
+        db_profile: Profiles = cast(Profiles, await profile_crud_manager.push_with_sequence(
+            id_=profile_experiences.id,
+            field="experiences",
+            item=new_experience.dict(),
+            id_field="experience_id"
         )
                                     )
         return ExperienceListDataResponse(
@@ -235,10 +234,7 @@ class ExperienceService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(
-                        id=experience.status,
-                        name=StatusEnum(experience.status).name
-                    )
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences if experience.status == StatusEnum.active
             ]
@@ -359,8 +355,7 @@ class ExperienceService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(id=experience.status,
-                                            name=StatusEnum(experience.status).name)
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences if experience.status in [StatusEnum.active, StatusEnum.cancel]
             ]
@@ -371,12 +366,12 @@ class ExperienceService:
             experience_request: ExperienceCreateAdminRequest) -> ExperienceListDataResponse:
         profile_crud_manager = ProfileRepository()
         profile_experiences = cast(
-            ProfileExperienceView,
+            ProfileView,
             await profile_crud_manager.get_by_query(
                 query={
                     "_id": experience_request.profile_id
                 },
-                projection_model=ProfileExperienceView
+                projection_model=ProfileView
             )
         )
         if profile_experiences is None:
@@ -390,19 +385,11 @@ class ExperienceService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You can only update education for profile that is active.")
 
-        all_experience_ids = [
-            experience.experience_id for experience in profile_experiences.experiences
-        ]
-        if not all_experience_ids:
-            new_experience_id = 1
-
-        else:
-            """
-            Calculate new experience id
-            """
-            new_experience_id = max(all_experience_ids) + 1
+        """
+        The experience id is allocated on insert, from the counter of the profile
+        """
         new_experience = ProfileExperience(
-            experience_id=new_experience_id,
+            experience_id=1,
             company_name=cast(str, experience_request.company_name),
             designation=ExperienceDesignation(
                 designation=experience_request.designation,
@@ -414,13 +401,11 @@ class ExperienceService:
             status=cast(StatusEnum,
                         experience_request.status) if experience_request.status is not None else StatusEnum.active,
         )
-        db_profile: Profiles = cast(Profiles, await profile_crud_manager.update_by_query(
-            query={
-                "_id": profile_experiences.id
-            },
-            push_item={
-                "experiences": new_experience.dict()
-            }
+        db_profile: Profiles = cast(Profiles, await profile_crud_manager.push_with_sequence(
+            id_=profile_experiences.id,
+            field="experiences",
+            item=new_experience.dict(),
+            id_field="experience_id"
         )
                                     )
         return ExperienceListDataResponse(
@@ -435,54 +420,65 @@ class ExperienceService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(id=experience.status,
-                                            name=StatusEnum(experience.status).name)
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences if experience.status in [StatusEnum.active, StatusEnum.cancel]
             ]
         )
 
     @staticmethod
-    async def get_experiences_details_by_admin(profile_id: PydanticObjectId) -> ProfileExperienceDetailsResponse:
+    async def get_experiences_details_by_admin(profile_id: PydanticObjectId,
+                                               fields: SparseFields | None = None) -> ProfileExperienceDetailsResponse:
         query = {
             '_id': profile_id,
         }
+        view: type[ProfileExperienceView] = ProfileExperienceView
+        if fields is not None:
+            view = sparse_view(
+                ProfileExperienceView,
+                fields.document_fields(PROFILE_EXPERIENCE_FIELDS, {"id": None, "experiences": {"status"}}))
         db_profiles: ProfileExperienceView = cast(ProfileExperienceView, await Profiles.find(
             query,
-            projection_model=ProfileExperienceView
+            projection_model=view
         ).first_or_none())
         if db_profiles is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Must provide a valid profile id")
 
-        return ProfileExperienceDetailsResponse(
+        return ProfileExperienceDetailsResponse.construct(
             experiences=[
-                ProfileExperienceResponse(experience_id=data.experience_id,
-                                          company_name=data.company_name,
-                                          job_responsibility=data.job_responsibility,
-                                          designation=ProfileExperienceDesignationResponse(
-                                              designation=data.designation.designation,
-                                              designation_id=data.designation.designation_id),
-                                          start_date=data.start_date,
-                                          end_date=data.end_date,
-                                          status=ResponseEnumData(
-                                              id=data.status,
-                                              name=StatusEnum(data.status).name)
-                                          )
+                sparse_construct(ProfileExperienceResponse, fields,
+                                 experience_id=lambda: data.experience_id,
+                                 company_name=lambda: data.company_name,
+                                 job_responsibility=lambda: data.job_responsibility,
+                                 designation=lambda: ProfileExperienceDesignationResponse.construct(
+                                     designation=data.designation.designation,
+                                     designation_id=data.designation.designation_id),
+                                 start_date=lambda: data.start_date,
+                                 end_date=lambda: data.end_date,
+                                 status=lambda: enum_data(StatusEnum, data.status)
+                                 )
                 for data in db_profiles.experiences if
                 data.status in [StatusEnum.active, StatusEnum.cancel]
             ]
         )
 
     @staticmethod
-    async def get_experiences_details_by_user(email: str) -> ProfileExperienceDetailsResponse:
+    async def get_experiences_details_by_user(email: str,
+                                              fields: SparseFields | None = None) -> ProfileExperienceDetailsResponse:
         query = {
             'user_id': email,
         }
+        view: type[ProfileExperienceView] = ProfileExperienceView
+        if fields is not None:
+            view = sparse_view(
+                ProfileExperienceView,
+                fields.document_fields(PROFILE_EXPERIENCE_FIELDS,
+                                       {"id": None, "experiences": {"status"}, "profile_status": None}))
         db_profiles: ProfileExperienceView = cast(
             ProfileExperienceView, await Profiles.find(
                 query,
-                projection_model=ProfileExperienceView
+                projection_model=view
             ).first_or_none())
         if db_profiles is None:
             raise HTTPException(
@@ -494,19 +490,19 @@ class ExperienceService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Must be an active profile"
             )
-        return ProfileExperienceDetailsResponse(
+        return ProfileExperienceDetailsResponse.construct(
             experiences=[
-                ProfileExperienceResponse(experience_id=data.experience_id,
-                                          company_name=data.company_name,
-                                          job_responsibility=data.job_responsibility,
-                                          designation=ProfileExperienceDesignationResponse(
-                                              designation=data.designation.designation,
-                                              designation_id=data.designation.designation_id),
-                                          start_date=data.start_date,
-                                          end_date=data.end_date,
-                                          status=ResponseEnumData(
-                                              id=data.status,
-                                              name=StatusEnum(data.status).name)
-                                          ) for data in db_profiles.experiences if data.status == StatusEnum.active
+                sparse_construct(ProfileExperienceResponse, fields,
+                                 experience_id=lambda: data.experience_id,
+                                 company_name=lambda: data.company_name,
+                                 job_responsibility=lambda: data.job_responsibility,
+                                 designation=lambda: ProfileExperienceDesignationResponse.construct(
+                                     designation=data.designation.designation,
+                                     designation_id=data.designation.designation_id),
+                                 start_date=lambda: data.start_date,
+                                 end_date=lambda: data.end_date,
+                                 status=lambda: enum_data(StatusEnum, data.status)
+                                 )
+                for data in db_profiles.experiences if data.status == StatusEnum.active
             ]
         )
@@ -1,10 +1,11 @@
 import os
 from datetime import datetime, timezone
 from typing import cast
+from urllib.parse import quote
 
 from beanie import PydanticObjectId
 from fastapi import UploadFile, status, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import ValidationError
 from starlette.requests import Request
 
@@ -12,7 +13,7 @@ from skill_management.enums import UserStatusEnum, FileTypeEnum, StatusEnum
 from skill_management.models.file import Files
 from skill_management.repositories.file import FileRepository
 from skill_management.repositories.profile import ProfileRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.file import FileUploadResponse
 from skill_management.schemas.profile import ProfileView
 from skill_management.utils.file_name_search import next_file_name
@@ -130,31 +131,32 @@ class FileService:
                          file_type=file_type,
                          file_size=file_size / 1000,
                          skill_id=skill_id,
-                         created_at=cast(datetime, datetime.now(timezone.utc).isoformat()))
+                         created_at=datetime.now(timezone.utc))
             if file_type == FileTypeEnum.picture:
                 file_crud_manager = FileRepository()
                 changed_response = cast(
                     Files, await file_crud_manager.update_by_query(
                         query={
                             "owner": owner,
-                            "file_type": FileTypeEnum.picture
+                            "file_type": FileTypeEnum.picture,
+                            "status": StatusEnum.active
                         }, item_dict={
-                            "status": UserStatusEnum.delete
+                            "status": StatusEnum.delete,
+                            "deleted_at": datetime.now(timezone.utc)
                         }
                     )
                 )
             await file.insert()
+            await ProfileRepository().renew_revision(owner)
         except ValidationError as valid_exec:
             os.remove(location + file_name)
             return None
         try:
             response = FileUploadResponse(file_id=cast(PydanticObjectId, file.id),
                                           file_name=file.file_name,
-                                          file_type=ResponseEnumData(id=file.file_type,
-                                                                     name=FileTypeEnum(file.file_type).name),
+                                          file_type=enum_data(FileTypeEnum, file.file_type),
                                           file_size=str(file.file_size) + "KB",
-                                          status=ResponseEnumData(id=file.status,
-                                                                  name=StatusEnum(file.status).name),
+                                          status=enum_data(StatusEnum, file.status),
                                           file_response_url="/profile/files/response/" + str(file.id),
                                           admin_file_response_url="/admin/files/response/" + str(file.id))
         except ValidationError as valid_exec:
@@ -162,7 +164,7 @@ class FileService:
         return response
 
     @staticmethod
-    async def get_file_response_by_user(file_id: PydanticObjectId, email: str) -> FileResponse:
+    async def get_file_response_by_user(file_id: PydanticObjectId, email: str) -> Response:
         profile_crud_manager = ProfileRepository()
         profile: ProfileView | None = cast(
             ProfileView | None, await profile_crud_manager.get_by_query(
@@ -178,7 +180,7 @@ class FileService:
         file: Files | None = await Files.find(
             {
                 "_id": file_id,
-                "status": UserStatusEnum.active
+                "status": StatusEnum.active
             }
         ).first_or_none()
         if file is None:
@@ -186,19 +188,14 @@ class FileService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found"
             )
-        # headers = {'Content-Disposition': 'attachment; filename=%s' % file.file_name}
-        if not file.file_type == FileTypeEnum.picture:
-            headers = {'Content-Disposition': 'attachment; filename=%s' % file.file_name}
-            return FileResponse(path=file.location + file.file_name, headers=headers)
-        else:
-            return FileResponse(path=file.location + file.file_name)
+        return FileService._get_file_response(file, as_attachment=not file.file_type == FileTypeEnum.picture)
 
     @staticmethod
-    async def get_file_response_by_admin(file_id: PydanticObjectId) -> FileResponse:
+    async def get_file_response_by_admin(file_id: PydanticObjectId) -> Response:
         file: Files | None = await Files.find(
             {
                 "_id": file_id,
-                "status": UserStatusEnum.active
+                "status": StatusEnum.active
             }
         ).first_or_none()
         if file is None:
@@ -206,19 +203,14 @@ class FileService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found"
             )
-        # headers = {'Content-Disposition': 'attachment; filename=%s' % file.file_name}
-        if not file.file_type == FileTypeEnum.picture:
-            headers = {'Content-Disposition': 'attachment; filename=%s' % file.file_name}
-            return FileResponse(path=file.location + file.file_name, headers=headers)
-        else:
-            return FileResponse(path=file.location + file.file_name)
+        return FileService._get_file_response(file, as_attachment=not file.file_type == FileTypeEnum.picture)
 
     @staticmethod
     async def delete_file_by_admin(file_id: PydanticObjectId) -> None:
         file_crud_manager = FileRepository()
         file: Files = cast(Files, await file_crud_manager.get_by_query(query={
             "_id": file_id,
-            "status": UserStatusEnum.active
+            "status": StatusEnum.active
         }))
         if file is None:
             raise HTTPException(
@@ -227,13 +219,15 @@ class FileService:
             )
         changed_response = cast(Files, await file_crud_manager.update_by_query(query={
             "_id": file_id
-        }, item_dict={"status": UserStatusEnum.delete}))
+        }, item_dict={"status": StatusEnum.delete,
+                      "deleted_at": datetime.now(timezone.utc)}))
         if changed_response is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File not deleted"
             )
-        if not changed_response.status == UserStatusEnum.delete:
+        await ProfileRepository().renew_revision(file.owner)
+        if not changed_response.status == StatusEnum.delete:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File not deleted")
@@ -257,7 +251,7 @@ class FileService:
 
         file: Files = cast(Files, await file_crud_manager.get_by_query(query={
             "_id": file_id,
-            "status": UserStatusEnum.active,
+            "status": StatusEnum.active,
             "owner": profile.id
         }))
         if file is None:
@@ -267,13 +261,15 @@ class FileService:
             )
         changed_response = cast(Files, await file_crud_manager.update_by_query(query={
             "_id": file_id
-        }, item_dict={"status": UserStatusEnum.delete}))
+        }, item_dict={"status": StatusEnum.delete,
+                      "deleted_at": datetime.now(timezone.utc)}))
         if changed_response is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File not deleted"
             )
-        if not changed_response.status == UserStatusEnum.delete:
+        await ProfileRepository().renew_revision(file.owner)
+        if not changed_response.status == StatusEnum.delete:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File not deleted")
@@ -283,12 +279,12 @@ class FileService:
                 detail="File deleted")
 
     @staticmethod
-    async def get_profile_picture_response(profile_id: PydanticObjectId, request: Request) -> FileResponse:
+    async def get_profile_picture_response(profile_id: PydanticObjectId, request: Request) -> Response:
         file_crud_manager = FileRepository()
 
         file: Files | None = await file_crud_manager.get_by_query(query={
             "owner": profile_id,
-            "status": UserStatusEnum.active,
+            "status": StatusEnum.active,
             "file_type": FileTypeEnum.picture
         })
         if file is None:
@@ -297,7 +293,18 @@ class FileService:
                 detail="Profile picture not found"
             )
         else:
-        # headers = {'Content-Disposition': 'attachment; filename=%s' % file.file_name}
-            return FileResponse(path=file.location + file.file_name,
-                            # headers=headers
-                            )
+            return FileService._get_file_response(file, as_attachment=False)
+
+    @staticmethod
+    def _get_file_response(file: Files, as_attachment: bool) -> Response:
+        headers: dict[str, str] = {}
+        if as_attachment:
+            headers['Content-Disposition'] = 'attachment; filename=%s' % file.file_name
+        if os.getenv("FILE_ACCEL_REDIRECT") == "1":
+            """
+            Only authorize here and let nginx serve the bytes from its internal upload location
+            """
+            headers['X-Accel-Redirect'] = os.getenv("FILE_ACCEL_REDIRECT_LOCATION",
+                                                    default="/internal/files/") + quote(file.file_name)
+            return Response(headers=headers)
+        return FileResponse(path=file.location + file.file_name, headers=headers)
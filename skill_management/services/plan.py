@@ -1,6 +1,7 @@
 from typing import cast, Iterable, Any
 
 from beanie import PydanticObjectId, Link
+from bson import DBRef
 from fastapi import HTTPException, status
 from pymongo.errors import DuplicateKeyError
 
@@ -8,12 +9,12 @@ from skill_management.enums import PlanTypeEnum, StatusEnum, SkillTypeEnum, Task
 from skill_management.models.plan import Plans
 from skill_management.models.profile import Profiles
 from skill_management.models.skill import Skills
-from skill_management.repositories.plan import PlanRepository
+from skill_management.repositories.plan import PlanRepository, skill_snapshot
 from skill_management.repositories.profile import ProfileRepository
 from skill_management.repositories.skill import SkillRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.plan import PlanCreateRequest, PlanCreateResponse, Task, TaskResponse, \
-    PlanCreateAdminRequest, PlanListDataResponse, TaskCreate
+    PlanCreateAdminRequest, PlanListDataResponse, TaskCreate, PlanSkill
 from skill_management.schemas.profile import ProfileView
 
 
@@ -103,7 +104,11 @@ class PlanService:
                     )
         item_dict = plan_request.dict(exclude_unset=True, exclude_none=True)
         item_dict.pop("plan_id")
+        item_dict.pop("skill_id", None)
         item_dict["task"] = tasks
+        if plan_request.skill_id is not None:
+            item_dict["skill"] = DBRef(Skills.get_collection_name(), skill.id)
+            item_dict["skill_snapshot"] = skill_snapshot(skill)
 
         cast(
             Plans, await plan_crud_manager.update_by_query(
@@ -115,40 +120,27 @@ class PlanService:
         )
         # plan_type = cast(PlanTypeEnum | None, db_plan.plan_type)
 
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == old_profile.id,
-            fetch_links=True
-        ).to_list()
+        db_plans = await plan_crud_manager.get_profile_plans(cast(PydanticObjectId, old_profile.id))
 
         plan_response = PlanListDataResponse(
             plans=[
                 PlanCreateResponse(
                     id=str(db_plan.id),
-                    plan_type=ResponseEnumData(
-                        id=db_plan.plan_type,
-                        name=PlanTypeEnum(db_plan.plan_type).name
-                    ),
+                    plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                     notes=db_plan.notes,
-                    skill_id=cast(Skills, db_plan.skill).id,
-                    skill_name=cast(Skills, db_plan.skill).skill_name,
-                    skill_type=ResponseEnumData(
-                        id=cast(Skills, db_plan.skill).skill_type,
-                        name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name
-                    ),
+                    skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
+                    skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                    skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type),
                     task=[
                         TaskResponse(
                             id=data.id,
                             description=data.description,
-                            status=ResponseEnumData(
-                                id=data.status,
-                                name=StatusEnum(data.status).name
-                            )
+                            status=enum_data(StatusEnum, data.status)
                         ) for data in cast(list[Task], db_plan.task)
                     ],
                     start_date=db_plan.start_date,
                     end_date=db_plan.end_date,
-                    status=ResponseEnumData(id=db_plan.status,
-                                            name=StatusEnum(db_plan.status).name)
+                    status=enum_data(StatusEnum, db_plan.status)
                 ) for db_plan in db_plans]
         )
         return plan_response
@@ -166,7 +158,7 @@ class PlanService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You are not allowed to update the user profile")
         skill_crud_manager = SkillRepository()
-        skill = await skill_crud_manager.get_by_query({"_id": plan_request.skill_id})
+        skill = cast(Skills | None, await skill_crud_manager.get_by_query({"_id": plan_request.skill_id}))
         plan = Plans(
             profile=cast(Link[Profiles], profile_plans),
             plan_type=cast(PlanTypeEnum, plan_request.plan_type),
@@ -174,6 +166,7 @@ class PlanService:
             start_date=plan_request.start_date,
             end_date=plan_request.end_date,
             skill=cast(Link[Skills], skill),
+            skill_snapshot=skill_snapshot(skill) if skill is not None else None,
             status=cast(StatusEnum, plan_request.status),
             task=[
                 Task(
@@ -193,35 +186,28 @@ class PlanService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Duplicate Value is not allowed. " + ", ".join(
                                     duplicate_values) + " already exists")
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == profile_plans.id,
-            fetch_links=True).to_list()
+        db_plans = await plan_crud_manager.get_profile_plans(cast(PydanticObjectId, profile_plans.id))
         plan_response = PlanListDataResponse(
             plans=[
                 PlanCreateResponse(
                     id=db_plan.id,
-                    plan_type=ResponseEnumData(id=db_plan.plan_type, name=PlanTypeEnum(db_plan.plan_type).name),
+                    plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                     notes=db_plan.notes,
-                    skill_id=cast(Skills, db_plan.skill).id,
+                    skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
                     task=[
                         TaskResponse(
                             id=data.id,
                             description=data.description,
-                            status=ResponseEnumData(
-                                id=data.status,
-                                name=StatusEnum(data.status).name
-                            ),
+                            status=enum_data(StatusEnum, data.status),
                             spend_time=data.spend_time,
                             duration=data.duration
                         ) for data in cast(list[Task], db_plan.task)
                     ],
                     start_date=db_plan.start_date,
                     end_date=db_plan.end_date,
-                    status=ResponseEnumData(id=db_plan.status,
-                                            name=StatusEnum(db_plan.status).name),
-                    skill_name=cast(Skills, db_plan.skill).skill_name,
-                    skill_type=ResponseEnumData(id=cast(Skills, db_plan.skill).skill_type,
-                                                name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name)
+                    status=enum_data(StatusEnum, db_plan.status),
+                    skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                    skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type)
                 )
                 for db_plan in db_plans
             ]
@@ -242,13 +228,13 @@ class PlanService:
                                 detail="You are not allowed to update the user profile")
         plan_crud_manager = PlanRepository()
         old_plan = cast(Plans, await plan_crud_manager.get_by_query({"_id": plan_request.plan_id}))
-        # skill: Skills = cast(Skills, old_plan.skill)
-        # if plan_request.skill_id is not None:
-        #     skill_crud_manager = SkillRepository()
-        #     skill = cast(Skills, await skill_crud_manager.get_by_query({"_id": plan_request.skill_id}))
-        #     if skill is None:
-        #         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
-        #                             detail="Must provide a valid skill id")
+        skill: Skills = cast(Skills, old_plan.skill)
+        if plan_request.skill_id is not None:
+            skill_crud_manager = SkillRepository()
+            skill = cast(Skills, await skill_crud_manager.get_by_query({"_id": plan_request.skill_id}))
+            if skill is None:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
+                                    detail="Must provide a valid skill id")
         tasks: list[Task] = []
         if plan_request.task is not None or not plan_request.task == []:
 
@@ -292,9 +278,16 @@ class PlanService:
         #                 tasks[index].status = StatusEnum.delete
         item_dict = plan_request.dict(exclude_unset=True, exclude_none=True)
         item_dict.pop("plan_id")
+        """
+        The skill and the profile are stored as links, not by their request ids
+        """
+        item_dict.pop("skill_id", None)
+        item_dict.pop("profile_id", None)
         # item_dict.pop("delete_tasks")
         item_dict["task"] = tasks
-        # item_dict["skill"] = skill
+        if plan_request.skill_id is not None:
+            item_dict["skill"] = DBRef(Skills.get_collection_name(), skill.id)
+            item_dict["skill_snapshot"] = skill_snapshot(skill)
         # item_dict["profile"] = old_profile
 
         cast(
@@ -308,7 +301,7 @@ class PlanService:
         # plan_type = cast(PlanTypeEnum | None, db_plan.plan_type)
         # plan_response = PlanCreateResponse(
         #     id=str(db_plan.id),
-        #     plan_type=ResponseEnumData(id=plan_type, name=PlanTypeEnum(plan_type).name),
+        #     plan_type=enum_data(PlanTypeEnum, plan_type),
         #     notes=db_plan.notes,
         #     skill_id=db_plan.skill.id,
         #     task=[
@@ -325,36 +318,28 @@ class PlanService:
         #     status=ResponseEnumData(id=db_plan.status,
         #                             name=StatusEnum(db_plan.status).name)
         # )
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == old_profile.id,
-            fetch_links=True
-        ).to_list()
+        db_plans = await plan_crud_manager.get_profile_plans(cast(PydanticObjectId, old_profile.id))
         plan_response = PlanListDataResponse(
             plans=[
                 PlanCreateResponse(
                     id=db_plan.id,
-                    plan_type=ResponseEnumData(id=db_plan.plan_type, name=PlanTypeEnum(db_plan.plan_type).name),
+                    plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                     notes=db_plan.notes,
-                    skill_id=cast(Skills, db_plan.skill).id,
+                    skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
                     task=[
                         TaskResponse(
                             id=data.id,
                             description=data.description,
-                            status=ResponseEnumData(
-                                id=data.status,
-                                name=StatusEnum(data.status).name
-                            ),
+                            status=enum_data(StatusEnum, data.status),
                             spend_time=data.spend_time,
                             duration=data.duration
                         ) for data in cast(list[Task], db_plan.task)
                     ],
                     start_date=db_plan.start_date,
                     end_date=db_plan.end_date,
-                    status=ResponseEnumData(id=db_plan.status,
-                                            name=StatusEnum(db_plan.status).name),
-                    skill_name=cast(Skills, db_plan.skill).skill_name,
-                    skill_type=ResponseEnumData(id=cast(Skills, db_plan.skill).skill_type,
-                                                name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name)
+                    status=enum_data(StatusEnum, db_plan.status),
+                    skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                    skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type)
                 )
                 for db_plan in db_plans
             ]
@@ -374,7 +359,7 @@ class PlanService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="You are not allowed to update the user profile")
         skill_crud_manager = SkillRepository()
-        skill = await skill_crud_manager.get_by_query({"_id": plan_request.skill_id})
+        skill = cast(Skills | None, await skill_crud_manager.get_by_query({"_id": plan_request.skill_id}))
         plan = Plans(
             profile=cast(Link[Profiles], profile_plans),
             plan_type=cast(PlanTypeEnum, plan_request.plan_type),
@@ -382,6 +367,7 @@ class PlanService:
             start_date=plan_request.start_date,
             end_date=plan_request.end_date,
             skill=cast(Link[Skills], skill),
+            skill_snapshot=skill_snapshot(skill) if skill is not None else None,
             status=cast(StatusEnum, plan_request.status) if plan_request.status is not None else StatusEnum.active,
             task=[
                 Task(
@@ -401,36 +387,28 @@ class PlanService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Duplicate Value is not allowed. " + ", ".join(
                                     duplicate_values) + " already exists")
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == profile_plans.id,
-            fetch_links=True
-        ).to_list()
+        db_plans = await plan_crud_manager.get_profile_plans(cast(PydanticObjectId, profile_plans.id))
         plan_response = PlanListDataResponse(
             plans=[
                 PlanCreateResponse(
                     id=db_plan.id,
-                    plan_type=ResponseEnumData(id=db_plan.plan_type, name=PlanTypeEnum(db_plan.plan_type).name),
+                    plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                     notes=db_plan.notes,
-                    skill_id=cast(Skills, db_plan.skill).id,
+                    skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
                     task=[
                         TaskResponse(
                             id=data.id,
                             description=data.description,
-                            status=ResponseEnumData(
-                                id=data.status,
-                                name=StatusEnum(data.status).name
-                            ),
+                            status=enum_data(StatusEnum, data.status),
                             spend_time=data.spend_time,
                             duration=data.duration
                         ) for data in cast(list[Task], db_plan.task)
                     ],
                     start_date=db_plan.start_date,
                     end_date=db_plan.end_date,
-                    status=ResponseEnumData(id=db_plan.status,
-                                            name=StatusEnum(db_plan.status).name),
-                    skill_name=cast(Skills, db_plan.skill).skill_name,
-                    skill_type=ResponseEnumData(id=cast(Skills, db_plan.skill).skill_type,
-                                                name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name)
+                    status=enum_data(StatusEnum, db_plan.status),
+                    skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                    skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type)
                 )
                 for db_plan in db_plans
             ]
@@ -439,37 +417,29 @@ class PlanService:
 
     @staticmethod
     async def get_plan_details_by_admin(profile_id: PydanticObjectId) -> PlanListDataResponse:
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == profile_id,
-            fetch_links=True
-        ).to_list()
+        db_plans = await PlanRepository().get_profile_plans(profile_id)
         plan_response = [
-            PlanCreateResponse(
+            PlanCreateResponse.construct(
                 id=str(db_plan.id),
-                plan_type=ResponseEnumData(id=db_plan.plan_type, name=PlanTypeEnum(db_plan.plan_type).name),
+                plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                 notes=db_plan.notes,
-                skill_id=cast(Skills, db_plan.skill).id,
-                skill_name=cast(Skills, db_plan.skill).skill_name,
-                skill_type=ResponseEnumData(id=cast(Skills, db_plan.skill).skill_type,
-                                            name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name),
+                skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
+                skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type),
                 task=[
-                    TaskResponse(
+                    TaskResponse.construct(
                         id=data.id,
                         description=data.description,
-                        status=ResponseEnumData(
-                            id=data.status,
-                            name=StatusEnum(data.status).name
-                        ),
+                        status=enum_data(StatusEnum, data.status),
                         duration=data.duration,
                         spend_time=data.spend_time
                     ) for data in cast(list[Task], db_plan.task) if data.status == StatusEnum.active],
                 start_date=db_plan.start_date,
                 end_date=db_plan.end_date,
-                status=ResponseEnumData(id=db_plan.status,
-                                        name=StatusEnum(db_plan.status).name),
+                status=enum_data(StatusEnum, db_plan.status),
             ) for db_plan in db_plans if db_plan.status in [StatusEnum.active, StatusEnum.cancel]
         ]
-        return PlanListDataResponse(plans=plan_response)
+        return PlanListDataResponse.construct(plans=plan_response)
 
     @staticmethod
     async def get_plan_details_by_user(email: str) -> PlanListDataResponse:
@@ -482,33 +452,26 @@ class PlanService:
                 projection_model=ProfileView
             )
         )
-        db_plans = await Plans.find(
-            cast(Profiles, Plans.profile).id == user.id,
-            fetch_links=True).to_list()
+        db_plans = await PlanRepository().get_profile_plans(user.id)
         plan_response = [
-            PlanCreateResponse(
+            PlanCreateResponse.construct(
                 id=str(db_plan.id),
-                plan_type=ResponseEnumData(id=db_plan.plan_type, name=PlanTypeEnum(db_plan.plan_type).name),
+                plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
                 notes=db_plan.notes,
-                skill_id=cast(Skills, db_plan.skill).id,
-                skill_name=cast(Skills, db_plan.skill).skill_name,
-                skill_type=ResponseEnumData(id=cast(Skills, db_plan.skill).skill_type,
-                                            name=SkillTypeEnum(cast(Skills, db_plan.skill).skill_type).name),
+                skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
+                skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type),
                 task=[
-                    TaskResponse(
+                    TaskResponse.construct(
                         id=data.id,
                         description=data.description,
-                        status=ResponseEnumData(
-                            id=data.status,
-                            name=StatusEnum(data.status).name
-                        ),
+                        status=enum_data(StatusEnum, data.status),
                         spend_time=data.spend_time,
                         duration=data.duration
                     ) for data in cast(list[Task], db_plan.task)],
                 start_date=db_plan.start_date,
                 end_date=db_plan.end_date,
-                status=ResponseEnumData(id=db_plan.status,
-                                        name=StatusEnum(db_plan.status).name)
+                status=enum_data(StatusEnum, db_plan.status)
             ) for db_plan in db_plans if db_plan.status == StatusEnum.active
         ]
-        return PlanListDataResponse(plans=plan_response)
+        return PlanListDataResponse.construct(plans=plan_response)
@@ -1,3 +1,4 @@
+import uuid
 from typing import cast, Any
 
 from beanie import PydanticObjectId
@@ -5,28 +6,61 @@ from fastapi import HTTPException, status
 from pymongo.errors import DuplicateKeyError
 
 from skill_management.enums import FileTypeEnum, DesignationStatusEnum, StatusEnum, GenderEnum, ProfileStatusEnum, \
-    SkillCategoryEnum, SkillTypeEnum
+    SkillCategoryEnum, SkillTypeEnum, PlanTypeEnum
 from skill_management.models.designation import Designations
-from skill_management.models.enums import ProfileStatus, DesignationStatus, Gender, Status
 from skill_management.models.file import Files
+from skill_management.models.plan import Plans
 from skill_management.models.profile import Profiles
+from skill_management.repositories.base_repository import to_dotted_fields
+from skill_management.repositories.plan import PlanRepository
 from skill_management.repositories.profile import ProfileRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import ResponseEnumData, enum_data
 from skill_management.schemas.designation import ProfileDesignation, ProfileDesignationResponse, DesignationDataResponse
 from skill_management.schemas.education import ProfileEducationResponse
 from skill_management.schemas.experience import ProfileExperience, ExperienceDesignation, ProfileExperienceResponse, \
     ProfileExperienceDesignationResponse
 from skill_management.schemas.file import FileResponse
+from skill_management.schemas.plan import PlanCreateResponse, PlanSkill, Task, TaskResponse
 from skill_management.schemas.profile import ProfileBasicForAdminRequest, ProfilePersonalDetails, ProfileResponse, \
     ProfilePersonalDetailsResponse, ProfileUpdateByAdmin, ProfileBasicRequest, ProfileUpdateByUser, \
-    ProfileBasicResponse, PaginatedProfileResponse, ProfileDetailsResponse, ProfileProfileDetailsView
+    ProfileBasicResponse, PaginatedProfileResponse, ProfileDetailsResponse, ProfileProfileDetailsView, \
+    ProfileBasicView, ProfileFullResponse
 from skill_management.schemas.skill import ProfileSkillResponse, ProfileSkillDataResponse
+from skill_management.utils.sparse_fields import DocumentFields, SparseFields, sparse_construct, sparse_view
+
+"""
+Fields of the profile listing and details selectable with `fields=`, with the view fields they are read from
+"""
+PROFILE_BASIC_FIELDS: dict[str, DocumentFields] = {
+    "id": {},
+    "url": {},
+    "profile_picture_url": {},
+    "name": {"personal_detail": {"name"}},
+    "mobile": {"personal_detail": {"mobile"}},
+    "email": {"user_id": None},
+    "designation": {"designation": {"designation_id", "designation"}},
+    "skills": {"skills": {"skill_id", "experience_year", "level", "skill_name", "status"}},
+    "profile_status": {"profile_status": None}
+}
+PROFILE_DETAILS_FIELDS: dict[str, DocumentFields] = {
+    "id": {},
+    "email": {"user_id": None},
+    "profile_status": {"profile_status": None},
+    "personal_details": {"personal_detail": None},
+    **{
+        f"personal_details.{name}": {"personal_detail": {name}}
+        for name in ["name", "date_of_birth", "gender", "mobile", "address", "about", "experience_year"]
+    },
+    "personal_details.picture_url": {},
+    "personal_details.cv_urls": {}
+}
 
 
 class ProfileService:
     # pass
     async def create_or_update_user_profile_by_user(self, profile_request: ProfileBasicRequest,
-                                                    email: str | None) -> ProfileResponse:
+                                                    email: str | None,
+                                                    revision_id: uuid.UUID | None = None) -> ProfileResponse:
 
         if profile_request.profile_id is not None:
             """
@@ -45,11 +79,12 @@ class ProfileService:
             """ 
             It is  a update operation. 
             """
-            response = await self._update_user_profile_by_user(profile_request)
+            response = await self._update_user_profile_by_user(profile_request, revision_id)
 
         return response
 
-    async def create_or_update_user_profile_by_admin(self, profile: ProfileBasicForAdminRequest) -> ProfileResponse:
+    async def create_or_update_user_profile_by_admin(self, profile: ProfileBasicForAdminRequest,
+                                                     revision_id: uuid.UUID | None = None) -> ProfileResponse:
         if profile.profile_id is None:
             """ 
             It is  a create operation. 
@@ -59,26 +94,16 @@ class ProfileService:
             """ 
             It is  a update operation. 
             """
-            response = await self._update_user_profile_by_admin(profile)
+            response = await self._update_user_profile_by_admin(profile, revision_id)
 
         return response
 
     @staticmethod
-    async def _update_user_profile_by_admin(profile_request: ProfileBasicForAdminRequest) -> ProfileResponse:
+    async def _update_user_profile_by_admin(profile_request: ProfileBasicForAdminRequest,
+                                            revision_id: uuid.UUID | None = None) -> ProfileResponse:
         profile_crud_manager = ProfileRepository()
-        old_profile: Profiles = cast(
-            Profiles, await profile_crud_manager.get(id_=profile_request.profile_id)
-        )
         db_profile: Profiles | None = None
 
-        if old_profile is None:
-            """
-            Check if the profile exists in the database
-            """
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You should provide a existing profile id of the user"
-            )
         if profile_request.email is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -105,45 +130,34 @@ class ProfileService:
         if item_dict.get("designation_id") is not None:
             item_dict.pop("designation_id")
 
-        old_profile_details = old_profile.personal_detail.dict()
-        for key, value in item_dict.items():
-            if key in old_profile_details:
-                old_profile_details[key] = value
+        """
+        Only the provided personal details are written, as dotted paths, so the profile is not read first
+        """
+        personal_detail_fields = to_dotted_fields(
+            "personal_detail",
+            {key: value for key, value in item_dict.items() if key in ProfilePersonalDetails.__fields__}
+        )
 
         if profile_request.designation_id is None:
             db_profile = cast(
-                Profiles, await profile_crud_manager.update(
+                Profiles, await profile_crud_manager.update_fields(
                     id_=profile_request.profile_id,
-                    item_dict={
-                        "personal_detail": old_profile_details
-                    }
+                    set_fields=personal_detail_fields,
+                    revision_id=revision_id
                 )
             )
         elif profile_request.designation_id is not None:
             # if profile_request.designation_status == DesignationStatusEnum.active:
-            all_experience_id = [
-                experience.experience_id for experience in old_profile.experiences
-            ]
-
-            if not all_experience_id:
-                new_experience_id = 1
-
-            else:
-                """
-                Calculate new experience id
-                """
-                new_experience_id = max(all_experience_id) + 1
-
             """
             Get Designation Data
             """
             designation: Designations = await Designations.get(profile_request.designation_id)  # type: ignore
 
             """
-            Create new experience from the designation id provided
+            Create new experience from the designation id provided, its id is allocated on insert
             """
             new_experience = ProfileExperience(
-                experience_id=new_experience_id,
+                experience_id=1,
                 company_name="iXora Solution Ltd.",
                 designation=ExperienceDesignation(
                     designation=designation.designation,
@@ -160,10 +174,14 @@ class ProfileService:
             """
 
             db_profile = cast(
-                Profiles, await profile_crud_manager.update(
+                Profiles, await profile_crud_manager.push_with_sequence(
                     id_=profile_request.profile_id,
-                    item_dict={
-                        "personal_detail": old_profile_details,
+                    field="experiences",
+                    item=new_experience.dict(),
+                    id_field="experience_id",
+                    revision_id=revision_id,
+                    set_fields={
+                        **personal_detail_fields,
                         "designation": {
                             'designation_id': designation.id,
                             'designation': designation.designation,
@@ -172,13 +190,26 @@ class ProfileService:
                             if profile_request.designation_status is not None
                             else DesignationStatusEnum.active
                         }
-                    },
-                    push_item={
-                        "experiences": new_experience.dict(
-                        )
                     }
                 )
             )
+        if db_profile is None and revision_id is not None and \
+                await profile_crud_manager.get_revision({"_id": profile_request.profile_id}) is not None:
+            """
+            The profile exists, it was changed since the client read the revision of If-Match
+            """
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="The profile was changed since it was read"
+            )
+        if db_profile is None:
+            """
+            Check if the profile exists in the database
+            """
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You should provide a existing profile id of the user"
+            )
         # if profile_request.designation_status == DesignationStatusEnum.inactive:
         #     designation= None
         #     if profile_request.designation_id is not None:
@@ -206,10 +237,7 @@ class ProfileService:
                 FileResponse(
                     file_name=file.file_name,
                     url="/admin/files/response/" + str(file.id),
-                    status=ResponseEnumData(
-                        id=file.status,
-                        name=StatusEnum(file.status).name
-                    )
+                    status=enum_data(StatusEnum, file.status)
                 ) for file in await Files.find(
                     {
                         "owner": db_profile.id,
@@ -217,7 +245,6 @@ class ProfileService:
                     }
                 ).to_list() if file.status == StatusEnum.active
             ]
-            skill_status_object: Status = await Status.get(skill_.status.value)  # type: ignore
             skill_list.append(
                 ProfileSkillResponse(
                     skill_id=skill_.skill_id,
@@ -229,21 +256,13 @@ class ProfileService:
                     achievements=skill_.achievements,
                     certificate=skill_.certificate,
                     certificate_files=certificate_files,
-                    status=ResponseEnumData(
-                        id=skill_status_object.id,
-                        name=StatusEnum(skill_status_object.id).name
-                    ),
+                    status=enum_data(StatusEnum, skill_.status),
                     achievements_description=skill_.achievements_description,
                     skill_category=[
-                        ResponseEnumData(
-                            id=skill_category_id,
-                            name=SkillCategoryEnum(skill_category_id).name
-                        )
+                        enum_data(SkillCategoryEnum, skill_category_id)
                         for skill_category_id in skill_.skill_category
                     ],
-                    skill_type=ResponseEnumData(
-                        id=skill_.skill_type,
-                        name=SkillTypeEnum(skill_.skill_type).name)
+                    skill_type=enum_data(SkillTypeEnum, skill_.skill_type)
 
                 )
             )
@@ -272,10 +291,7 @@ class ProfileService:
         personal_detail_response = ProfilePersonalDetailsResponse(
             name=db_profile.personal_detail.name,
             date_of_birth=db_profile.personal_detail.date_of_birth,
-            gender=ResponseEnumData(
-                id=db_profile.personal_detail.gender,
-                name=GenderEnum(db_profile.personal_detail.gender.value).name
-            ),
+            gender=enum_data(GenderEnum, db_profile.personal_detail.gender),
             mobile=db_profile.personal_detail.mobile,
             about=db_profile.personal_detail.about,
             address=db_profile.personal_detail.address,
@@ -284,10 +300,7 @@ class ProfileService:
                 FileResponse(
                     file_name=data.file_name,
                     url="/admin/files/response/" + str(data.id),
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    )
+                    status=enum_data(StatusEnum, data.status)
                 ) for data in cv_files
             ],
             picture_url=profile_url,
@@ -304,12 +317,7 @@ class ProfileService:
                 designation=db_profile.designation.designation,
                 start_date=db_profile.designation.start_date,
                 end_date=db_profile.designation.end_date,
-                designation_status=ResponseEnumData(
-                    id=db_profile.designation.designation_status,
-                    name=DesignationStatusEnum(
-                        db_profile.designation.designation_status
-                    ).name
-                ),
+                designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status),
             ),
             skills=skill_list,
             experiences=[
@@ -323,10 +331,7 @@ class ProfileService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(
-                        id=experience.status,
-                        name=StatusEnum(experience.status).name
-                    )
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences
             ],
@@ -337,31 +342,20 @@ class ProfileService:
                     grade=education.grade,
                     passing_year=education.passing_year,
                     school_name=education.school_name,
-                    status=ResponseEnumData(id=education.status,
-                                            name=StatusEnum(cast(int, education.status)).name)
+                    status=enum_data(StatusEnum, cast(int, education.status))
                 ) for education in db_profile.educations
             ],
             personal_details=personal_detail_response,
-            profile_status=ResponseEnumData(
-                id=db_profile.profile_status,
-                name=ProfileStatusEnum(db_profile.profile_status).name
-            )
+            profile_status=enum_data(ProfileStatusEnum, db_profile.profile_status)
         )
         return response
 
     @staticmethod
-    async def _update_user_profile_by_user(profile_request: ProfileBasicRequest) -> ProfileResponse:
+    async def _update_user_profile_by_user(profile_request: ProfileBasicRequest,
+                                           revision_id: uuid.UUID | None = None) -> ProfileResponse:
         profile_crud_manager = ProfileRepository()
-        old_profile: Profiles = cast(Profiles, await profile_crud_manager.get(id_=profile_request.profile_id))
+        db_profile: Profiles | None = None
 
-        if old_profile is None:
-            """
-            Check if the profile exists in the database
-            """
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You should provide a existing profile id of the user"
-            )
         raise_http_exec = False
         try:
             email = profile_request.email
@@ -402,11 +396,13 @@ class ProfileService:
             item_dict.pop("designation_status")
         if item_dict.get("designation_id") is not None:
             item_dict.pop("designation_id")
-        old_profile_details = old_profile.personal_detail.dict()
-
-        for key, value in item_dict.items():
-            if key in old_profile_details:
-                old_profile_details[key] = value
+        """
+        Only the provided personal details are written, as dotted paths, so the profile is not read first
+        """
+        personal_detail_fields = to_dotted_fields(
+            "personal_detail",
+            {key: value for key, value in item_dict.items() if key in ProfilePersonalDetails.__fields__}
+        )
         if profile_request.designation_id is not None:
             # designation: Designations = await Designations.get(profile_request.designation_id)  # type: ignore
             # db_profile: Profiles = await profile_crud_manager.update(  # type: ignore
@@ -426,29 +422,16 @@ class ProfileService:
             """
             The above commented code is for the future use. If the admin approval is required for the designation change.
             """
-            all_experience_id = [
-                experience.experience_id for experience in old_profile.experiences
-            ]
-
-            if not all_experience_id:
-                new_experience_id = 1
-
-            else:
-                """
-                Calculate new experience id
-                """
-                new_experience_id = max(all_experience_id) + 1
-
             """
             Get Designation Data
             """
             designation: Designations = await Designations.get(profile_request.designation_id)  # type: ignore
 
             """
-            Create new experience from the designation id provided
+            Create new experience from the designation id provided, its id is allocated on insert
             """
             new_experience = ProfileExperience(
-                experience_id=new_experience_id,
+                experience_id=1,
                 company_name="iXora Solution Ltd.",
                 designation=ExperienceDesignation(
                     designation=designation.designation,
@@ -465,34 +448,51 @@ class ProfileService:
             """
 
             db_profile = cast(
-                Profiles, await profile_crud_manager.update(
+                Profiles, await profile_crud_manager.push_with_sequence(
                     id_=profile_request.profile_id,
-                    item_dict={
-                        "personal_detail": old_profile_details,
+                    field="experiences",
+                    item=new_experience.dict(),
+                    id_field="experience_id",
+                    revision_id=revision_id,
+                    set_fields={
+                        **personal_detail_fields,
                         "designation": {
                             'designation_id': designation.id,
                             'designation': designation.designation,
                             'start_date': None, 'end_date': None,
                             'designation_status': DesignationStatusEnum.active
                         }
-                    },
-                    push_item={
-                        "experiences": new_experience.dict(
-                        )
                     }
                 )
             )
 
         else:
             db_profile = cast(
-                Profiles, await profile_crud_manager.update(
+                Profiles, await profile_crud_manager.update_fields(
                     id_=profile_request.profile_id,
-                    item_dict={
-                        "personal_detail": old_profile_details
-                    }
+                    set_fields=personal_detail_fields,
+                    revision_id=revision_id
                 )
             )
 
+        if db_profile is None and revision_id is not None and \
+                await profile_crud_manager.get_revision({"_id": profile_request.profile_id}) is not None:
+            """
+            The profile exists, it was changed since the client read the revision of If-Match
+            """
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="The profile was changed since it was read"
+            )
+        if db_profile is None:
+            """
+            Check if the profile exists in the database
+            """
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You should provide a existing profile id of the user"
+            )
+
         """
         Create skill list for the response
         """
@@ -503,7 +503,7 @@ class ProfileService:
                     FileResponse(
                         file_name=file.file_name,
                         url="/profile/files/response/%s" % file.id,
-                        status=ResponseEnumData(id=file.status, name=StatusEnum(file.status).name)
+                        status=enum_data(StatusEnum, file.status)
                     ) for file in await Files.find(
                         {
                             "owner": db_profile.id,
@@ -522,22 +522,13 @@ class ProfileService:
                         achievements=skill_.achievements,
                         certificate=skill_.certificate,
                         certificate_files=certificate_files,
-                        status=ResponseEnumData(
-                            id=skill_.status,
-                            name=StatusEnum(skill_.status).name
-                        ),
+                        status=enum_data(StatusEnum, skill_.status),
                         achievements_description=skill_.achievements_description,
                         skill_category=[
-                            ResponseEnumData(
-                                id=skill_category_id,
-                                name=SkillCategoryEnum(skill_category_id.value).name
-                            )
+                            enum_data(SkillCategoryEnum, skill_category_id)
                             for skill_category_id in skill_.skill_category
                         ],
-                        skill_type=ResponseEnumData(
-                            id=skill_.skill_type,
-                            name=SkillTypeEnum(skill_.skill_type.value).name
-                        )
+                        skill_type=enum_data(SkillTypeEnum, skill_.skill_type)
 
                     )
                 )
@@ -567,10 +558,7 @@ class ProfileService:
         personal_detail_response = ProfilePersonalDetailsResponse(
             name=db_profile.personal_detail.name,
             date_of_birth=db_profile.personal_detail.date_of_birth,
-            gender=ResponseEnumData(
-                id=db_profile.personal_detail.gender,
-                name=GenderEnum(db_profile.personal_detail.gender.value).name
-            ),
+            gender=enum_data(GenderEnum, db_profile.personal_detail.gender),
             mobile=db_profile.personal_detail.mobile,
             about=db_profile.personal_detail.about,
             address=db_profile.personal_detail.address,
@@ -579,10 +567,7 @@ class ProfileService:
                 FileResponse(
                     file_name=data.file_name,
                     url="/profile/files/response/" + str(data.id),
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    )
+                    status=enum_data(StatusEnum, data.status)
                 ) for data in cv_files
             ],
             picture_url=profile_url,
@@ -601,10 +586,7 @@ class ProfileService:
                 designation=db_profile.designation.designation,
                 start_date=db_profile.designation.start_date,
                 end_date=db_profile.designation.end_date,
-                designation_status=ResponseEnumData(
-                    id=db_profile.designation.designation_status,
-                    name=DesignationStatusEnum(db_profile.designation.designation_status.value).name
-                ),
+                designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status),
             ),
             skills=skill_list,
             experiences=[
@@ -618,10 +600,7 @@ class ProfileService:
                     ),
                     start_date=experience.start_date,
                     end_date=experience.end_date,
-                    status=ResponseEnumData(
-                        id=experience.status,
-                        name=StatusEnum(experience.status.value).name
-                    )
+                    status=enum_data(StatusEnum, experience.status)
                 )
                 for experience in db_profile.experiences if experience.status == StatusEnum.active
             ],
@@ -632,18 +611,12 @@ class ProfileService:
                     grade=education.grade,
                     passing_year=education.passing_year,
                     school_name=education.school_name,
-                    status=ResponseEnumData(
-                        id=education.status,
-                        name=StatusEnum(education.status.value).name
-                    )
+                    status=enum_data(StatusEnum, education.status)
                 )
                 for education in db_profile.educations if education.status == StatusEnum.active
             ],
             personal_details=personal_detail_response,
-            profile_status=ResponseEnumData(
-                id=db_profile.profile_status,
-                name=ProfileStatusEnum(db_profile.profile_status).name
-            )
+            profile_status=enum_data(ProfileStatusEnum, db_profile.profile_status)
         )
 
         return response
@@ -667,8 +640,6 @@ class ProfileService:
             )
 
         designation: Designations = await Designations.get(profile_request.designation_id)  # type: ignore
-        profile_status_object: ProfileStatus = await ProfileStatus.get(
-            profile_request.profile_status.value)  # type: ignore
         personal_detail = ProfilePersonalDetails(
             name=profile_request.name,
             date_of_birth=profile_request.date_of_birth,
@@ -678,12 +649,6 @@ class ProfileService:
             address=None,
             experience_year=None
         )
-        designation_status_object: DesignationStatus = await DesignationStatus.get(
-            profile_request.designation_status.value  # type: ignore
-        )
-
-        gender_data: Gender = await Gender.get(profile_request.gender)  # type: ignore
-
         """
         Create profile experience based on the designation status
         """
@@ -736,9 +701,7 @@ class ProfileService:
         personal_detail_response: ProfilePersonalDetailsResponse = ProfilePersonalDetailsResponse(
             name=profile_request.name,
             date_of_birth=profile_request.date_of_birth,
-            gender=ResponseEnumData(
-                id=gender_data.id,
-                name=gender_data.name),
+            gender=enum_data(GenderEnum, cast(GenderEnum, profile_request.gender)),
             mobile=profile_request.mobile,
             about=None,
             address=None,
@@ -757,10 +720,7 @@ class ProfileService:
                 designation_id=designation.id,
                 designation=designation.designation,
                 start_date=None, end_date=None,
-                designation_status=ResponseEnumData(
-                    id=designation_status_object.id,
-                    name=designation_status_object.name
-                ),
+                designation_status=enum_data(DesignationStatusEnum, cast(DesignationStatusEnum, profile_request.designation_status)),
             ),
             skills=[],
             experiences=[
@@ -782,10 +742,7 @@ class ProfileService:
             ] if new_experience else [],
             educations=[],
             personal_details=personal_detail_response,
-            profile_status=ResponseEnumData(
-                id=profile_status_object.id,
-                name=profile_status_object.name
-            )
+            profile_status=enum_data(ProfileStatusEnum, cast(ProfileStatusEnum, profile_request.profile_status))
         )
         return response
 
@@ -823,8 +780,6 @@ class ProfileService:
             experience_year=None
         )
 
-        gender_data: Gender = await Gender.get(profile_request.gender)  # type: ignore
-
         """
         Create profile object to insert into the database
         # """
@@ -870,9 +825,7 @@ class ProfileService:
         personal_detail_response: ProfilePersonalDetailsResponse = ProfilePersonalDetailsResponse(
             name=profile_request.name,
             date_of_birth=profile_request.date_of_birth,
-            gender=ResponseEnumData(
-                id=gender_data.id,
-                name=gender_data.name),
+            gender=enum_data(GenderEnum, cast(GenderEnum, profile_request.gender)),
             mobile=profile_request.mobile,
             about=None,
             address=None,
@@ -890,19 +843,13 @@ class ProfileService:
                 designation_id=designation.id,
                 designation=designation.designation,
                 start_date=None, end_date=None,
-                designation_status=ResponseEnumData(
-                    id=db_profile.designation.designation_status,
-                    name=DesignationStatusEnum(db_profile.designation.designation_status).name
-                ),
+                designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status),
             ),
             skills=[],
             experiences=[],
             educations=[],
             personal_details=personal_detail_response,
-            profile_status=ResponseEnumData(
-                id=db_profile.profile_status,
-                name=ProfileStatusEnum(db_profile.profile_status).name
-            )
+            profile_status=enum_data(ProfileStatusEnum, db_profile.profile_status)
         )
         return response
 
@@ -914,7 +861,8 @@ class ProfileService:
                                           email: str | None = None,
                                           profile_status: ProfileStatusEnum | None = None,
                                           page_number: int,
-                                          page_size: int) -> PaginatedProfileResponse:
+                                          page_size: int,
+                                          fields: SparseFields | None = None) -> PaginatedProfileResponse:
         query: dict[str, Any] = {}
 
         if skill_ids is not None:
@@ -953,18 +901,25 @@ class ProfileService:
         if profile_status is not None:
             query["profile_status"] = profile_status
 
-        db_profiles = await Profiles.find(query).skip((page_number - 1) * page_size).limit(page_size).to_list()
+        view: type[ProfileBasicView] = ProfileBasicView
+        if fields is not None:
+            view = sparse_view(
+                ProfileBasicView,
+                fields.document_fields(PROFILE_BASIC_FIELDS, {"id": None, "profile_status": None}))
+        db_profiles = await Profiles.find(query, projection_model=view).skip((page_number - 1) * page_size).limit(
+            page_size).to_list()
         count = await (Profiles.find(query).count())
         response = [
-            ProfileBasicResponse(
-                id=db_profile.id,
-                email=db_profile.user_id,
-                designation=DesignationDataResponse(
+            sparse_construct(
+                ProfileBasicResponse, fields,
+                id=lambda: db_profile.id,
+                email=lambda: db_profile.user_id,
+                designation=lambda: DesignationDataResponse.construct(
                     designation_id=db_profile.designation.designation_id,
                     designation=db_profile.designation.designation
                 ),
-                skills=[
-                    ProfileSkillDataResponse(
+                skills=lambda: [
+                    ProfileSkillDataResponse.construct(
                         skill_id=skill.skill_id,
                         experience_year=skill.experience_year,
                         level=skill.level,
@@ -972,16 +927,13 @@ class ProfileService:
                     ) for skill in db_profile.skills if skill.status == StatusEnum.active
                                                         or skill.status == StatusEnum.cancel
                 ],
-                mobile=db_profile.personal_detail.mobile,
-                profile_picture_url="/profile-picture/{profile_id}".format(profile_id=db_profile.id),
-                name=db_profile.personal_detail.name,
-                url=f"/admin/user-profiles/%s" % (str(db_profile.id)),
-                profile_status=ResponseEnumData(
-                    id=db_profile.profile_status,
-                    name=ProfileStatusEnum(db_profile.profile_status).name
-                )
+                mobile=lambda: db_profile.personal_detail.mobile,
+                profile_picture_url=lambda: "/profile-picture/{profile_id}".format(profile_id=db_profile.id),
+                name=lambda: db_profile.personal_detail.name,
+                url=lambda: f"/admin/user-profiles/%s" % (str(db_profile.id)),
+                profile_status=lambda: enum_data(ProfileStatusEnum, db_profile.profile_status)
             ) for db_profile in db_profiles if not db_profile.profile_status == ProfileStatusEnum.delete]
-        return PaginatedProfileResponse(
+        return PaginatedProfileResponse.construct(
 
             previous_page=page_number - 1 if page_number > 1 else None,
             next_page=page_number + 1 if page_number * page_size < count else None,
@@ -992,13 +944,18 @@ class ProfileService:
             items=response)
 
     @staticmethod
-    async def get_user_profile_by_admin(profile_id: PydanticObjectId) -> ProfileDetailsResponse:
+    async def get_user_profile_by_admin(profile_id: PydanticObjectId,
+                                        fields: SparseFields | None = None) -> ProfileDetailsResponse:
         query = {'_id': profile_id}
+        view: type[ProfileProfileDetailsView] = ProfileProfileDetailsView
+        if fields is not None:
+            view = sparse_view(
+                ProfileProfileDetailsView, fields.document_fields(PROFILE_DETAILS_FIELDS, {"id": None}))
         db_profiles: ProfileProfileDetailsView = cast(
             ProfileProfileDetailsView,
             await Profiles.find(
                 query,
-                projection_model=ProfileProfileDetailsView
+                projection_model=view
             ).first_or_none()
         )
         # profile_pictures = await Files.find(
@@ -1008,62 +965,62 @@ class ProfileService:
         #         "status": StatusEnum.active
         #     }
         # ).sort("-created_at").to_list()
-        cv_files = await Files.find(
-            {
-                "owner": db_profiles.id,
-                "file_type": FileTypeEnum.resume,
-                "status": StatusEnum.active
-            }
-        ).sort("-created_at").to_list()
+        cv_files: list[Files] = []
+        if fields is None or "personal_details.cv_urls" in fields:
+            cv_files = await Files.find(
+                {
+                    "owner": db_profiles.id,
+                    "file_type": FileTypeEnum.resume,
+                    "status": StatusEnum.active
+                }
+            ).sort("-created_at").to_list()
         profile_url = "/profile-picture/" + str(db_profiles.id)
         # profile_url = None
         # if profile_pictures:
         #     profile_url = "/admin/files/response/" + str(profile_pictures[0].id)
 
-        response = ProfileDetailsResponse(
-            id=db_profiles.id,
-            email=db_profiles.user_id,
-            personal_details=ProfilePersonalDetailsResponse(
-                name=db_profiles.personal_detail.name,
-                date_of_birth=db_profiles.personal_detail.date_of_birth,
-                gender=ResponseEnumData(
-                    id=db_profiles.personal_detail.gender,
-                    name=GenderEnum(db_profiles.personal_detail.gender).name,
-                ),
-                mobile=db_profiles.personal_detail.mobile,
-                address=db_profiles.personal_detail.address,
-                about=db_profiles.personal_detail.about,
-                picture_url=profile_url,
-                experience_year=db_profiles.personal_detail.experience_year,
-                cv_urls=[
-                    FileResponse(
+        response = sparse_construct(
+            ProfileDetailsResponse, fields,
+            id=lambda: db_profiles.id,
+            email=lambda: db_profiles.user_id,
+            personal_details=lambda: sparse_construct(
+                ProfilePersonalDetailsResponse, None if fields is None else fields.nested("personal_details"),
+                name=lambda: db_profiles.personal_detail.name,
+                date_of_birth=lambda: db_profiles.personal_detail.date_of_birth,
+                gender=lambda: enum_data(GenderEnum, db_profiles.personal_detail.gender),
+                mobile=lambda: db_profiles.personal_detail.mobile,
+                address=lambda: db_profiles.personal_detail.address,
+                about=lambda: db_profiles.personal_detail.about,
+                picture_url=lambda: profile_url,
+                experience_year=lambda: db_profiles.personal_detail.experience_year,
+                cv_urls=lambda: [
+                    FileResponse.construct(
                         file_name=data.file_name,
                         url="/admin/files/response/" + str(data.id),
-                        status=ResponseEnumData(
-                            id=data.status,
-                            name=StatusEnum(data.status).name
-                        )
+                        status=enum_data(StatusEnum, data.status)
                     ) for data in cv_files
                 ]
             ),
-            profile_status=ResponseEnumData(
-                id=db_profiles.profile_status,
-                name=ProfileStatusEnum(db_profiles.profile_status).name,
-            ),
+            profile_status=lambda: enum_data(ProfileStatusEnum, db_profiles.profile_status),
         )
 
         return response
 
     @staticmethod
-    async def get_user_profile_by_user(email: str) -> ProfileDetailsResponse:
+    async def get_user_profile_by_user(email: str, fields: SparseFields | None = None) -> ProfileDetailsResponse:
         query = {
             'user_id': email,
         }
+        view: type[ProfileProfileDetailsView] = ProfileProfileDetailsView
+        if fields is not None:
+            view = sparse_view(
+                ProfileProfileDetailsView,
+                fields.document_fields(PROFILE_DETAILS_FIELDS, {"id": None, "profile_status": None}))
         db_profiles: ProfileProfileDetailsView = cast(
             ProfileProfileDetailsView,
             await Profiles.find(
                 query,
-                projection_model=ProfileProfileDetailsView
+                projection_model=view
             ).first_or_none()
         )
         if db_profiles is None:
@@ -1084,47 +1041,180 @@ class ProfileService:
         #         "status": StatusEnum.active
         #     }
         # ).sort("-created_at").to_list()
-        cv_files = await Files.find(
-            {
-                "owner": db_profiles.id,
-                "file_type": FileTypeEnum.resume,
-                "status": StatusEnum.active
-            }
-        ).sort("-created_at").to_list()
+        cv_files: list[Files] = []
+        if fields is None or "personal_details.cv_urls" in fields:
+            cv_files = await Files.find(
+                {
+                    "owner": db_profiles.id,
+                    "file_type": FileTypeEnum.resume,
+                    "status": StatusEnum.active
+                }
+            ).sort("-created_at").to_list()
         # profile_url = None
         # if profile_pictures:
         profile_url = "/profile-picture/" + str(db_profiles.id)
 
-        response = ProfileDetailsResponse(
-            id=db_profiles.id,
-            email=db_profiles.user_id,
-            personal_details=ProfilePersonalDetailsResponse(
-                name=db_profiles.personal_detail.name,
-                date_of_birth=db_profiles.personal_detail.date_of_birth,
-                gender=ResponseEnumData(
-                    id=db_profiles.personal_detail.gender,
-                    name=GenderEnum(db_profiles.personal_detail.gender).name,
-                ),
-                mobile=db_profiles.personal_detail.mobile,
-                address=db_profiles.personal_detail.address,
-                about=db_profiles.personal_detail.about,
-                picture_url=profile_url,
-                experience_year=db_profiles.personal_detail.experience_year,
-                cv_urls=[
-                    FileResponse(
+        response = sparse_construct(
+            ProfileDetailsResponse, fields,
+            id=lambda: db_profiles.id,
+            email=lambda: db_profiles.user_id,
+            personal_details=lambda: sparse_construct(
+                ProfilePersonalDetailsResponse, None if fields is None else fields.nested("personal_details"),
+                name=lambda: db_profiles.personal_detail.name,
+                date_of_birth=lambda: db_profiles.personal_detail.date_of_birth,
+                gender=lambda: enum_data(GenderEnum, db_profiles.personal_detail.gender),
+                mobile=lambda: db_profiles.personal_detail.mobile,
+                address=lambda: db_profiles.personal_detail.address,
+                about=lambda: db_profiles.personal_detail.about,
+                picture_url=lambda: profile_url,
+                experience_year=lambda: db_profiles.personal_detail.experience_year,
+                cv_urls=lambda: [
+                    FileResponse.construct(
                         file_name=data.file_name,
                         url="/profile/files/response/" + str(data.id),
-                        status=ResponseEnumData(
-                            id=data.status,
-                            name=StatusEnum(data.status).name
-                        )
+                        status=enum_data(StatusEnum, data.status)
                     ) for data in cv_files
                 ]
             ),
-            profile_status=ResponseEnumData(
-                id=db_profiles.profile_status,
-                name=ProfileStatusEnum(db_profiles.profile_status).name,
-            ),
+            profile_status=lambda: enum_data(ProfileStatusEnum, db_profiles.profile_status),
         )
 
         return response
+
+    async def get_full_profile_by_admin(self, profile_id: PydanticObjectId) -> ProfileFullResponse:
+        full_profile = await ProfileRepository().get_full_profile({"_id": profile_id},
+                                                                  [StatusEnum.active, StatusEnum.cancel])
+        if full_profile is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="Must provide a valid profile id")
+        return await self._full_profile_response(*full_profile, by_admin=True)
+
+    async def get_full_profile_by_user(self, email: str) -> ProfileFullResponse:
+        full_profile = await ProfileRepository().get_full_profile({"user_id": email}, [StatusEnum.active])
+        if full_profile is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Must provide a valid profile id"
+            )
+        if full_profile[0].profile_status in [ProfileStatusEnum.inactive, ProfileStatusEnum.delete]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Must be an active profile"
+            )
+        return await self._full_profile_response(*full_profile, by_admin=False)
+
+    @staticmethod
+    async def _full_profile_response(db_profile: Profiles, files: list[Files], plans: list[Plans],
+                                     by_admin: bool) -> ProfileFullResponse:
+        """
+        The details, skills, experiences, educations, designation and plans of the profile as their own
+        endpoints return them, from the documents of a single aggregation.
+        """
+        file_url = "/admin/files/response/" if by_admin else "/profile/files/response/"
+        statuses = [StatusEnum.active, StatusEnum.cancel] if by_admin else [StatusEnum.active]
+        cv_files = sorted([file for file in files if file.file_type == FileTypeEnum.resume],
+                          key=lambda file: file.created_at, reverse=True)
+        certificate_files = [
+            FileResponse.construct(
+                file_name=file_data.file_name,
+                url=file_url + str(file_data.id),
+                status=enum_data(StatusEnum, file_data.status)
+            ) for file_data in files if file_data.file_type == FileTypeEnum.certificate
+        ]
+        """
+        Plans stored before the skill snapshot existed may still need their skill
+        """
+        db_plans = await PlanRepository().with_skill_snapshots(plans)
+        return ProfileFullResponse.construct(
+            id=db_profile.id,
+            email=db_profile.user_id,
+            designation=ProfileDesignationResponse.construct(
+                designation_id=db_profile.designation.designation_id,
+                designation=db_profile.designation.designation,
+                start_date=db_profile.designation.start_date,
+                end_date=db_profile.designation.end_date,
+                designation_status=enum_data(DesignationStatusEnum, db_profile.designation.designation_status)
+            ),
+            skills=[
+                ProfileSkillResponse.construct(
+                    skill_id=data.skill_id,
+                    skill_type=enum_data(SkillTypeEnum, data.skill_type),
+                    skill_category=[
+                        enum_data(SkillTypeEnum, category_data) for category_data in data.skill_category
+                    ],
+                    skill_name=data.skill_name,
+                    status=enum_data(StatusEnum, data.status),
+                    certificate_files=certificate_files,
+                    experience_year=data.experience_year,
+                    number_of_projects=data.number_of_projects,
+                    level=data.level,
+                    training_duration=data.training_duration,
+                    achievements=data.achievements,
+                    achievements_description=data.achievements_description,
+                    certificate=data.certificate
+                ) for data in db_profile.skills if data.status in statuses
+            ],
+            experiences=[
+                ProfileExperienceResponse.construct(
+                    experience_id=data.experience_id,
+                    company_name=data.company_name,
+                    job_responsibility=data.job_responsibility,
+                    designation=ProfileExperienceDesignationResponse.construct(
+                        designation=data.designation.designation,
+                        designation_id=data.designation.designation_id),
+                    start_date=data.start_date,
+                    end_date=data.end_date,
+                    status=enum_data(StatusEnum, data.status)
+                ) for data in db_profile.experiences if data.status in statuses
+            ],
+            educations=[
+                ProfileEducationResponse.construct(
+                    degree_name=data.degree_name,
+                    school_name=data.school_name,
+                    passing_year=data.passing_year,
+                    grade=data.grade,
+                    education_id=data.education_id,
+                    status=enum_data(StatusEnum, data.status)
+                ) for data in db_profile.educations if data.status in statuses
+            ],
+            personal_details=ProfilePersonalDetailsResponse.construct(
+                name=db_profile.personal_detail.name,
+                date_of_birth=db_profile.personal_detail.date_of_birth,
+                gender=enum_data(GenderEnum, db_profile.personal_detail.gender),
+                mobile=db_profile.personal_detail.mobile,
+                address=db_profile.personal_detail.address,
+                about=db_profile.personal_detail.about,
+                picture_url="/profile-picture/" + str(db_profile.id),
+                experience_year=db_profile.personal_detail.experience_year,
+                cv_urls=[
+                    FileResponse.construct(
+                        file_name=data.file_name,
+                        url=file_url + str(data.id),
+                        status=enum_data(StatusEnum, data.status)
+                    ) for data in cv_files
+                ]
+            ),
+            profile_status=enum_data(ProfileStatusEnum, db_profile.profile_status),
+            plans=[
+                PlanCreateResponse.construct(
+                    id=str(db_plan.id),
+                    plan_type=enum_data(PlanTypeEnum, db_plan.plan_type),
+                    notes=db_plan.notes,
+                    skill_id=cast(PlanSkill, db_plan.skill_snapshot).skill_id,
+                    skill_name=cast(PlanSkill, db_plan.skill_snapshot).skill_name,
+                    skill_type=enum_data(SkillTypeEnum, cast(PlanSkill, db_plan.skill_snapshot).skill_type),
+                    task=[
+                        TaskResponse.construct(
+                            id=data.id,
+                            description=data.description,
+                            status=enum_data(StatusEnum, data.status),
+                            duration=data.duration,
+                            spend_time=data.spend_time
+                        ) for data in cast(list[Task], db_plan.task) if not by_admin or data.status == StatusEnum.active
+                    ],
+                    start_date=db_plan.start_date,
+                    end_date=db_plan.end_date,
+                    status=enum_data(StatusEnum, db_plan.status)
+                ) for db_plan in db_plans
+            ]
+        )
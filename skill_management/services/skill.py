@@ -1,26 +1,40 @@
 from typing import cast, Any
 
 from beanie import PydanticObjectId
-from beanie.odm.enums import SortDirection
 from beanie.odm.operators.find.array import ElemMatch
 from fastapi import HTTPException, status, UploadFile
 from pymongo.results import DeleteResult
 
 from skill_management.enums import FileTypeEnum, SkillCategoryEnum, SkillTypeEnum, StatusEnum, UserStatusEnum, \
     ProfileStatusEnum
-from skill_management.models.enums import Status
 from skill_management.models.file import Files
 from skill_management.models.profile import Profiles
 from skill_management.models.skill import Skills
+from skill_management.repositories.counter import skill_ids
+from skill_management.repositories.plan import PlanRepository
 from skill_management.repositories.profile import ProfileRepository
 from skill_management.repositories.skill import SkillRepository
-from skill_management.schemas.base import ResponseEnumData
+from skill_management.schemas.base import enum_data
 from skill_management.schemas.file import FileResponse, SkillCertificateResponse
 from skill_management.schemas.profile import ProfileSkillView, ProfileView
 from skill_management.schemas.skill import CreateSkillDataRequest, ProfileSkill, CreateSkillDataResponse, \
     CreateSkillListDataResponse, CreateSkillDataAdminRequest, ProfileSkillDetailsResponse, ProfileSkillResponse, \
     GetSkillDataResponse, PaginatedSkillResponse, GetSkillDataResponseList, MasterSkillRequest
 from skill_management.services.file import FileService
+from skill_management.utils.sparse_fields import DocumentFields, SparseFields, sparse_construct, sparse_view
+
+"""
+Fields of the skills of a profile selectable with `fields=`, with the view fields they are read from
+"""
+PROFILE_SKILL_FIELDS: dict[str, DocumentFields] = {
+    **{
+        name: {"skills": {name}}
+        for name in ["skill_id", "skill_type", "skill_category", "skill_name", "status", "experience_year",
+                     "number_of_projects", "level", "training_duration", "achievements",
+                     "achievements_description", "certificate"]
+    },
+    "certificate_files": {}
+}
 
 
 class SkillService:
@@ -86,24 +100,21 @@ class SkillService:
                     }
                 )
             )
+            certificates = await Files.find(
+                {
+                    "owner": db_profile.id,
+                    "file_type": FileTypeEnum.certificate
+                }
+            ).to_list()
             skill_list = []
             for skill_ in db_profile.skills:
                 certificate_files = [
                     FileResponse(
-                        file_name=file,
+                        file_name=file.file_name,
                         url="/files/%s" % file.id,
-                        status=ResponseEnumData(
-                            id=file.status,
-                            name=StatusEnum(file.status).name
-                        )
-                    ) async for file in Files.find(
-                        {
-                            "owner": db_profile.id,
-                            "file_type": FileTypeEnum.certificate
-                        }
-                    )
+                        status=enum_data(StatusEnum, file.status)
+                    ) for file in certificates
                 ]
-                skill_status_object: Status = await Status.get(skill_.status.value)  # type: ignore
                 skill_list.append(
                     CreateSkillDataResponse(
                         skill_id=skill_.skill_id,
@@ -114,22 +125,13 @@ class SkillService:
                         training_duration=skill_.training_duration,
                         achievements=skill_.achievements,
                         certificate=skill_.certificate,
-                        status=ResponseEnumData(
-                            id=skill_status_object.id,
-                            name=(StatusEnum(skill_status_object.id)).name
-                        ),
+                        status=enum_data(StatusEnum, skill_.status),
                         achievements_description=skill_.achievements_description,
                         skill_category=[
-                            ResponseEnumData(
-                                id=skill_category_id,
-                                name=SkillCategoryEnum(skill_category_id).name
-                            )
+                            enum_data(SkillCategoryEnum, skill_category_id)
                             for skill_category_id in skill_.skill_category
                         ],
-                        skill_type=ResponseEnumData(
-                            id=skill_.skill_type,
-                            name=SkillTypeEnum(skill_.skill_type).name
-                        ),
+                        skill_type=enum_data(SkillTypeEnum, skill_.skill_type),
                         certificates_url=certificate_files
                     )
 
@@ -149,24 +151,21 @@ class SkillService:
                 )
             )
 
+            certificates = await Files.find(
+                {
+                    "owner": db_profile.id,
+                    "file_type": FileTypeEnum.certificate
+                }
+            ).to_list()
             skill_list = []
             for skill_ in db_profile.skills:
                 certificate_files = [
                     FileResponse(
                         file_name=file.file_name,
                         url="/files/%s" % file.id,
-                        status=ResponseEnumData(
-                            id=file.status,
-                            name=StatusEnum(file.status).name
-                        )
-                    ) async for file in Files.find(
-                        {
-                            "owner": db_profile.id,
-                            "file_type": FileTypeEnum.certificate
-                        }
-                    )
+                        status=enum_data(StatusEnum, file.status)
+                    ) for file in certificates
                 ]
-                skill_status_object: Status = await Status.get(skill_.status.value)  # type: ignore
                 skill_list.append(
                     CreateSkillDataResponse(
                         skill_id=skill_.skill_id,
@@ -177,23 +176,14 @@ class SkillService:
                         training_duration=skill_.training_duration,
                         achievements=skill_.achievements,
                         certificate=skill_.certificate,
-                        status=ResponseEnumData(
-                            id=skill_status_object.id,
-                            name=(StatusEnum(skill_status_object.id)).name
-                        ),
+                        status=enum_data(StatusEnum, skill_.status),
                         certificates_url=certificate_files,
                         achievements_description=skill_.achievements_description,
                         skill_category=[
-                            ResponseEnumData(
-                                id=skill_category_id,
-                                name=SkillCategoryEnum(skill_category_id).name
-                            )
+                            enum_data(SkillCategoryEnum, skill_category_id)
                             for skill_category_id in skill_.skill_category
                         ],
-                        skill_type=ResponseEnumData(
-                            id=skill_.skill_type,
-                            name=SkillTypeEnum(skill_.skill_type).name
-                        )
+                        skill_type=enum_data(SkillTypeEnum, skill_.skill_type)
                     )
 
                 )
@@ -259,24 +249,21 @@ class SkillService:
                     }
                 )
             )
+            certificates = await Files.find(
+                {
+                    "owner": db_profile.id,
+                    "file_type": FileTypeEnum.certificate
+                }
+            ).to_list()
             skill_list = []
             for skill_ in db_profile.skills:
                 certificate_files = [
                     FileResponse(
-                        file_name=file,
+                        file_name=file.file_name,
                         url="/files/%s" % file.id,
-                        status=ResponseEnumData(
-                            id=file.status,
-                            name=StatusEnum(file.status).name
-                        )
-                    ) async for file in Files.find(
-                        {
-                            "owner": db_profile.id,
-                            "file_type": FileTypeEnum.certificate
-                        }
-                    )
+                        status=enum_data(StatusEnum, file.status)
+                    ) for file in certificates
                 ]
-                skill_status_object: Status = await Status.get(skill_.status.value)  # type: ignore
                 skill_list.append(
                     CreateSkillDataResponse(
                         skill_id=skill_.skill_id,
@@ -287,22 +274,13 @@ class SkillService:
                         training_duration=skill_.training_duration,
                         achievements=skill_.achievements,
                         certificate=skill_.certificate,
-                        status=ResponseEnumData(
-                            id=skill_status_object.id,
-                            name=(StatusEnum(skill_status_object.id)).name
-                        ),
+                        status=enum_data(StatusEnum, skill_.status),
                         achievements_description=skill_.achievements_description,
                         skill_category=[
-                            ResponseEnumData(
-                                id=skill_category_id,
-                                name=SkillCategoryEnum(skill_category_id).name
-                            )
+                            enum_data(SkillCategoryEnum, skill_category_id)
                             for skill_category_id in skill_.skill_category
                         ],
-                        skill_type=ResponseEnumData(
-                            id=skill_.skill_type,
-                            name=SkillTypeEnum(skill_.skill_type).name
-                        ),
+                        skill_type=enum_data(SkillTypeEnum, skill_.skill_type),
                         certificates_url=certificate_files
                     )
 
@@ -323,25 +301,22 @@ class SkillService:
                 )
             )
 
+            certificates = await Files.find(
+                {
+                    "owner": db_profile.id,
+                    "file_type": FileTypeEnum.certificate
+                }
+            ).to_list()
             skill_list = []
             for skill_ in db_profile.skills:
                 certificate_files = [
                     FileResponse(
-                        file_name=file,
+                        file_name=file.file_name,
                         url="/files/%s" % file.id,
-                        status=ResponseEnumData(
-                            id=file.status,
-                            name=StatusEnum(file.status).name
-                        )
+                        status=enum_data(StatusEnum, file.status)
 
-                    ) async for file in Files.find(
-                        {
-                            "owner": db_profile.id,
-                            "file_type": FileTypeEnum.certificate
-                        }
-                    )
+                    ) for file in certificates
                 ]
-                skill_status_object: Status = await Status.get(skill_.status.value)  # type: ignore
                 skill_list.append(
                     CreateSkillDataResponse(
                         skill_id=skill_.skill_id,
@@ -352,22 +327,13 @@ class SkillService:
                         training_duration=skill_.training_duration,
                         achievements=skill_.achievements,
                         certificate=skill_.certificate,
-                        status=ResponseEnumData(
-                            id=skill_status_object.id,
-                            name=(StatusEnum(skill_status_object.id)).name
-                        ),
+                        status=enum_data(StatusEnum, skill_.status),
                         achievements_description=skill_.achievements_description,
                         skill_category=[
-                            ResponseEnumData(
-                                id=skill_category_id,
-                                name=SkillCategoryEnum(skill_category_id).name
-                            )
+                            enum_data(SkillCategoryEnum, skill_category_id)
                             for skill_category_id in skill_.skill_category
                         ],
-                        skill_type=ResponseEnumData(
-                            id=skill_.skill_type,
-                            name=SkillTypeEnum(skill_.skill_type).name
-                        ),
+                        skill_type=enum_data(SkillTypeEnum, skill_.skill_type),
                         certificates_url=certificate_files
                     )
 
@@ -421,60 +387,58 @@ class SkillService:
         return SkillCertificateResponse(succeed_upload_list=successful_files, failed_upload_list=failed_files)
 
     @staticmethod
-    async def get_skill_details_by_admin(profile_id: PydanticObjectId) -> ProfileSkillDetailsResponse:
+    async def get_skill_details_by_admin(profile_id: PydanticObjectId,
+                                         fields: SparseFields | None = None) -> ProfileSkillDetailsResponse:
         query = {
             '_id': profile_id,
         }
+        view: type[ProfileSkillView] = ProfileSkillView
+        if fields is not None:
+            view = sparse_view(
+                ProfileSkillView,
+                fields.document_fields(PROFILE_SKILL_FIELDS, {"id": None, "skills": {"status"}}))
         db_profiles = await Profiles.find(
             query,
-            projection_model=ProfileSkillView
+            projection_model=view
         ).first_or_none()
         if db_profiles is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Must provide a valid profile id")
-        certificate_files = await Files.find(
-            {
-                "file_type": FileTypeEnum.certificate,
-                "owner": profile_id,
-                "status": {"$in": [StatusEnum.active, StatusEnum.cancel]}
-            }
-        ).to_list()
+        certificate_files: list[Files] = []
+        if fields is None or "certificate_files" in fields:
+            certificate_files = await Files.find(
+                {
+                    "file_type": FileTypeEnum.certificate,
+                    "owner": profile_id,
+                    "status": {"$in": [StatusEnum.active, StatusEnum.cancel]}
+                }
+            ).to_list()
 
-        return ProfileSkillDetailsResponse(
+        return ProfileSkillDetailsResponse.construct(
             skills=[
-                ProfileSkillResponse(
-                    skill_id=data.skill_id,
-                    skill_type=ResponseEnumData(
-                        id=data.skill_type,
-                        name=SkillTypeEnum(data.skill_type).name
-                    ),
-                    skill_category=[
-                        ResponseEnumData(
-                            id=category_data,
-                            name=SkillTypeEnum(category_data).name
-                        ) for category_data in data.skill_category
+                sparse_construct(
+                    ProfileSkillResponse, fields,
+                    skill_id=lambda: data.skill_id,
+                    skill_type=lambda: enum_data(SkillTypeEnum, data.skill_type),
+                    skill_category=lambda: [
+                        enum_data(SkillTypeEnum, category_data) for category_data in data.skill_category
                     ],
-                    skill_name=data.skill_name,
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    ),
-                    certificate_files=[
-                        FileResponse(
+                    skill_name=lambda: data.skill_name,
+                    status=lambda: enum_data(StatusEnum, data.status),
+                    certificate_files=lambda: [
+                        FileResponse.construct(
                             file_name=file_data.file_name,
                             url="/admin/files/response/" + str(file_data.id),
-                            status=ResponseEnumData(
-                                id=file_data.status,
-                                name=StatusEnum(file_data.status).name
-                            )
+                            status=enum_data(StatusEnum, file_data.status)
                         ) for file_data in certificate_files
                     ],
-                    experience_year=data.experience_year,
-                    number_of_projects=data.number_of_projects,
-                    level=data.level,
-                    training_duration=data.training_duration,
-                    achievements=data.achievements,
-                    achievements_description=data.achievements_description, certificate=data.certificate
+                    experience_year=lambda: data.experience_year,
+                    number_of_projects=lambda: data.number_of_projects,
+                    level=lambda: data.level,
+                    training_duration=lambda: data.training_duration,
+                    achievements=lambda: data.achievements,
+                    achievements_description=lambda: data.achievements_description,
+                    certificate=lambda: data.certificate
                 )
                 for data in db_profiles.skills if data.status in [
                     StatusEnum.active, StatusEnum.cancel
@@ -482,14 +446,21 @@ class SkillService:
             ]
         )
 
-    async def get_skill_details_by_user(self, email: str) -> ProfileSkillDetailsResponse:
+    async def get_skill_details_by_user(self, email: str,
+                                        fields: SparseFields | None = None) -> ProfileSkillDetailsResponse:
         query = {
             'user_id': email,
         }
+        view: type[ProfileSkillView] = ProfileSkillView
+        if fields is not None:
+            view = sparse_view(
+                ProfileSkillView,
+                fields.document_fields(PROFILE_SKILL_FIELDS,
+                                       {"id": None, "skills": {"status"}, "profile_status": None}))
         db_profiles: ProfileSkillView = cast(
             ProfileSkillView, await Profiles.find(
                 query,
-                projection_model=ProfileSkillView
+                projection_model=view
             ).first_or_none())
         if db_profiles is None:
             raise HTTPException(
@@ -501,49 +472,41 @@ class SkillService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Must be an active profile"
             )
-        certificate_files = await Files.find(
-            {
-                "file_type": FileTypeEnum.certificate,
-                "owner": db_profiles.id,
-                "status": StatusEnum.active
-            }
-        ).to_list()
+        certificate_files: list[Files] = []
+        if fields is None or "certificate_files" in fields:
+            certificate_files = await Files.find(
+                {
+                    "file_type": FileTypeEnum.certificate,
+                    "owner": db_profiles.id,
+                    "status": StatusEnum.active
+                }
+            ).to_list()
 
-        return ProfileSkillDetailsResponse(
+        return ProfileSkillDetailsResponse.construct(
             skills=[
-                ProfileSkillResponse(
-                    skill_id=data.skill_id,
-                    skill_type=ResponseEnumData(
-                        id=data.skill_type,
-                        name=SkillTypeEnum(data.skill_type).name
-                    ),
-                    skill_category=[
-                        ResponseEnumData(
-                            id=category_data,
-                            name=SkillTypeEnum(category_data).name
-                        ) for category_data in data.skill_category
+                sparse_construct(
+                    ProfileSkillResponse, fields,
+                    skill_id=lambda: data.skill_id,
+                    skill_type=lambda: enum_data(SkillTypeEnum, data.skill_type),
+                    skill_category=lambda: [
+                        enum_data(SkillTypeEnum, category_data) for category_data in data.skill_category
                     ],
-                    skill_name=data.skill_name,
-                    status=ResponseEnumData(
-                        id=data.status,
-                        name=StatusEnum(data.status).name
-                    ),
-                    certificate_files=[
-                        FileResponse(
+                    skill_name=lambda: data.skill_name,
+                    status=lambda: enum_data(StatusEnum, data.status),
+                    certificate_files=lambda: [
+                        FileResponse.construct(
                             file_name=file_data.file_name,
                             url="/profile/files/response/" + str(file_data.id),
-                            status=ResponseEnumData(
-                                id=file_data.status,
-                                name=StatusEnum(file_data.status).name
-                            )
+                            status=enum_data(StatusEnum, file_data.status)
                         ) for file_data in certificate_files
                     ],
-                    experience_year=data.experience_year,
-                    number_of_projects=data.number_of_projects,
-                    level=data.level,
-                    training_duration=data.training_duration,
-                    achievements=data.achievements,
-                    achievements_description=data.achievements_description, certificate=data.certificate
+                    experience_year=lambda: data.experience_year,
+                    number_of_projects=lambda: data.number_of_projects,
+                    level=lambda: data.level,
+                    training_duration=lambda: data.training_duration,
+                    achievements=lambda: data.achievements,
+                    achievements_description=lambda: data.achievements_description,
+                    certificate=lambda: data.certificate
                 )
                 for data in db_profiles.skills if data.status == StatusEnum.active
             ]
@@ -582,20 +545,16 @@ class SkillService:
         db_skills = await Skills.find(query).skip((page_number - 1) * page_size).limit(page_size).to_list()
         count = await (Skills.find(query).count())
         response = [
-            GetSkillDataResponse(
+            GetSkillDataResponse.construct(
                 skill_id=db_skill.id,
-                skill_type=ResponseEnumData(id=db_skill.skill_type,
-                                            name=SkillTypeEnum(db_skill.skill_type).name),
+                skill_type=enum_data(SkillTypeEnum, db_skill.skill_type),
                 skill_category=[
-                    ResponseEnumData(
-                        id=category_data,
-                        name=SkillCategoryEnum(category_data).name
-                    ) for category_data in db_skill.skill_categories
+                    enum_data(SkillCategoryEnum, category_data) for category_data in db_skill.skill_categories
                 ],
                 skill_name=db_skill.skill_name
             )
             for db_skill in db_skills]
-        return PaginatedSkillResponse(
+        return PaginatedSkillResponse.construct(
 
             previous_page=page_number - 1 if page_number > 1 else None,
             next_page=page_number + 1 if page_number * page_size < count else None,
@@ -608,15 +567,11 @@ class SkillService:
     @staticmethod
     async def get_skill_details(skill_id: int) -> GetSkillDataResponse:
         db_skill = cast(Skills, await Skills.find({"_id": skill_id}).first_or_none())
-        return GetSkillDataResponse(
+        return GetSkillDataResponse.construct(
             skill_id=db_skill.id,
-            skill_type=ResponseEnumData(id=db_skill.skill_type,
-                                        name=SkillTypeEnum(db_skill.skill_type).name),
+            skill_type=enum_data(SkillTypeEnum, db_skill.skill_type),
             skill_category=[
-                ResponseEnumData(
-                    id=category_data,
-                    name=SkillCategoryEnum(category_data).name
-                ) for category_data in db_skill.skill_categories
+                enum_data(SkillCategoryEnum, category_data) for category_data in db_skill.skill_categories
             ],
             skill_name=db_skill.skill_name
         )
@@ -624,16 +579,12 @@ class SkillService:
     @staticmethod
     async def get_skill_list() -> GetSkillDataResponseList:
         db_skills = await Skills.find().to_list()
-        response = GetSkillDataResponseList(skills=[
-            GetSkillDataResponse(
+        response = GetSkillDataResponseList.construct(skills=[
+            GetSkillDataResponse.construct(
                 skill_id=db_skill.id,
-                skill_type=ResponseEnumData(id=db_skill.skill_type,
-                                            name=SkillTypeEnum(db_skill.skill_type).name),
+                skill_type=enum_data(SkillTypeEnum, db_skill.skill_type),
                 skill_category=[
-                    ResponseEnumData(
-                        id=category_data,
-                        name=SkillCategoryEnum(category_data).name
-                    ) for category_data in db_skill.skill_categories
+                    enum_data(SkillCategoryEnum, category_data) for category_data in db_skill.skill_categories
                 ],
                 skill_name=db_skill.skill_name
             )
@@ -644,10 +595,9 @@ class SkillService:
     async def create_or_update_skill(skill_request: MasterSkillRequest) -> GetSkillDataResponse:
         skill_id = skill_request.skill_id
         db_skill = cast(Skills, await Skills.find({"_id": skill_id}).first_or_none())
-        max_id = await Skills.find().sort([("_id", cast(SortDirection, -1))]).first_or_none()
         if db_skill is None:
             db_skill = Skills(
-                id=max_id.id + 1 if max_id is not None else 1,
+                id=await skill_ids.next(),
                 skill_type=skill_request.skill_type,
                 skill_categories=skill_request.skill_categories,
                 skill_name=skill_request.skill_name
@@ -664,16 +614,13 @@ class SkillService:
                 if skill_request.skill_name is not None \
                 else db_skill.skill_name
             await db_skill.save()
+            await PlanRepository().update_skill_snapshots(db_skill)
 
         return GetSkillDataResponse(
             skill_id=db_skill.id,
-            skill_type=ResponseEnumData(id=db_skill.skill_type,
-                                        name=SkillTypeEnum(db_skill.skill_type).name),
+            skill_type=enum_data(SkillTypeEnum, db_skill.skill_type),
             skill_category=[
-                ResponseEnumData(
-                    id=category_data,
-                    name=SkillCategoryEnum(category_data).name
-                ) for category_data in db_skill.skill_categories
+                enum_data(SkillCategoryEnum, category_data) for category_data in db_skill.skill_categories
             ],
             skill_name=db_skill.skill_name
         )
@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+from typing import Any, Type
+
+from beanie import Document
+
+from skill_management.models.file import Files
+from skill_management.models.plan import Plans
+from skill_management.models.profile import Profiles
+from skill_management.utils.logger import get_logger
+
+logger = get_logger()
+
+"""
+Date fields stored as ISO strings before they were stored as native dates, per collection:
+the fields of the documents and, per array of subdocuments, the fields of its elements.
+"""
+DATE_FIELDS: list[tuple[Type[Document], list[str], dict[str, list[str]]]] = [
+    (Plans, ["start_date", "end_date"], {}),
+    (Profiles, ["personal_detail.date_of_birth", "designation.start_date", "designation.end_date"],
+     {"experiences": ["start_date", "end_date"]}),
+    (Files, ["created_at"], {}),
+]
+
+
+def to_date(path: str) -> dict[str, Any]:
+    """
+    Aggregation expression converting the value at path when it is still a string, any other value is kept.
+    """
+    return {"$cond": [{"$eq": [{"$type": path}, "string"]}, {"$dateFromString": {"dateString": path}}, path]}
+
+
+def string_filter(fields: list[str], arrays: dict[str, list[str]]) -> dict[str, Any]:
+    conditions = [{field: {"$type": "string"}} for field in fields]
+    conditions += [{f"{array}.{field}": {"$type": "string"}} for array, array_fields in arrays.items()
+                   for field in array_fields]
+    return {"$or": conditions}
+
+
+def converted_fields(path: str, fields: list[str]) -> dict[str, Any]:
+    """
+    Expressions of `fields`, relative to the document at `path`, with their string values converted.
+    The fields of a subdocument are merged into it, and only when it is one: a null or missing parent
+    is kept as it is instead of becoming a subdocument holding the converted fields.
+    """
+    values: dict[str, Any] = {}
+    children: dict[str, list[str]] = {}
+    for field in fields:
+        name, _, child_field = field.partition(".")
+        if child_field:
+            children.setdefault(name, []).append(child_field)
+        else:
+            values[name] = to_date(f"{path}{name}")
+    for name, child_fields in children.items():
+        parent = f"{path}{name}"
+        values[name] = {"$cond": [
+            {"$eq": [{"$type": parent}, "object"]},
+            {"$mergeObjects": [parent, converted_fields(f"{parent}.", child_fields)]},
+            parent
+        ]}
+    return values
+
+
+def migration_pipeline(fields: list[str], arrays: dict[str, list[str]]) -> list[dict[str, Any]]:
+    set_fields = converted_fields("$", fields)
+    for array, array_fields in arrays.items():
+        set_fields[array] = {"$cond": [
+            {"$isArray": f"${array}"},
+            {"$map": {
+                "input": f"${array}",
+                "as": "item",
+                "in": {"$mergeObjects": ["$$item", converted_fields("$$item.", array_fields)]}
+            }},
+            f"${array}"
+        ]}
+    return [{"$set": set_fields}]
+
+
+async def migrate_collection(document_class: Type[Document], fields: list[str], arrays: dict[str, list[str]],
+                             batch_size: int) -> int:
+    """
+    Converts the documents batch by batch, each batch being one update with a pipeline on a bounded list
+    of ids, so that the migration can run while the services are serving requests. The documents keep
+    their revision id: only the representation of their values changes.
+    """
+    collection = document_class.get_motor_collection()
+    query = string_filter(fields, arrays)
+    pipeline = migration_pipeline(fields, arrays)
+    migrated = 0
+    while True:
+        ids = [document["_id"] async for document in collection.find(query, {"_id": 1}).limit(batch_size)]
+        if not ids:
+            return migrated
+        result = await collection.update_many({"_id": {"$in": ids}}, pipeline)
+        migrated += result.modified_count
+        if result.modified_count == 0:
+            logger.warning(f"{document_class.get_collection_name()}: {len(ids)} documents could not be migrated")
+            return migrated
+
+
+async def migrate_dates(batch_size: int, dry_run: bool = False) -> None:
+    """
+    With `dry_run`, only counts the documents of each collection that still have dates stored as strings.
+    """
+    for document_class, fields, arrays in DATE_FIELDS:
+        if dry_run:
+            count = await document_class.get_motor_collection().count_documents(string_filter(fields, arrays))
+            logger.info(f"Would migrate the dates of {count} {document_class.get_collection_name()} documents")
+            continue
+        migrated = await migrate_collection(document_class, fields, arrays, batch_size)
+        logger.info(f"Migrated the dates of {migrated} {document_class.get_collection_name()} documents")
+
+
+async def migrate(batch_size: int, dry_run: bool) -> None:
+    from skill_management.config.config import close_database, initiate_database
+
+    await initiate_database()
+    try:
+        await migrate_dates(batch_size, dry_run)
+    finally:
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert the dates stored as strings to native dates")
+    parser.add_argument("--batch-size", type=int, default=500, help="documents converted per update")
+    parser.add_argument("--dry-run", action="store_true", help="only count the documents to migrate")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
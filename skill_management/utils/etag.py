@@ -0,0 +1,70 @@
+import uuid
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from skill_management.enums import ProfileStatusEnum
+from skill_management.repositories.profile import ProfileRepository
+from skill_management.utils.trusted_response import TrustedResponse
+
+"""
+The bodies are per user: browsers may keep them, but must revalidate them before each use
+"""
+CACHE_CONTROL = "private, no-cache"
+
+
+def revision_etag(revision_id: uuid.UUID) -> str:
+    """
+    Weak: a revision always gives the same content, not necessarily the same bytes from one release
+    to the next.
+    """
+    return f'W/"{revision_id.hex}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match uses the weak comparison.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def if_match_revision(if_match: str | None) -> uuid.UUID | None:
+    """
+    Revision an update must still find, from the If-Match header holding the ETag of a previous read:
+    None, for an unconditional update, without the header or with "*". The revision ETags being weak,
+    the weak comparison is used; any other tag can not match a revision and fails with a 412.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return uuid.UUID(hex=if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED,
+                            detail="If-Match must hold the ETag of the profile")
+
+
+async def revision_response(request: Request, query: dict[str, Any], build: Callable[[], Awaitable[Any]],
+                            active_only: bool = False) -> Response:
+    """
+    Response of a read of the profile matching `query`, validated by the ETag of its revision, which
+    every write of the profile and of its files renews. The revision is read first, alone, by
+    projection: a client already holding it gets a 304 without the profile being loaded, otherwise
+    the body is built by `build`. A write landing in between only makes the body newer than its ETag,
+    which is refreshed on the next request. Profiles stored without a revision, and the profiles
+    `active_only` reads reject, are served without ETag.
+    """
+    revision = await ProfileRepository().get_revision(query)
+    if revision is None or revision.revision_id is None or (
+            active_only and revision.profile_status in [ProfileStatusEnum.inactive, ProfileStatusEnum.delete]):
+        return TrustedResponse(await build())
+    headers = {"ETag": revision_etag(revision.revision_id), "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return TrustedResponse(await build(), headers=headers)
@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from anyio import to_thread
+
+from skill_management.enums import StatusEnum
+from skill_management.models.file import Files
+from skill_management.utils.logger import get_logger
+from skill_management.utils.scheduler import PeriodicJob
+
+logger = get_logger()
+
+
+class FileGcReport:
+    __slots__ = ["files_removed", "records_purged", "orphans_removed", "bytes_reclaimed"]
+
+    def __init__(self) -> None:
+        self.files_removed = 0
+        self.records_purged = 0
+        self.orphans_removed = 0
+        self.bytes_reclaimed = 0
+
+    def summary(self) -> str:
+        return f"{self.files_removed} deleted files and {self.orphans_removed} orphaned files removed, " \
+               f"{self.records_purged} records purged, {self.bytes_reclaimed / 1000:.1f}KB reclaimed"
+
+
+def remove_file(path: str, dry_run: bool) -> int:
+    """
+    Size of the removed file, 0 when it was already gone.
+    """
+    try:
+        size = os.path.getsize(path)
+        if not dry_run:
+            os.remove(path)
+    except FileNotFoundError:
+        return 0
+    return size
+
+
+def list_files(directory: str, modified_before: float) -> list[str]:
+    """
+    Uploaded files not modified since modified_before, the newer ones may still be waiting for
+    their Files record to be inserted.
+    """
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries
+                if entry.is_file() and not entry.name.startswith(".") and entry.stat().st_mtime < modified_before]
+
+
+class FileGarbageCollector:
+    """
+    Removes from disk, batch by batch, the bytes of the files deleted for longer than `retention_days`
+    and purges their records, then the uploaded files older than the retention window that no Files
+    record names. Files deleted before deleted_at existed get it on their first run, so their retention
+    window starts then. Without an upload directory of its own, nothing is treated as orphaned.
+    """
+    __slots__ = ["upload_path", "retention_days", "batch_size", "dry_run"]
+
+    def __init__(self, upload_path: str | None, retention_days: int, batch_size: int, dry_run: bool = False) -> None:
+        self.upload_path = upload_path
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+
+    async def run(self, now: datetime) -> FileGcReport:
+        report = FileGcReport()
+        cutoff = now - timedelta(days=self.retention_days)
+        if not self.dry_run:
+            await Files.get_motor_collection().update_many({"status": StatusEnum.delete, "deleted_at": None},
+                                                           {"$set": {"deleted_at": now}})
+        await self.collect_deleted(cutoff, report)
+        if self.upload_path is not None and os.path.isdir(self.upload_path):
+            await self.collect_orphans(cutoff, self.upload_path, report)
+        return report
+
+    async def names_in_use(self, file_names: list[str], query: dict[str, Any]) -> set[str]:
+        cursor = Files.get_motor_collection().find({"file_name": {"$in": file_names}, **query}, {"file_name": 1})
+        return {document["file_name"] async for document in cursor}
+
+    async def collect_deleted(self, cutoff: datetime, report: FileGcReport) -> None:
+        collection = Files.get_motor_collection()
+        query: dict[str, Any] = {"status": StatusEnum.delete, "deleted_at": {"$lte": cutoff}}
+        while True:
+            documents = await collection.find(query, {"file_name": 1, "location": 1}).sort("_id").limit(
+                self.batch_size).to_list(None)
+            if not documents:
+                return
+            """
+            A name freed on disk can be taken again by a later upload, whose bytes must be kept
+            """
+            in_use = await self.names_in_use([document["file_name"] for document in documents],
+                                             {"status": {"$ne": StatusEnum.delete}})
+            for document in documents:
+                if document["file_name"] in in_use:
+                    continue
+                size = await to_thread.run_sync(remove_file, document["location"] + document["file_name"],
+                                                self.dry_run)
+                if size:
+                    report.files_removed += 1
+                    report.bytes_reclaimed += size
+            ids = [document["_id"] for document in documents]
+            if self.dry_run:
+                report.records_purged += len(ids)
+            else:
+                report.records_purged += (await collection.delete_many({"_id": {"$in": ids}})).deleted_count
+            query["_id"] = {"$gt": ids[-1]}
+
+    async def collect_orphans(self, cutoff: datetime, upload_path: str, report: FileGcReport) -> None:
+        file_names = await to_thread.run_sync(list_files, upload_path, cutoff.timestamp())
+        for start in range(0, len(file_names), self.batch_size):
+            batch = file_names[start:start + self.batch_size]
+            known = await self.names_in_use(batch, {})
+            for file_name in batch:
+                if file_name in known:
+                    continue
+                size = await to_thread.run_sync(remove_file, upload_path + file_name, self.dry_run)
+                report.orphans_removed += 1
+                report.bytes_reclaimed += size
+
+
+def get_file_garbage_collector(dry_run: bool = False) -> FileGarbageCollector:
+    upload_path = os.getenv("FILE_UPLOAD_PATH")
+    return FileGarbageCollector(upload_path=os.getcwd() + upload_path if upload_path else None,
+                                retention_days=int(os.getenv("FILE_GC_RETENTION_DAYS", default=30)),
+                                batch_size=int(os.getenv("FILE_GC_BATCH_SIZE", default=500)),
+                                dry_run=dry_run)
+
+
+async def collect_files() -> None:
+    report = await get_file_garbage_collector().run(datetime.now(timezone.utc))
+    logger.info(f"File garbage collection: {report.summary()}")
+
+
+file_gc_scheduler = PeriodicJob("file-gc",
+                                interval=int(os.getenv("FILE_GC_INTERVAL", default=86400)),
+                                lock_timeout=int(os.getenv("FILE_GC_LOCK_TIMEOUT", default=3600)),
+                                job=collect_files)
+
+
+async def collect(dry_run: bool) -> None:
+    from skill_management.config.config import close_database, initiate_database
+
+    await initiate_database()
+    try:
+        report = await get_file_garbage_collector(dry_run).run(datetime.now(timezone.utc))
+        print(("Would be: " if dry_run else "") + report.summary())
+    finally:
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove the deleted and orphaned uploaded files")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    args = parser.parse_args()
+    asyncio.run(collect(args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,91 +1,217 @@
+import argparse
+import asyncio
 import csv
+import enum
+import hashlib
+import os
+import time
+import uuid
+from typing import Any, Type
+
+import orjson
+from aioredis import Redis
+from beanie import Document
+from pymongo import UpdateOne
 
 from skill_management.enums import PlanTypeEnum, SkillTypeEnum, StatusEnum, UserStatusEnum, SkillCategoryEnum, \
     DesignationStatusEnum, GenderEnum, FileTypeEnum, ProfileStatusEnum
 from skill_management.models.designation import Designations
-from skill_management.models.enums import EnumInitializer, PlanType, Status, UserStatus, SkillCategory, SkillType, \
+from skill_management.models.enums import SeedState, PlanType, Status, UserStatus, SkillCategory, SkillType, \
     DesignationStatus, Gender, FileType, ProfileStatus
 from skill_management.models.skill import Skills
+from skill_management.repositories.counter import CounterRepository, IdAllocator, designation_ids, skill_ids
+from skill_management.repositories.plan import PlanRepository
+from skill_management.utils.logger import get_logger
 
+logger = get_logger()
 
-async def initialize_database() -> None:
-    initializer_marker = await EnumInitializer.find({}).to_list()
-    if not initializer_marker:
-        enum_initializer = EnumInitializer(is_uploaded=False)
-        await enum_initializer.insert()
-    else:
-        enum_initializer = initializer_marker[0]
-    if enum_initializer.is_uploaded:
-        return
-    """
-    Insert Plan_Type Data
-    """
-    await PlanType.insert_many([PlanType(id=data.value, name=data.name) for data in PlanTypeEnum])
+DESIGNATIONS_CSV = "skill_management/static/data/designations.csv"
+SKILLS_CSV = "skill_management/static/data/skills.csv"
+SEED_LOCK_KEY = "skill_management:seed-lock"
 
-    """
-    Insert Status Data
-    """
-    await Status.insert_many([Status(id=data.value, name=data.name) for data in StatusEnum])
+"""
+Deletes the lock only if it is still the one taken by this process
+"""
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
-    """
-    Insert UserStatus Data
-    """
-    await UserStatus.insert_many([UserStatus(id=data.value, name=data.name) for data in UserStatusEnum])
+ENUM_SOURCES: list[tuple[Type[Document], Type[enum.IntEnum]]] = [
+    (PlanType, PlanTypeEnum),
+    (Status, StatusEnum),
+    (UserStatus, UserStatusEnum),
+    (SkillCategory, SkillCategoryEnum),
+    (SkillType, SkillTypeEnum),
+    (DesignationStatus, DesignationStatusEnum),
+    (Gender, GenderEnum),
+    (FileType, FileTypeEnum),
+    (ProfileStatus, ProfileStatusEnum),
+]
 
-    """
-    Insert SkillCategory Data
-    """
-    await SkillCategory.insert_many([SkillCategory(id=data.value, name=data.name) for data in SkillCategoryEnum])
+"""
+Allocators of the ids of documents created through the API, which must not reuse the ids of the csv files
+"""
+ID_ALLOCATORS: dict[Type[Document], IdAllocator] = {
+    Skills: skill_ids,
+    Designations: designation_ids,
+}
 
-    """
-    Insert SkillType Data
-    """
-    await SkillType.insert_many([SkillType(id=data.value, name=data.name) for data in SkillTypeEnum])
 
-    """
-    Insert DesignationStatus Data
-    """
-    await DesignationStatus.insert_many(
-        [DesignationStatus(id=data.value, name=data.name) for data in DesignationStatusEnum])
+def enum_rows(enum_class: Type[enum.IntEnum]) -> list[dict[str, Any]]:
+    return [{"_id": data.value, "name": data.name} for data in enum_class]
 
-    """
-    Insert Gender Data
-    """
-    await Gender.insert_many([Gender(id=data.value, name=data.name) for data in GenderEnum])
 
-    """
-    Insert FileType Data
-    """
-    await FileType.insert_many([FileType(id=data.value, name=data.name) for data in FileTypeEnum])
+def designation_rows() -> list[dict[str, Any]]:
+    with open(DESIGNATIONS_CSV, 'r') as file:
+        return [{"_id": int(row["id"]), "designation": row["designation"]} for row in csv.DictReader(file)]
 
-    """
-    Insert ProfileStatus data
-    """
-    await ProfileStatus.insert_many([ProfileStatus(id=data.value, name=data.name) for data in ProfileStatusEnum])
 
-    """
-    Insert Designation
-    """
-    with open("skill_management/static/data/designations.csv", 'r') as file:
-        csv_reader = csv.DictReader(file)
-        designation_data = []
-        for row in csv_reader:
-            designation_data.append(Designations.parse_obj(row))
-        await Designations.insert_many(designation_data)
+def skill_rows() -> list[dict[str, Any]]:
+    with open(SKILLS_CSV, 'r') as file:
+        return [
+            {
+                "_id": int(row["id"]),
+                "skill_name": row["skill_name"],
+                "skill_type": int(row["skill_type"]),
+                "skill_categories": [int(data) for data in row["skill_categories"].split(",")]
+            }
+            for row in csv.DictReader(file)
+        ]
 
-    """
-    Insert Designation
-    """
-    with open("skill_management/static/data/skills.csv", 'r') as file:
-        csv_reader = csv.DictReader(file)
-        skill_data = []
-        for row in csv_reader:
-            row['skill_categories'] = [int(data) for data in row['skill_categories'].split(",")]
-            skill_data.append(Skills.parse_obj(row))
-        await Skills.insert_many(skill_data)
 
+def seed_sources() -> list[tuple[Type[Document], list[dict[str, Any]]]]:
     """
-    Change Initiating Value
+    Every collection of master data with the documents it must contain, as stored in Mongo.
     """
-    enum_initializer.is_uploaded = True
-    await enum_initializer.save()
+    sources = [(document_class, enum_rows(enum_class)) for document_class, enum_class in ENUM_SOURCES]
+    sources.append((Designations, designation_rows()))
+    sources.append((Skills, skill_rows()))
+    return sources
+
+
+def source_hash(rows: list[dict[str, Any]]) -> str:
+    return hashlib.sha256(orjson.dumps(rows, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def row_hash(row: dict[str, Any]) -> str:
+    return hashlib.sha256(orjson.dumps(row, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+async def apply_source(document_class: Type[Document], rows: list[dict[str, Any]],
+                       seeded_rows: dict[str, str]) -> tuple[int, list[dict[str, Any]]]:
+    """
+    Writes the rows the seed still owns, in one unordered bulk write. `seeded_rows` holds the hash of
+    each document as it was last seeded: rows never seeded are inserted if their id is free, documents
+    still as they were seeded are updated to the source. Documents edited or deleted through the API
+    since they were seeded are left as they are, as are the documents that are no longer in the source,
+    they may be referenced by profiles. `seeded_rows` is updated with the rows written; returns their
+    number and the rows updated in place.
+    """
+    collection = document_class.get_motor_collection()
+    existing = {
+        document["_id"]: document
+        async for document in collection.find({"_id": {"$in": [row["_id"] for row in rows]}})
+    }
+    operations = []
+    updated_rows = []
+    for row in rows:
+        key = str(row["_id"])
+        fields = {name: value for name, value in row.items() if name != "_id"}
+        document = existing.get(row["_id"])
+        if document is None:
+            if key in seeded_rows:
+                continue
+            operations.append(UpdateOne({"_id": row["_id"]}, {"$setOnInsert": fields}, upsert=True))
+        else:
+            stored_row = {name: document.get(name) for name in row}
+            if stored_row == row:
+                seeded_rows[key] = row_hash(row)
+                continue
+            if seeded_rows.get(key) != row_hash(stored_row):
+                continue
+            """
+            Only if the document is not edited in between
+            """
+            operations.append(UpdateOne({"_id": row["_id"], **{name: document.get(name) for name in fields}},
+                                        {"$set": fields}))
+            updated_rows.append(row)
+        seeded_rows[key] = row_hash(row)
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+    return len(operations), updated_rows
+
+
+async def seed_master_data(force: bool = False) -> None:
+    """
+    Only the sources whose content hash changed since the last run are compared with the database.
+    """
+    seed_states = {state.id: state for state in await SeedState.find({}).to_list()}
+    for document_class, rows in seed_sources():
+        name = document_class.get_collection_name()
+        current_hash = source_hash(rows)
+        state = seed_states.get(name)
+        if not force and state is not None and state.source_hash == current_hash:
+            continue
+        seeded_rows = dict(state.rows) if state is not None else {}
+        changed, updated_rows = await apply_source(document_class, rows, seeded_rows)
+        if document_class is Skills:
+            """
+            Plans show the skill from their snapshot of it
+            """
+            for row in updated_rows:
+                await PlanRepository().update_skill_snapshots(Skills.parse_obj(row))
+        allocator = ID_ALLOCATORS.get(document_class)
+        if allocator is not None and rows:
+            await CounterRepository().raise_to(allocator.name, max(int(row["_id"]) for row in rows))
+        await SeedState.get_motor_collection().update_one(
+            {"_id": name}, {"$set": {"source_hash": current_hash, "rows": seeded_rows}}, upsert=True)
+        logger.info(f"Seeded {name}: {changed} of {len(rows)} documents written")
+
+
+async def initialize_database(redis: Redis, force: bool = False) -> None:
+    """
+    Seeds the master data under a Redis lock, so that a single worker of the deployment does it;
+    the other workers wait for it to finish instead of repeating it.
+    """
+    lock_timeout = int(os.getenv("SEED_LOCK_TIMEOUT", default=60))
+    token = uuid.uuid4().hex
+    if not await redis.set(SEED_LOCK_KEY, token, nx=True, ex=lock_timeout):
+        logger.info("Master data is seeded by another worker, waiting for it")
+        deadline = time.monotonic() + lock_timeout
+        while await redis.exists(SEED_LOCK_KEY) and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+        if await redis.exists(SEED_LOCK_KEY):
+            logger.warning(f"Master data seeding by another worker did not finish within {lock_timeout}s, "
+                           f"starting without it")
+        return
+    try:
+        await seed_master_data(force=force)
+    finally:
+        await redis.eval(RELEASE_LOCK_SCRIPT, 1, SEED_LOCK_KEY, token)
+
+
+async def seed(force: bool) -> None:
+    from skill_management.config.config import close_database, close_redis_pool, initiate_database, \
+        initiate_redis_pool
+
+    await initiate_database()
+    try:
+        await initialize_database(await initiate_redis_pool(), force=force)
+    finally:
+        await close_redis_pool()
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the enum collections, designations and skills")
+    parser.add_argument("--force", action="store_true", help="compare every source with the database, "
+                                                             "even when its hash did not change")
+    args = parser.parse_args()
+    asyncio.run(seed(args.force))
+
+
+if __name__ == "__main__":
+    main()
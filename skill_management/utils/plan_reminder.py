@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, cast
+
+from anyio import to_thread
+from beanie import PydanticObjectId
+
+from skill_management.models.plan import Plans
+from skill_management.repositories.plan import PlanRepository
+from skill_management.repositories.profile import ProfileRepository
+from skill_management.schemas.plan import PlanSkill
+from skill_management.utils.logger import get_logger
+from skill_management.utils.scheduler import PeriodicJob
+from skill_management.utils.tasks import send_plan_reminder_email
+
+logger = get_logger()
+
+
+class PlanReminderJob:
+    """
+    Reminds the owners of the active plans ending within `lead_days`. The plans are read batch by batch
+    from the status_end_date index, and each plan records the end date it was reminded of after its
+    batch is sent, so that a run only reads the plans not reminded yet, whenever they were created,
+    reactivated or moved into the window. A plan whose end date changes is reminded of the new one.
+    """
+    __slots__ = ["lead_days", "batch_size"]
+
+    def __init__(self, lead_days: int, batch_size: int) -> None:
+        self.lead_days = lead_days
+        self.batch_size = batch_size
+
+    async def run(self, today: date) -> int:
+        plan_crud_manager = PlanRepository()
+        reminded = 0
+        while True:
+            plans = await plan_crud_manager.get_plans_ending_between(today, today + timedelta(days=self.lead_days),
+                                                                     not_reminded=True, limit=self.batch_size)
+            if not plans:
+                return reminded
+            await self.remind(await plan_crud_manager.with_skill_snapshots(plans))
+            await plan_crud_manager.set_reminded(plans)
+            reminded += len(plans)
+            if len(plans) < self.batch_size:
+                return reminded
+
+    async def remind(self, plans: list[Plans]) -> None:
+        """
+        One email per owner for the plans of the batch.
+        """
+        plans_by_profile: dict[PydanticObjectId, list[dict[str, Any]]] = {}
+        for plan in plans:
+            snapshot = cast(PlanSkill, plan.skill_snapshot)
+            plans_by_profile.setdefault(plan.profile.ref.id, []).append({
+                "skill_name": snapshot.skill_name,
+                "plan_type": plan.plan_type.name,
+                "end_date": plan.end_date.isoformat() if plan.end_date is not None else None
+            })
+        emails = await ProfileRepository().get_emails(list(plans_by_profile))
+        for profile_id, profile_plans in plans_by_profile.items():
+            if profile_id in emails:
+                await to_thread.run_sync(send_plan_reminder_email, emails[profile_id], profile_plans)
+
+
+def get_plan_reminder_job() -> PlanReminderJob:
+    return PlanReminderJob(lead_days=int(os.getenv("PLAN_REMINDER_LEAD_DAYS", default=3)),
+                           batch_size=int(os.getenv("PLAN_REMINDER_BATCH_SIZE", default=500)))
+
+
+async def send_plan_reminders() -> None:
+    reminded = await get_plan_reminder_job().run(datetime.now(timezone.utc).date())
+    logger.info(f"Plan reminders sent for {reminded} plans")
+
+
+plan_reminder_scheduler = PeriodicJob("plan-reminder",
+                                      interval=int(os.getenv("PLAN_REMINDER_INTERVAL", default=3600)),
+                                      lock_timeout=int(os.getenv("PLAN_REMINDER_LOCK_TIMEOUT", default=600)),
+                                      job=send_plan_reminders)
+
+
+async def remind() -> None:
+    from skill_management.config.config import close_database, close_redis_pool, initiate_database, \
+        initiate_redis_pool
+
+    await initiate_database()
+    try:
+        await plan_reminder_scheduler.run_once(await initiate_redis_pool())
+    finally:
+        await close_redis_pool()
+        await close_database()
+
+
+def main() -> None:
+    argparse.ArgumentParser(description="Send the reminders of the plans ending soon once, "
+                                        "for deployments scheduling the job outside of the API").parse_args()
+    asyncio.run(remind())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import os
+import time
+import typing
+
+from jose import JWTError, jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from skill_management.utils.logger import get_logger
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+    PYINSTRUMENT_INSTALLED = True
+except ImportError:  # pragma: no cover
+    PYINSTRUMENT_INSTALLED = False
+
+logger = get_logger()
+
+PROFILING_HEADER = "X-Profile"
+REPORT_FORMATS = {
+    "html": ("text/html; charset=utf-8", "html"),
+    "speedscope": ("application/json", "speedscope.json"),
+}
+
+
+def is_profiling_enabled() -> bool:
+    return os.getenv("PROFILING_ENABLED", default="0") == "1" and PYINSTRUMENT_INSTALLED
+
+
+async def is_admin(scope: Scope, authorization: str) -> bool:
+    """
+    Same rules as JWTBearerAdmin: a valid bearer token whose user is flagged as admin in
+    the session hash kept in Redis by the auth service.
+    """
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        payload = jwt.decode(token, os.getenv("VERIFY_TOKEN_SECRET_KEY"),
+                             algorithms=[os.getenv("ENCRYPTION_ALGORITHM")], audience='fastapi-users:auth')
+    except JWTError:
+        return False
+    if payload.get("exp", 0) < time.time() or "user_id" not in payload:
+        return False
+    user_auth_data = await scope["app"].state.redis_connection.hgetall(payload["user_id"])
+    return bool(user_auth_data) and user_auth_data.get("is_admin") == "1"
+
+
+class ProfilingMiddleware:
+    """
+    Runs pyinstrument for a single request when an admin sends `X-Profile: html` or
+    `X-Profile: speedscope`. The report replaces the response, or, when PROFILING_REPORT_DIR
+    is set, is written there and named in the X-Profile-Report header of the untouched response.
+    Requests without the header only pay for one header lookup.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float = 0.001, report_dir: str | None = None) -> None:
+        self.app = app
+        self.interval = interval
+        self.report_dir = report_dir
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        report_format = headers.get(PROFILING_HEADER)
+        if report_format is None:
+            await self.app(scope, receive, send)
+            return
+        report_format = report_format.lower()
+        if report_format not in REPORT_FORMATS or not await is_admin(scope, headers.get("Authorization", "")):
+            await self.app(scope, receive, send)
+            return
+        await self.profile(scope, receive, send, report_format)
+
+    def render(self, profiler: typing.Any, report_format: str) -> str:
+        if report_format == "speedscope":
+            return typing.cast(str, profiler.output(renderer=SpeedscopeRenderer()))
+        return typing.cast(str, profiler.output(renderer=HTMLRenderer()))
+
+    def write_report(self, scope: Scope, report: str, report_format: str) -> str:
+        route = scope["path"].strip("/").replace("/", "_") or "root"
+        file_name = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{scope['method']}-{route}." \
+                    f"{REPORT_FORMATS[report_format][1]}"
+        os.makedirs(typing.cast(str, self.report_dir), exist_ok=True)
+        with open(os.path.join(typing.cast(str, self.report_dir), file_name), 'w') as f:
+            f.write(report)
+        return file_name
+
+    async def profile(self, scope: Scope, receive: Receive, send: Send, report_format: str) -> None:
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        status_code = 500
+        response_start: Message = {}
+        body: list[Message] = []
+
+        async def send_buffered(message: Message) -> None:
+            nonlocal status_code, response_start
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_start = message
+            else:
+                body.append(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_buffered)
+        finally:
+            profiler.stop()
+        report = self.render(profiler, report_format)
+        session = profiler.last_session
+        duration = f" in {session.duration:.3f}s" if session is not None else ""
+        logger.info(f"Profiled {scope['method']} {scope['path']} ({status_code}){duration}")
+
+        if self.report_dir:
+            response_headers = MutableHeaders(raw=response_start["headers"])
+            response_headers["X-Profile-Report"] = self.write_report(scope, report, report_format)
+            await send(response_start)
+            for message in body:
+                await send(message)
+            return
+
+        content = report.encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", REPORT_FORMATS[report_format][0].encode("latin-1")),
+                (b"content-length", str(len(content)).encode("latin-1")),
+                (b"x-profiled-status", str(status_code).encode("latin-1")),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": content})
@@ -0,0 +1,103 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, TypeVar
+
+from skill_management.utils.logger import get_logger
+
+logger = get_logger()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class QueryStats:
+    """
+    Mongo commands issued while handling one request. Motor runs pymongo in executor threads
+    with a copy of the request context, so the command listener reaches this object through
+    the query_stats ContextVar.
+    """
+    __slots__ = ["count", "duration", "collections", "_lock"]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.collections: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, collection: str) -> None:
+        with self._lock:
+            self.count += 1
+            self.collections[collection] = self.collections.get(collection, 0) + 1
+
+    def add_duration(self, duration: float) -> None:
+        with self._lock:
+            self.duration += duration
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetViolation:
+    __slots__ = ["route", "budget", "count", "collections"]
+
+    def __init__(self, route: str, budget: int, stats: QueryStats) -> None:
+        self.route = route
+        self.budget = budget
+        self.count = stats.count
+        self.collections = dict(stats.collections)
+
+    def __str__(self) -> str:
+        return f"{self.route} issued {self.count} Mongo commands, budget is {self.budget} {self.collections}"
+
+
+"""
+Violations are only collected when a consumer (the pytest plugin) sets up the list,
+production workers just log them
+"""
+budget_violations: list[QueryBudgetViolation] | None = None
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declares the maximum number of Mongo commands an endpoint may issue per request.
+    Must be placed below the router decorator so that the registered endpoint carries it.
+    """
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, "__query_budget__", max_queries)
+        return endpoint
+
+    return decorator
+
+
+def get_query_budget(endpoint: Any) -> int | None:
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def check_query_budget(endpoint: Any, route: str, stats: QueryStats) -> QueryBudgetViolation | None:
+    budget = get_query_budget(endpoint)
+    if budget is None or stats.count <= budget:
+        return None
+    violation = QueryBudgetViolation(route, budget, stats)
+    logger.warning(f"Query budget exceeded: {violation}")
+    if budget_violations is not None:
+        budget_violations.append(violation)
+    return violation
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    with count_queries() as stats:
+        yield stats
+    assert stats.count <= max_queries, \
+        f"{stats.count} Mongo commands issued, expected at most {max_queries} {stats.collections}"
@@ -0,0 +1,63 @@
+import asyncio
+import uuid
+from typing import Awaitable, Callable
+
+from aioredis import Redis
+
+from skill_management.utils.initial_data import RELEASE_LOCK_SCRIPT
+from skill_management.utils.logger import get_logger
+
+logger = get_logger()
+
+
+async def run_locked(redis: Redis, lock_key: str, lock_timeout: int, job: Callable[[], Awaitable[None]]) -> bool:
+    """
+    Runs the job unless another worker of the deployment holds its Redis lock.
+    """
+    token = uuid.uuid4().hex
+    if not await redis.set(lock_key, token, nx=True, ex=lock_timeout):
+        return False
+    try:
+        await job()
+    finally:
+        await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    return True
+
+
+class PeriodicJob:
+    """
+    Runs a job every `interval` seconds in the worker process under a Redis lock, started and
+    cancelled with the app like the Redis health check.
+    """
+    __slots__ = ["name", "interval", "lock_timeout", "job", "_task"]
+
+    def __init__(self, name: str, interval: int, lock_timeout: int, job: Callable[[], Awaitable[None]]) -> None:
+        self.name = name
+        self.interval = interval
+        self.lock_timeout = lock_timeout
+        self.job = job
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def lock_key(self) -> str:
+        return f"skill_management:{self.name}-lock"
+
+    def start(self, redis: Redis) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(redis))
+
+    async def run_once(self, redis: Redis) -> bool:
+        return await run_locked(redis, self.lock_key, self.lock_timeout, self.job)
+
+    async def _run(self, redis: Redis) -> None:
+        while True:
+            try:
+                await self.run_once(redis)
+            except Exception:
+                logger.exception(f"{self.name} run failed")
+            await asyncio.sleep(self.interval)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, Field, create_model
+from pydantic.fields import SHAPE_LIST, ModelField
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+"""
+Fields of a view model read for a response field, each with the subfields read of its embedded
+document (or of the documents of its array), None for the whole field.
+"""
+DocumentFields = dict[str, set[str] | None]
+
+
+def merge_document_fields(target: DocumentFields, source: DocumentFields) -> None:
+    for name, subfields in source.items():
+        current = target.get(name, set())
+        if current is not None:
+            target[name] = None if subfields is None else current | subfields
+
+
+class SparseFields:
+    """
+    Fields of a response selected with `fields=`, each with its selected subfields, None for all of them.
+    """
+    __slots__ = ["fields"]
+
+    def __init__(self, fields: dict[str, set[str] | None]) -> None:
+        self.fields = fields
+
+    def __contains__(self, path: str) -> bool:
+        name, _, subfield = path.partition(".")
+        if name not in self.fields:
+            return False
+        subfields = self.fields[name]
+        return not subfield or subfields is None or subfield in subfields
+
+    def nested(self, name: str) -> "SparseFields | None":
+        """
+        Fields selected of the nested model `name`, None for all of them.
+        """
+        subfields = self.fields.get(name)
+        if subfields is None:
+            return None
+        return SparseFields({subfield: None for subfield in subfields})
+
+    @property
+    def include(self) -> dict[int | str, Any]:
+        return {
+            name: True if subfields is None else {subfield: True for subfield in subfields}
+            for name, subfields in self.fields.items()
+        }
+
+    def document_fields(self, sources: dict[str, DocumentFields], required: DocumentFields) -> DocumentFields:
+        """
+        Fields of the view to read for the selected fields, besides the `required` ones the service
+        reads anyway (to filter or authorize).
+        """
+        document_fields: DocumentFields = {}
+        merge_document_fields(document_fields, required)
+        for name, subfields in self.fields.items():
+            paths = [name] if subfields is None else [f"{name}.{subfield}" for subfield in subfields]
+            for path in paths:
+                merge_document_fields(document_fields, sources[path])
+        return document_fields
+
+
+def parse_fields(value: str, sources: dict[str, DocumentFields]) -> SparseFields | None:
+    fields: dict[str, set[str] | None] = {}
+    for path in value.split(","):
+        path = path.strip()
+        if not path:
+            continue
+        if path not in sources:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"Unknown field {path}, must be one of: {', '.join(sources)}")
+        name, _, subfield = path.partition(".")
+        current = fields.get(name, set())
+        if not subfield:
+            fields[name] = None
+        elif current is not None:
+            fields[name] = current | {subfield}
+    return SparseFields(fields) if fields else None
+
+
+def sparse_fields(sources: dict[str, DocumentFields]) -> Callable[[str | None], SparseFields | None]:
+    """
+    Dependency reading the `fields` query parameter of a route, the fields it may select are the keys
+    of `sources`.
+    """
+
+    def dependency(fields: str | None = Query(default=None,
+                                              description="comma separated fields to return, among: "
+                                                          + ", ".join(sources))) -> SparseFields | None:
+        if fields is None:
+            return None
+        return parse_fields(fields, sources)
+
+    return dependency
+
+
+def field_definition(field: ModelField, annotation: Any) -> tuple[Any, Any]:
+    """
+    The field without its constraints and validators, which may need the other fields. The documents
+    read were validated when written.
+    """
+    return annotation, Field(... if field.required else field.default, alias=field.alias)
+
+
+def partial_model(model: type[BaseModel], names: frozenset[str]) -> type[BaseModel]:
+    return create_model(f"Sparse{model.__name__}", **{  # type: ignore
+        name: field_definition(field, field.annotation) for name, field in model.__fields__.items() if name in names
+    })
+
+
+@lru_cache(maxsize=None)
+def _sparse_view(view: type[BaseModel],
+                 document_fields: tuple[tuple[str, frozenset[str] | None], ...]) -> type[BaseModel]:
+    fields: dict[str, Any] = {}
+    projection: dict[str, int] = {}
+    for name, subfields in document_fields:
+        field = view.__fields__[name]
+        if subfields is None:
+            fields[name] = field_definition(field, field.annotation)
+            projection[field.alias] = 1
+            continue
+        model = partial_model(field.type_, subfields)
+        fields[name] = field_definition(field, list[model] if field.shape == SHAPE_LIST else model)  # type: ignore
+        projection.update({f"{field.alias}.{model.__fields__[subfield].alias}": 1 for subfield in subfields})
+    sparse_view_model = create_model(f"Sparse{view.__name__}", **fields)
+    """
+    Beanie projects the Settings.projection of a projection model rather than its fields
+    """
+    setattr(sparse_view_model, "Settings", type("Settings", (), {"projection": projection}))
+    return sparse_view_model
+
+
+def sparse_view(view: type[ModelType], document_fields: DocumentFields) -> type[ModelType]:
+    """
+    Projection model reading the `document_fields` of the view only, down to the subfields of its
+    embedded documents. Built once per selection.
+    """
+    return _sparse_view(view, tuple(sorted(  # type: ignore
+        (name, None if subfields is None else frozenset(subfields)) for name, subfields in document_fields.items()
+    )))
+
+
+def sparse_construct(model: type[ModelType], fields: SparseFields | None, **values: Callable[[], Any]) -> ModelType:
+    """
+    construct() with the values of the selected fields only, the data of the others may not have been read.
+    """
+    return model.construct(**{name: value() for name, value in values.items() if fields is None or name in fields})
+
+
+async def sparse_response(build: Awaitable[BaseModel], fields: SparseFields | None, items: str | None = None) -> Any:
+    """
+    The response body built by `build`, restricted to the selected fields of the response, or of the
+    models of its `items` list.
+    """
+    response = await build
+    if fields is None:
+        return response
+    include = fields.include
+    if items is not None:
+        include = {**{name: True for name in response.__fields__}, items: {"__all__": include}}
+    return response.dict(by_alias=True, include=include)
@@ -0,0 +1,348 @@
+import argparse
+import asyncio
+import csv
+import os
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator
+
+from beanie import PydanticObjectId
+
+from skill_management.enums import DesignationStatusEnum, FileTypeEnum, GenderEnum, PlanTypeEnum, \
+    ProfileStatusEnum, SkillCategoryEnum, SkillTypeEnum, StatusEnum, TaskStatusEnum
+from skill_management.models.file import Files
+from skill_management.models.plan import Plans
+from skill_management.models.profile import Profiles
+from skill_management.models.skill import Skills
+from skill_management.repositories.plan import skill_snapshot
+from skill_management.schemas.designation import ProfileDesignation
+from skill_management.schemas.education import ProfileEducation
+from skill_management.schemas.experience import ExperienceDesignation, ProfileExperience
+from skill_management.schemas.plan import Task
+from skill_management.schemas.profile import ProfilePersonalDetails
+from skill_management.schemas.skill import ProfileSkill
+from skill_management.utils.logger import get_logger
+
+logger = get_logger()
+
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.example.com"
+SYNTHETIC_USER_PATTERN = f"^synthetic-.*@{SYNTHETIC_EMAIL_DOMAIN.replace('.', '[.]')}$"
+
+FIRST_NAMES = ["Amina", "Rahim", "Karim", "Nusrat", "Tanvir", "Farhana", "Sabbir", "Mithila", "Jamal", "Rifat",
+               "Sadia", "Imran", "Laila", "Arif", "Nadia", "Omar", "Priya", "Sanjay", "Tasnim", "Zahid"]
+LAST_NAMES = ["Ahmed", "Hossain", "Islam", "Rahman", "Khan", "Chowdhury", "Akter", "Das", "Sarkar", "Roy"]
+COMPANIES = ["iXora Solution Ltd.", "Brain Station 23", "Kaz Software", "Enosis Solutions", "Therap BD",
+             "SELISE Digital", "Cefalo Bangladesh", "Vivasoft Ltd.", "Samsung R&D", "Optimizely"]
+DEGREES = ["BSc in CSE", "BSc in EEE", "MSc in CSE", "BBA", "MBA", "BSc in Software Eng.", "HSC", "SSC"]
+SCHOOLS = ["BUET", "University of Dhaka", "NSU", "BRAC University", "AIUB", "KUET", "RUET", "SUST", "IUT", "EWU"]
+CITIES = ["Dhaka", "Chattogram", "Khulna", "Rajshahi", "Sylhet", "Barishal", "Rangpur", "Cumilla"]
+RESPONSIBILITIES = ["Building REST APIs", "Maintaining the CI/CD pipeline", "Frontend development with React",
+                    "Database design and tuning", "Writing automated tests", "Mentoring junior developers"]
+TASKS = ["Read the documentation", "Finish the online course", "Build a sample project", "Take the mock exam",
+         "Review the exam syllabus", "Pair with a senior engineer"]
+
+
+def load_skills(path: str = "skill_management/static/data/skills.csv") -> list[Skills]:
+    with open(path, 'r') as file:
+        csv_reader = csv.DictReader(file)
+        skills = []
+        for row in csv_reader:
+            row['skill_categories'] = [int(data) for data in row['skill_categories'].split(",")]
+            skills.append(Skills.parse_obj(row))
+        return skills
+
+
+def load_designations(path: str = "skill_management/static/data/designations.csv") -> list[tuple[int, str]]:
+    with open(path, 'r') as file:
+        return [(int(row["id"]), row["designation"]) for row in csv.DictReader(file)]
+
+
+def synthetic_email(index: int) -> str:
+    return f"synthetic-{index}@{SYNTHETIC_EMAIL_DOMAIN}"
+
+
+def random_period(rng: random.Random, earliest: date, latest: date) -> tuple[date, date]:
+    start_date = earliest + timedelta(days=rng.randint(0, max((latest - earliest).days, 1)))
+    end_date = start_date + timedelta(days=rng.randint(30, 1500))
+    return start_date, end_date
+
+
+def skewed_count(rng: random.Random, maximum: int, mode: int) -> int:
+    """
+    Integer in [1, maximum] drawn from a triangular distribution peaking at `mode`:
+    most profiles have a handful of items, a few have many.
+    """
+    if maximum <= 1:
+        return maximum
+    return min(max(round(rng.triangular(1, maximum, min(mode, maximum))), 1), maximum)
+
+
+class SyntheticBatch:
+    __slots__ = ["profiles", "plans", "files"]
+
+    def __init__(self) -> None:
+        self.profiles: list[Profiles] = []
+        self.plans: list[Plans] = []
+        self.files: list[Files] = []
+
+
+class SyntheticDataGenerator:
+    """
+    Builds deterministic profiles with their plans and file metadata: the same seed always
+    yields the same documents, ids included, so runs against different builds are comparable.
+    Master skills and designations come from the csv files used to initialize the database.
+    Files are only metadata owned by the profile, like uploads they are looked up by owner and
+    nothing is written under FILE_UPLOAD_PATH.
+    """
+
+    def __init__(self, seed: int = 42, max_skills: int = 12, max_experiences: int = 6,
+                 max_educations: int = 3, max_plans: int = 4) -> None:
+        self.rng = random.Random(seed)
+        self.skills = load_skills()
+        self.skills_by_id = {skill.id: skill for skill in self.skills}
+        self.designations = load_designations()
+        self.max_skills = max_skills
+        self.max_experiences = max_experiences
+        self.max_educations = max_educations
+        self.max_plans = max_plans
+        self.file_location = os.getcwd() + os.getenv("FILE_UPLOAD_PATH", default="/static/uploads/")
+
+    def object_id(self) -> PydanticObjectId:
+        return PydanticObjectId(self.rng.randbytes(12))
+
+    def file(self, owner: PydanticObjectId, file_type: FileTypeEnum, file_name: str,
+             skill_id: int | None = None) -> Files:
+        return Files(
+            id=self.object_id(),
+            file_name=file_name,
+            file_type=file_type,
+            file_size=round(self.rng.uniform(20, 2000), 2),
+            status=StatusEnum.active,
+            location=self.file_location,
+            owner=owner,
+            skill_id=skill_id,
+            created_at=datetime(2022, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=self.rng.randint(0, 525600)),
+        )
+
+    def profile_skills(self, profile_id: PydanticObjectId, experience_year: int,
+                       files: list[Files]) -> list[ProfileSkill]:
+        count = skewed_count(self.rng, min(self.max_skills, len(self.skills)), mode=4)
+        profile_skills = []
+        for skill in self.rng.sample(self.skills, k=count):
+            has_certificate = self.rng.random() < 0.2
+            if has_certificate:
+                files.append(self.file(profile_id, FileTypeEnum.certificate,
+                                       f"{profile_id}-certificate-{skill.id}.pdf", skill_id=skill.id))
+            profile_skills.append(ProfileSkill(
+                skill_id=skill.id,
+                skill_type=SkillTypeEnum(skill.skill_type),
+                skill_category=[SkillCategoryEnum(category) for category in skill.skill_categories],
+                skill_name=skill.skill_name,
+                status=StatusEnum.active,
+                certificate_files=[],
+                experience_year=self.rng.randint(0, min(experience_year, 45)),
+                number_of_projects=min(int(self.rng.expovariate(1 / 4)), 80),
+                level=round(self.rng.triangular(1, 10, 5)),
+                training_duration=self.rng.choice([0, 0, 1, 2, 3, 6, 12, 24]),
+                achievements="1" if has_certificate else "0",
+                achievements_description="Certified" if has_certificate else None,
+                certificate="1" if has_certificate else "0",
+            ))
+        return profile_skills
+
+    def profile_experiences(self, experience_year: int) -> list[ProfileExperience]:
+        """
+        Longer careers have more jobs: one job every three years on average, ending this year.
+        """
+        count = min(max(1, experience_year // 3 + self.rng.randint(0, 1)), self.max_experiences)
+        experiences = []
+        end_date = date(2022, 12, 31)
+        for index in range(count):
+            designation_id, designation = self.rng.choice(self.designations)
+            start_date = end_date - timedelta(days=self.rng.randint(180, 1500))
+            experiences.append(ProfileExperience(
+                experience_id=index + 1,
+                company_name=self.rng.choice(COMPANIES),
+                job_responsibility=self.rng.choice(RESPONSIBILITIES),
+                designation=ExperienceDesignation(designation_id=designation_id, designation=designation),
+                start_date=start_date,
+                end_date=None if index == 0 and self.rng.random() < 0.7 else end_date,
+                status=StatusEnum.active,
+            ))
+            end_date = start_date - timedelta(days=self.rng.randint(0, 90))
+        return experiences
+
+    def profile_educations(self) -> list[ProfileEducation]:
+        return [
+            ProfileEducation(
+                education_id=index + 1,
+                degree_name=self.rng.choice(DEGREES),
+                school_name=self.rng.choice(SCHOOLS),
+                passing_year=str(self.rng.randint(2000, 2022)),
+                grade=round(min(max(self.rng.gauss(3.5, 0.4), 2.5), 5.0), 2),
+                status=StatusEnum.active,
+            )
+            for index in range(skewed_count(self.rng, self.max_educations, mode=2))
+        ]
+
+    def profile(self, index: int, files: list[Files]) -> Profiles:
+        profile_id = self.object_id()
+        designation_id, designation = self.rng.choice(self.designations)
+        start_date, end_date = random_period(self.rng, date(2015, 1, 1), date(2022, 1, 1))
+        name = f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+        experience_year = min(int(self.rng.expovariate(1 / 5)), 40)
+        if self.rng.random() < 0.6:
+            files.append(self.file(profile_id, FileTypeEnum.resume, f"{profile_id}-resume.pdf"))
+        if self.rng.random() < 0.5:
+            files.append(self.file(profile_id, FileTypeEnum.picture, f"{profile_id}-picture.png"))
+        return Profiles(
+            id=profile_id,
+            user_id=synthetic_email(index),
+            personal_detail=ProfilePersonalDetails(
+                name=name,
+                date_of_birth=date(2000, 1, 1) - timedelta(days=365 * experience_year + self.rng.randint(0, 3650)),
+                gender=self.rng.choices([GenderEnum.male, GenderEnum.female, GenderEnum.others],
+                                        weights=[60, 38, 2])[0],
+                mobile=f"+8801{self.rng.randint(300000000, 999999999)}",
+                address=f"{self.rng.randint(1, 200)} Road, {self.rng.choice(CITIES)}",
+                about=f"{name} works as {designation}",
+                experience_year=experience_year,
+            ),
+            profile_status=self.rng.choices(
+                [ProfileStatusEnum.full_time, ProfileStatusEnum.part_time, ProfileStatusEnum.inactive],
+                weights=[80, 15, 5])[0],
+            designation=ProfileDesignation(
+                designation_id=designation_id,
+                designation=designation,
+                start_date=start_date,
+                end_date=end_date,
+                designation_status=DesignationStatusEnum.active,
+            ),
+            skills=self.profile_skills(profile_id, experience_year, files),
+            experiences=self.profile_experiences(experience_year),
+            educations=self.profile_educations(),
+            cv_files=[],
+        )
+
+    def plans(self, profile: Profiles) -> list[Plans]:
+        """
+        About 40% of the profiles have no plan at all.
+        """
+        plans: list[Plans] = []
+        if self.rng.random() < 0.4:
+            return plans
+        for _ in range(skewed_count(self.rng, self.max_plans, mode=1)):
+            profile_skill = self.rng.choice(profile.skills)
+            start_date, end_date = random_period(self.rng, date(2022, 1, 1), date(2023, 1, 1))
+            plans.append(Plans(
+                id=self.object_id(),
+                skill=self.skills_by_id[profile_skill.skill_id],  # type: ignore
+                profile=profile,  # type: ignore
+                skill_snapshot=skill_snapshot(self.skills_by_id[profile_skill.skill_id]),
+                plan_type=self.rng.choice(list(PlanTypeEnum)),
+                notes=f"Improve {profile_skill.skill_name}",
+                start_date=start_date,
+                end_date=end_date,
+                task=[
+                    Task(id=index + 1,
+                         description=self.rng.choice(TASKS),
+                         status=self.rng.choice([TaskStatusEnum.complete, TaskStatusEnum.incomplete]),
+                         duration=self.rng.randint(1, 40),
+                         spend_time=self.rng.randint(0, 40))
+                    for index in range(skewed_count(self.rng, 6, mode=3))
+                ],
+                status=StatusEnum.active,
+            ))
+        return plans
+
+    def batches(self, count: int, batch_size: int = 1000) -> Iterator[SyntheticBatch]:
+        for offset in range(0, count, batch_size):
+            batch = SyntheticBatch()
+            for index in range(offset, min(offset + batch_size, count)):
+                profile = self.profile(index, batch.files)
+                batch.profiles.append(profile)
+                batch.plans.extend(self.plans(profile))
+            yield batch
+
+
+async def clear_synthetic_data() -> None:
+    profile_ids = await Profiles.get_motor_collection().distinct(
+        "_id", {"user_id": {"$regex": SYNTHETIC_USER_PATTERN}})
+    if not profile_ids:
+        return
+    await Plans.find({"profile.$id": {"$in": profile_ids}}).delete()
+    await Files.find({"owner": {"$in": profile_ids}}).delete()
+    await Profiles.find({"_id": {"$in": profile_ids}}).delete()
+
+
+async def find_synthetic_data() -> list[tuple[PydanticObjectId, str]]:
+    cursor = Profiles.get_motor_collection().find({"user_id": {"$regex": SYNTHETIC_USER_PATTERN}},
+                                                  {"user_id": 1})
+    return [(document["_id"], document["user_id"]) async for document in cursor]
+
+
+async def insert_batch(batch: SyntheticBatch) -> None:
+    """
+    Unordered inserts let the server apply a batch without stopping at the first error and
+    without serializing the writes of one batch.
+    """
+    await Profiles.insert_many(batch.profiles, ordered=False)
+    if batch.files:
+        await Files.insert_many(batch.files, ordered=False)
+    if batch.plans:
+        await Plans.insert_many(batch.plans, ordered=False)
+
+
+async def insert_synthetic_data(count: int, seed: int = 42, batch_size: int = 1000,
+                                parallel: int = 4) -> list[tuple[PydanticObjectId, str]]:
+    """
+    Replaces the synthetic profiles of a previous run with `count` new ones and returns their
+    (id, user_id) pairs. The database must already be initialized (init_beanie) by the caller.
+    Batches are generated one after another, so the data only depends on the seed, and up to
+    `parallel` of them are written concurrently.
+    """
+    await clear_synthetic_data()
+    generator = SyntheticDataGenerator(seed=seed)
+    inserted: list[tuple[PydanticObjectId, str]] = []
+    pending: set[asyncio.Task[None]] = set()
+    for batch in generator.batches(count, batch_size):
+        if len(pending) >= parallel:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        pending.add(asyncio.create_task(insert_batch(batch)))
+        inserted.extend((profile.id, profile.user_id) for profile in batch.profiles)  # type: ignore
+        logger.info(f"Generated {len(inserted)}/{count} synthetic profiles")
+    if pending:
+        for task in (await asyncio.wait(pending))[0]:
+            task.result()
+    return inserted
+
+
+async def generate(count: int, seed: int, batch_size: int, parallel: int, clear: bool) -> None:
+    from skill_management.config.config import close_database, initiate_database
+
+    await initiate_database()
+    try:
+        if clear:
+            await clear_synthetic_data()
+        else:
+            await insert_synthetic_data(count, seed=seed, batch_size=batch_size, parallel=parallel)
+    finally:
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dataset of profiles, "
+                                                 "skills, plans and file metadata")
+    parser.add_argument("--profiles", type=int, default=10000, help="number of profiles to generate")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the generator")
+    parser.add_argument("--batch-size", type=int, default=1000, help="profiles per bulk insert")
+    parser.add_argument("--parallel", type=int, default=4, help="batches written concurrently")
+    parser.add_argument("--clear", action="store_true", help="only remove the synthetic data")
+    args = parser.parse_args()
+    asyncio.run(generate(args.profiles, args.seed, args.batch_size, args.parallel, args.clear))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+
+def encode_trusted(value: Any) -> Any:
+    """
+    orjson default for the values it does not serialize natively: models as FastAPI dumps them
+    (by alias), everything else (ObjectId, sets, ...) with the pydantic encoders jsonable_encoder uses.
+    """
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+    return pydantic_encoder(value)
+
+
+class TrustedResponse(ORJSONResponse):
+    """
+    Renders a response model assembled with construct() from documents validated when Beanie loaded
+    them. Returned by the route instead of the model, it skips the dump, validation and
+    jsonable_encoder passes FastAPI applies to the response_model, which is still documented;
+    the body is the same bytes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=encode_trusted,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -0,0 +1,127 @@
+"""
+Fixtures of the skill_management tests, with the query budget plugin: every test during which a
+route exceeds its declared @query_budget fails.
+
+The app runs in process against a real mongod and Redis, as Mongo commands are counted through
+pymongo command monitoring:
+
+    MONGO_TEST_URL=mongodb://localhost:27017/skill_matrix_test REDIS_TEST_URL=redis://localhost:6379/15 pytest
+
+The test database is dropped at the end of the run. Without both urls the tests needing the app
+are skipped.
+"""
+import os
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+"""
+The JWT settings are read when the auth manager is imported
+"""
+os.environ.setdefault("VERIFY_TOKEN_SECRET_KEY", "skill-matrix-test-secret")
+os.environ.setdefault("ENCRYPTION_ALGORITHM", "HS256")
+
+from skill_management.utils import query_budget  # noqa: E402
+
+SYNTHETIC_PROFILES = 20
+SYNTHETIC_SEED = 7
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    test_database_url = os.getenv("MONGO_TEST_URL")
+    if test_database_url:
+        os.environ["ENVIRONMENT"] = "local"
+        os.environ["LOCAL_DATABASE_URL"] = test_database_url
+    test_redis_url = os.getenv("REDIS_TEST_URL")
+    if test_redis_url:
+        os.environ["REDIS_AUTH_URL"] = test_redis_url
+    os.environ["PLAN_REMINDER_ENABLED"] = "0"
+    os.environ["FILE_GC_ENABLED"] = "0"
+    os.environ["PROFILING_ENABLED"] = "0"
+    query_budget.budget_violations = []
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    query_budget.budget_violations = None
+
+
+@pytest.fixture(autouse=True)
+def query_budget_guard() -> Iterator[None]:
+    violations = query_budget.budget_violations
+    if violations is not None:
+        violations.clear()
+    yield
+    if violations:
+        message = "\n".join(str(violation) for violation in violations)
+        violations.clear()
+        pytest.fail("Query budget exceeded:\n" + message, pytrace=False)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def skill_app() -> AsyncIterator[FastAPI]:
+    """
+    The app started as a worker starts it, seeding the master data, with synthetic profiles.
+    """
+    if not os.getenv("MONGO_TEST_URL") or not os.getenv("REDIS_TEST_URL"):
+        pytest.skip("MONGO_TEST_URL and REDIS_TEST_URL must point to a test mongod and Redis")
+    from skill_management.config.database import database_manager
+    from skill_management.main import skill_app as app
+
+    await app.router.startup()
+    try:
+        yield app
+    finally:
+        if database_manager.client is not None:
+            await database_manager.client.drop_database(database_manager.client.get_default_database().name)
+        await app.router.shutdown()
+
+
+@pytest.fixture(scope="session")
+async def synthetic_profiles(skill_app: FastAPI) -> list[tuple[PydanticObjectId, str]]:
+    from skill_management.utils.synthetic_data import insert_synthetic_data
+
+    return await insert_synthetic_data(SYNTHETIC_PROFILES, seed=SYNTHETIC_SEED)
+
+
+class SessionTokens:
+    """
+    Bearer headers of sessions registered in Redis, as the auth service registers them on login.
+    """
+    __slots__ = ["app", "session_keys"]
+
+    def __init__(self, app: FastAPI) -> None:
+        self.app = app
+        self.session_keys: list[str] = []
+
+    async def headers(self, email: str, is_admin: bool = False) -> dict[str, str]:
+        from benchmarks.scenarios import create_token
+
+        user_id = f"test-{'admin' if is_admin else 'user'}-{email}"
+        await self.app.state.redis_connection.hset(name=user_id, mapping={"email": email,
+                                                                          "is_admin": int(is_admin),
+                                                                          "is_verified": 1})
+        self.session_keys.append(user_id)
+        return {"Authorization": f"Bearer {create_token(user_id)}"}
+
+
+@pytest.fixture(scope="session")
+async def sessions(skill_app: FastAPI) -> AsyncIterator[SessionTokens]:
+    tokens = SessionTokens(skill_app)
+    yield tokens
+    if tokens.session_keys:
+        await skill_app.state.redis_connection.delete(*tokens.session_keys)
+
+
+@pytest.fixture
+async def client(skill_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=skill_app),  # type: ignore
+                                 base_url="http://test") as test_client:
+        yield test_client
@@ -0,0 +1,34 @@
+from pymongo import monitoring
+
+from skill_management.config.database import PoolStatsListener
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_pool_events_are_counted() -> None:
+    listener = PoolStatsListener()
+    listeners = monitoring._EventListeners([listener])
+    listeners.publish_pool_created(ADDRESS, {})
+    listeners.publish_pool_ready(ADDRESS)
+    for connection_id in [1, 2, 3]:
+        listeners.publish_connection_created(ADDRESS, connection_id)
+        listeners.publish_connection_ready(ADDRESS, connection_id)
+    for connection_id in [1, 2]:
+        listeners.publish_connection_check_out_started(ADDRESS)
+        listeners.publish_connection_checked_out(ADDRESS, connection_id)
+    listeners.publish_connection_checked_in(ADDRESS, 2)
+    listeners.publish_connection_check_out_started(ADDRESS)
+    listeners.publish_connection_check_out_failed(ADDRESS, monitoring.ConnectionCheckOutFailedReason.TIMEOUT)
+    listeners.publish_connection_check_out_started(ADDRESS)
+    listeners.publish_pool_cleared(ADDRESS, None)
+    listeners.publish_connection_closed(ADDRESS, 3, monitoring.ConnectionClosedReason.STALE)
+    listeners.publish_pool_closed(ADDRESS)
+
+    assert listener.get_stats() == {
+        "total": 2,
+        "in_use": 1,
+        "idle": 1,
+        "wait_queue": 1,
+        "checkout_failed": 1,
+        "pools_cleared": 1,
+    }
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+from skill_management.models.profile import Profiles
+from skill_management.utils.date_migration import DATE_FIELDS, migrate_collection, string_filter
+
+
+@pytest.mark.anyio
+async def test_null_subdocuments_are_kept(skill_app: FastAPI) -> None:
+    _, fields, arrays = next(source for source in DATE_FIELDS if source[0] is Profiles)
+    collection = Profiles.get_motor_collection()
+    profile_ids = [PydanticObjectId(), PydanticObjectId()]
+    await collection.insert_many([
+        {"_id": profile_ids[0], "user_id": "date-migration-1@example.com", "designation": None,
+         "personal_detail": {"name": "First", "date_of_birth": "1990-05-17"},
+         "experiences": [{"experience_id": 1, "start_date": "2020-01-01", "end_date": None}]},
+        {"_id": profile_ids[1], "user_id": "date-migration-2@example.com",
+         "designation": {"designation_id": 1, "start_date": "2021-03-01", "end_date": None},
+         "experiences": None},
+    ])
+    try:
+        query = {"_id": {"$in": profile_ids}, **string_filter(fields, arrays)}
+        assert await collection.count_documents(query) == 2
+
+        assert await migrate_collection(Profiles, fields, arrays, batch_size=10) == 2
+        first, second = [await collection.find_one({"_id": profile_id}) for profile_id in profile_ids]
+        assert first["designation"] is None
+        assert first["personal_detail"] == {"name": "First", "date_of_birth": datetime(1990, 5, 17)}
+        assert first["experiences"] == [{"experience_id": 1, "start_date": datetime(2020, 1, 1), "end_date": None}]
+        assert second["designation"] == {"designation_id": 1, "start_date": datetime(2021, 3, 1), "end_date": None}
+        assert "personal_detail" not in second
+        assert second["experiences"] is None
+    finally:
+        await collection.delete_many({"_id": {"$in": profile_ids}})
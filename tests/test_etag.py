@@ -0,0 +1,126 @@
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+
+from skill_management.controllers import profile as profile_controller
+from skill_management.enums import ProfileStatusEnum
+from skill_management.models.profile import Profiles
+from skill_management.utils.etag import etag_matches, if_match_revision, revision_etag
+from tests.conftest import SessionTokens
+
+
+def test_etags_are_compared_weakly() -> None:
+    revision_id = uuid.uuid4()
+    etag = revision_etag(revision_id)
+    assert etag == f'W/"{revision_id.hex}"'
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"{revision_id.hex}"', etag)
+    assert etag_matches(f'W/"{uuid.uuid4().hex}", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(revision_etag(uuid.uuid4()), etag)
+
+
+def test_if_match_gives_the_revision() -> None:
+    revision_id = uuid.uuid4()
+    assert if_match_revision(None) is None
+    assert if_match_revision(" * ") is None
+    assert if_match_revision(revision_etag(revision_id)) == revision_id
+    assert if_match_revision(f'"{revision_id.hex}"') == revision_id
+    with pytest.raises(HTTPException) as exc_info:
+        if_match_revision('"not-a-revision"')
+    assert exc_info.value.status_code == 412
+
+
+async def active_profile(synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> tuple[PydanticObjectId, str]:
+    profile = await Profiles.get_motor_collection().find_one(
+        {"_id": {"$in": [profile_id for profile_id, _ in synthetic_profiles]},
+         "profile_status": {"$in": [ProfileStatusEnum.full_time, ProfileStatusEnum.part_time]}},
+        {"user_id": 1})
+    assert profile is not None
+    return profile["_id"], profile["user_id"]
+
+
+@pytest.mark.anyio
+async def test_etag_changes_with_every_write(client: httpx.AsyncClient, sessions: SessionTokens,
+                                            synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                            tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    profile_id, email = await active_profile(synthetic_profiles)
+    admin_headers = await sessions.headers(email, is_admin=True)
+    user_headers = await sessions.headers(email)
+    etags: list[str] = []
+
+    async def etag_changed() -> bool:
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=admin_headers)
+        assert response.status_code == 200
+        etags.append(response.headers["etag"])
+        return len(etags) == 1 or etags[-1] != etags[-2]
+
+    assert await etag_changed()
+    response = await client.post("/api/v1/admin/user-profiles/",
+                                 json={"profile_id": str(profile_id), "mobile": "+01611000003"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert await etag_changed()
+
+    """
+    A new designation pushes an experience with push_with_sequence
+    """
+    response = await client.post("/api/v1/admin/user-profiles/",
+                                 json={"profile_id": str(profile_id), "designation_id": 1}, headers=admin_headers)
+    assert response.status_code == 200
+    assert await etag_changed()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FILE_UPLOAD_PATH", "/uploads/")
+    (tmp_path / "uploads").mkdir()
+    response = await client.post("/api/v1/profile/files/upload-resume", headers=user_headers,
+                                 files={"file": ("resume.pdf", b"%PDF-1.4", "application/pdf")})
+    assert response.status_code == 201
+    assert await etag_changed()
+
+    response = await client.delete(f"/api/v1/profile/files/{response.json()['file_id']}", headers=user_headers)
+    assert response.status_code == 200
+    assert await etag_changed()
+
+
+@pytest.mark.anyio
+async def test_revalidation_reads_the_revision_only(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                    synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                    monkeypatch: pytest.MonkeyPatch) -> None:
+    profile_id, email = await active_profile(synthetic_profiles)
+    headers = await sessions.headers(email, is_admin=True)
+    response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=headers)
+    assert response.status_code == 200
+
+    """
+    The query budget guard fails the test if the 304 issues more than the revision read
+    """
+    monkeypatch.setattr(profile_controller.get_user_profile_by_id_for_admin, "__query_budget__", 1)
+    revalidated = await client.get(f"/api/v1/admin/user-profiles/{profile_id}",
+                                   headers={**headers, "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == response.headers["etag"]
+    assert revalidated.content == b""
+
+
+@pytest.mark.anyio
+async def test_profiles_rejected_by_active_only_reads_have_no_etag(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                              synthetic_profiles: list[tuple[PydanticObjectId, str]]
+                                                              ) -> None:
+    profile_id, email = await active_profile(synthetic_profiles)
+    collection = Profiles.get_motor_collection()
+    profile_status = (await collection.find_one({"_id": profile_id}, {"profile_status": 1}))["profile_status"]
+    await collection.update_one({"_id": profile_id}, {"$set": {"profile_status": ProfileStatusEnum.inactive}})
+    try:
+        response = await client.get("/api/v1/profile/user-profiles/", headers=await sessions.headers(email))
+        assert "etag" not in response.headers
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}",
+                                    headers=await sessions.headers(email, is_admin=True))
+        assert response.status_code == 200
+        assert "etag" in response.headers
+    finally:
+        await collection.update_one({"_id": profile_id}, {"$set": {"profile_status": profile_status}})
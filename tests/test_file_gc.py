@@ -0,0 +1,85 @@
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+from skill_management.enums import FileTypeEnum, StatusEnum
+from skill_management.models.file import Files
+from skill_management.utils.file_gc import FileGarbageCollector
+
+RETENTION_DAYS = 30
+
+
+def upload(upload_path: Path, file_name: str, modified: datetime) -> Path:
+    path = upload_path / file_name
+    path.write_bytes(b"%PDF-1.4" + file_name.encode())
+    os.utime(path, (modified.timestamp(), modified.timestamp()))
+    return path
+
+
+def file_record(upload_path: Path, file_name: str, status: StatusEnum,
+                deleted_at: datetime | None = None) -> dict[str, Any]:
+    """
+    Files record as stored, without deleted_at when not given as files deleted before it existed
+    """
+    record: dict[str, Any] = {"_id": PydanticObjectId(), "file_name": file_name, "file_type": FileTypeEnum.resume,
+                              "file_size": 1, "status": status, "location": f"{upload_path}/",
+                              "owner": PydanticObjectId(), "created_at": datetime.now(timezone.utc) - timedelta(days=90)}
+    if deleted_at is not None:
+        record["deleted_at"] = deleted_at
+    return record
+
+
+@pytest.mark.anyio
+async def test_deleted_and_orphaned_files_are_collected(skill_app: FastAPI, tmp_path: Path) -> None:
+    now = datetime.now(timezone.utc)
+    expired, retained = now - timedelta(days=RETENTION_DAYS + 1), now - timedelta(days=RETENTION_DAYS - 1)
+    files = {file_name: upload(tmp_path, file_name, expired) for file_name in
+             ["expired.pdf", "retained.pdf", "legacy.pdf", "reused.pdf", "orphan.pdf"]}
+    files["new-orphan.pdf"] = upload(tmp_path, "new-orphan.pdf", retained)
+    records = [
+        file_record(tmp_path, "expired.pdf", StatusEnum.delete, expired),
+        file_record(tmp_path, "retained.pdf", StatusEnum.delete, retained),
+        file_record(tmp_path, "legacy.pdf", StatusEnum.delete),
+        file_record(tmp_path, "reused.pdf", StatusEnum.delete, expired),
+        file_record(tmp_path, "reused.pdf", StatusEnum.active),
+    ]
+    reclaimed = files["expired.pdf"].stat().st_size + files["orphan.pdf"].stat().st_size
+    collection = Files.get_motor_collection()
+    await collection.insert_many(records)
+    record_ids = [record["_id"] for record in records]
+    try:
+        """
+        The dry run reports what the run removes, removing nothing
+        """
+        for dry_run in [True, False]:
+            report = await FileGarbageCollector(str(tmp_path) + "/", RETENTION_DAYS, batch_size=2,
+                                                dry_run=dry_run).run(now)
+            assert (report.files_removed, report.records_purged, report.orphans_removed) == (1, 2, 1)
+            assert report.bytes_reclaimed == reclaimed
+            if dry_run:
+                assert all(path.exists() for path in files.values())
+                assert await collection.count_documents({"_id": {"$in": record_ids}}) == len(records)
+                assert (await collection.find_one({"_id": records[2]["_id"]})).get("deleted_at") is None
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == \
+            ["legacy.pdf", "new-orphan.pdf", "retained.pdf", "reused.pdf"]
+        remaining = {record["file_name"]: record async for record in collection.find({"_id": {"$in": record_ids}})}
+        assert sorted(remaining) == ["legacy.pdf", "retained.pdf", "reused.pdf"]
+        assert remaining["reused.pdf"]["status"] == StatusEnum.active
+
+        """
+        A file deleted before deleted_at existed is kept for the retention window from its first run
+        """
+        assert remaining["legacy.pdf"]["deleted_at"] is not None
+        await FileGarbageCollector(str(tmp_path) + "/", RETENTION_DAYS, batch_size=2).run(
+            now + timedelta(days=RETENTION_DAYS + 1))
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["reused.pdf"]
+        assert [record["file_name"] async for record in collection.find({"_id": {"$in": record_ids}})] == \
+            ["reused.pdf"]
+    finally:
+        await collection.delete_many({"_id": {"$in": record_ids}})
@@ -0,0 +1,94 @@
+from typing import Any, AsyncIterator
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+
+from skill_management.enums import FileTypeEnum, ProfileStatusEnum, StatusEnum
+from skill_management.models.file import Files
+from skill_management.models.plan import Plans
+from skill_management.models.profile import Profiles
+from tests.conftest import SessionTokens
+
+SECTIONS = ["skills", "experiences", "educations", "designation", "plans"]
+
+
+@pytest.fixture
+async def hidden_items(synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> AsyncIterator[None]:
+    """
+    A deleted resume, a cancelled certificate and a cancelled plan on every active profile with plans,
+    which only the admin sees the cancelled ones of.
+    """
+    profiles = Profiles.get_motor_collection().find(
+        {"_id": {"$in": [profile_id for profile_id, _ in synthetic_profiles]},
+         "profile_status": {"$in": [ProfileStatusEnum.full_time, ProfileStatusEnum.part_time]}}, {"_id": 1})
+    file_ids: list[PydanticObjectId] = []
+    plan_ids: list[PydanticObjectId] = []
+    async for profile in profiles:
+        plan = await Plans.get_motor_collection().find_one({"profile.$id": profile["_id"]})
+        if plan is None:
+            continue
+        for file_type, file_status in [(FileTypeEnum.resume, StatusEnum.delete),
+                                       (FileTypeEnum.certificate, StatusEnum.cancel)]:
+            file_ids.append(PydanticObjectId())
+            await Files.get_motor_collection().insert_one({
+                "_id": file_ids[-1], "file_name": f"hidden-{file_ids[-1]}.pdf", "file_type": file_type,
+                "file_size": 1, "status": file_status, "location": "/static/uploads/", "owner": profile["_id"],
+                "created_at": plan["start_date"]})
+        plan_ids.append(PydanticObjectId())
+        await Plans.get_motor_collection().insert_one({**plan, "_id": plan_ids[-1], "status": StatusEnum.cancel})
+    assert plan_ids
+    try:
+        yield
+    finally:
+        await Files.get_motor_collection().delete_many({"_id": {"$in": file_ids}})
+        await Plans.get_motor_collection().delete_many({"_id": {"$in": plan_ids}})
+
+
+async def merged_bodies(client: httpx.AsyncClient, urls: list[str], headers: dict[str, str]) -> dict[str, Any]:
+    body: dict[str, Any] = {}
+    for url in urls:
+        response = await client.get(url, headers=headers)
+        assert response.status_code == 200
+        body.update(response.json())
+    return body
+
+
+@pytest.mark.anyio
+async def test_full_profile_is_the_merged_profile_page(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                       synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                       hidden_items: None) -> None:
+    admin_headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    for profile_id, _ in synthetic_profiles:
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}/full", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json() == await merged_bodies(client, [
+            f"/api/v1/admin/user-profiles/{profile_id}",
+            f"/api/v1/profile/admin/user-profiles/{profile_id}/skills",
+            f"/api/v1/admin/user-profiles/{profile_id}/experiences",
+            f"/api/v1/profile/admin/user-profiles/{profile_id}/educations",
+            f"/api/v1/profile/admin/user-profiles/{profile_id}/designation",
+            f"/api/v1/profile/admin/user-profiles/{profile_id}/plans",
+        ], admin_headers)
+
+
+@pytest.mark.anyio
+async def test_user_full_profile_is_the_merged_profile_page(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                            synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                            hidden_items: None) -> None:
+    compared = 0
+    for _, email in synthetic_profiles:
+        headers = await sessions.headers(email)
+        response = await client.get("/api/v1/profile/user-profiles/full", headers=headers)
+        if response.status_code == 404:
+            """
+            Inactive profiles are not shown to their users
+            """
+            assert (await client.get("/api/v1/profile/user-profiles/", headers=headers)).status_code == 404
+            continue
+        assert response.status_code == 200
+        assert response.json() == await merged_bodies(
+            client, ["/api/v1/profile/user-profiles/"] + [f"/api/v1/profile/user-profiles/{section}"
+                                                          for section in SECTIONS], headers)
+        compared += 1
+    assert compared
@@ -0,0 +1,57 @@
+from typing import Any
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+from skill_management.models.counter import Counters
+from skill_management.models.designation import Designations
+from skill_management.models.plan import Plans
+from skill_management.utils import initial_data
+from skill_management.utils.initial_data import apply_source, seed_master_data
+
+
+@pytest.mark.anyio
+async def test_seed_keeps_documents_edited_or_deleted_since(skill_app: FastAPI) -> None:
+    collection = Designations.get_motor_collection()
+    seeded_rows: dict[str, str] = {}
+    rows = [{"_id": 9001, "designation": "Seeded"}, {"_id": 9002, "designation": "Seeded"}]
+    assert await apply_source(Designations, rows, seeded_rows) == (2, [])
+
+    await collection.update_one({"_id": 9001}, {"$set": {"designation": "Edited"}})
+    await collection.delete_one({"_id": 9002})
+    rows = [{"_id": 9001, "designation": "Changed"}, {"_id": 9002, "designation": "Changed"},
+            {"_id": 9003, "designation": "Seeded"}]
+    assert await apply_source(Designations, rows, seeded_rows) == (1, [])
+    assert (await collection.find_one({"_id": 9001}))["designation"] == "Edited"
+    assert await collection.find_one({"_id": 9002}) is None
+
+    rows[2] = {"_id": 9003, "designation": "Changed"}
+    assert await apply_source(Designations, rows, seeded_rows) == (1, [rows[2]])
+    assert (await collection.find_one({"_id": 9003}))["designation"] == "Changed"
+    await collection.delete_many({"_id": {"$in": [9001, 9002, 9003]}})
+
+
+@pytest.mark.anyio
+async def test_seed_renames_skill_snapshots_and_raises_counters(
+        skill_app: FastAPI, synthetic_profiles: list[tuple[PydanticObjectId, str]],
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    plan = await Plans.find({"skill_snapshot": {"$ne": None}}).first_or_none()
+    assert plan is not None and plan.skill_snapshot is not None
+    skill_id = plan.skill_snapshot.skill_id
+    source_rows = initial_data.skill_rows()
+
+    def renamed_skill_rows() -> list[dict[str, Any]]:
+        return [{**row, "skill_name": "Renamed"} if row["_id"] == skill_id else row for row in source_rows]
+
+    monkeypatch.setattr(initial_data, "skill_rows", renamed_skill_rows)
+    await seed_master_data()
+    renamed_plan = await Plans.get_motor_collection().find_one({"_id": plan.id})
+    assert renamed_plan["skill_snapshot"]["skill_name"] == "Renamed"
+    counter = await Counters.get("Skills")
+    assert counter is not None and counter.sequence >= max(row["_id"] for row in source_rows)
+
+    monkeypatch.undo()
+    await seed_master_data()
+    restored_plan = await Plans.get_motor_collection().find_one({"_id": plan.id})
+    assert restored_plan["skill_snapshot"] == plan.skill_snapshot.dict()
@@ -0,0 +1,18 @@
+import json
+from pathlib import Path
+
+from skill_management.main import skill_app
+from skill_management.utils.openapi import OpenAPIDocument, write_openapi
+
+
+def test_specification_is_generated_without_build_step(tmp_path: Path) -> None:
+    document = OpenAPIDocument(skill_app, str(tmp_path / "openapi.json"))
+    assert json.loads(document.content) == skill_app.openapi()
+
+
+def test_specification_written_by_build_step_matches_routes(tmp_path: Path) -> None:
+    path = tmp_path / "skill_management" / "openapi.json"
+    write_openapi(skill_app, str(path))
+    document = OpenAPIDocument(skill_app, str(path))
+    assert document.content == path.read_bytes()
+    assert json.loads(document.content) == skill_app.openapi()
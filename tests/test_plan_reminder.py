@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+from skill_management.enums import PlanTypeEnum, StatusEnum
+from skill_management.models.encoders import date_to_datetime
+from skill_management.models.plan import Plans
+from skill_management.models.profile import Profiles
+from skill_management.models.skill import Skills
+from skill_management.repositories.plan import skill_snapshot
+from skill_management.utils import plan_reminder
+from skill_management.utils.plan_reminder import PlanReminderJob
+
+
+@pytest.mark.anyio
+async def test_plans_are_reminded_once_per_end_date(skill_app: FastAPI,
+                                                    synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                    monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[tuple[str, list[dict[str, Any]]]] = []
+    monkeypatch.setattr(plan_reminder, "send_plan_reminder_email",
+                        lambda email, plans: sent.append((email, plans)))
+    today = date(2031, 6, 1)
+    profile = await Profiles.get(synthetic_profiles[0][0])
+    skill = await Skills.find_one({"_id": 1})
+    assert profile is not None and skill is not None
+
+    def new_plan(end_date: date) -> Plans:
+        return Plans(skill=skill, profile=profile, skill_snapshot=skill_snapshot(skill),  # type: ignore
+                     plan_type=PlanTypeEnum.course, notes="Reminder", start_date=today - timedelta(days=30),
+                     end_date=end_date, task=[], status=StatusEnum.active)
+
+    job = PlanReminderJob(lead_days=3, batch_size=1)
+    later_plan = new_plan(today + timedelta(days=2))
+    await later_plan.insert()
+    assert await job.run(today) == 1
+    assert await job.run(today) == 0
+
+    """
+    Created after the run, ending before the plan already reminded
+    """
+    sooner_plan = new_plan(today + timedelta(days=1))
+    await sooner_plan.insert()
+    assert await job.run(today) == 1
+    assert [plans[0]["end_date"] for _, plans in sent] == ["2031-06-03", "2031-06-02"]
+
+    await Plans.get_motor_collection().update_one({"_id": later_plan.id},
+                                                  {"$set": {"end_date": date_to_datetime(today)}})
+    assert await job.run(today) == 1
+    assert await job.run(today) == 0
+    assert sent[-1] == (synthetic_profiles[0][1], [
+        {"skill_name": skill.skill_name, "plan_type": "course", "end_date": "2031-06-01"}])
+    await Plans.get_motor_collection().delete_many({"_id": {"$in": [later_plan.id, sooner_plan.id]}})
@@ -0,0 +1,26 @@
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+
+from skill_management.models.plan import Plans
+from skill_management.models.skill import Skills
+from skill_management.schemas.plan import PlanCreateAdminRequest
+from skill_management.services.plan import PlanService
+
+
+@pytest.mark.anyio
+async def test_admin_update_links_the_new_skill(skill_app: FastAPI,
+                                                synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    plan = await Plans.find({"skill_snapshot": {"$ne": None}}).first_or_none()
+    assert plan is not None and plan.skill_snapshot is not None
+    skill = await Skills.find_one({"_id": {"$ne": plan.skill_snapshot.skill_id}})
+    assert skill is not None
+
+    response = await PlanService().create_or_update_plan_by_admin(PlanCreateAdminRequest(
+        plan_id=plan.id, profile_id=plan.profile.ref.id, skill_id=skill.id))  # type: ignore
+    assert [data.skill_id for data in response.plans if data.id == plan.id] == [skill.id]
+
+    stored_plan = await Plans.get_motor_collection().find_one({"_id": plan.id})
+    assert stored_plan["skill"].id == skill.id
+    assert stored_plan["skill_snapshot"]["skill_name"] == skill.skill_name
+    assert "skill_id" not in stored_plan and "profile_id" not in stored_plan
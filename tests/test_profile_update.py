@@ -0,0 +1,56 @@
+import httpx
+import pytest
+from beanie import PydanticObjectId
+
+from tests.conftest import SessionTokens
+
+
+@pytest.mark.anyio
+async def test_update_with_stale_if_match_fails(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    profile_id, email = synthetic_profiles[-1]
+    headers = await sessions.headers(email, is_admin=True)
+    response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.post("/api/v1/admin/user-profiles/",
+                                 json={"profile_id": str(profile_id), "mobile": "+01611000001"},
+                                 headers={**headers, "If-Match": etag})
+    assert response.status_code == 200
+    response = await client.post("/api/v1/admin/user-profiles/",
+                                 json={"profile_id": str(profile_id), "mobile": "+01611000002"},
+                                 headers={**headers, "If-Match": etag})
+    assert response.status_code == 412
+
+    response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=headers)
+    assert response.headers["etag"] != etag
+    assert response.json()["personal_details"]["mobile"] == "+01611000001"
+    response = await client.post("/api/v1/profile/user-profiles/",
+                                 json={"profile_id": str(profile_id), "about": "Updated"},
+                                 headers={**await sessions.headers(email), "If-Match": response.headers["etag"]})
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_update_without_revision_if_match_fails(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                      synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    profile_id, email = synthetic_profiles[-1]
+    headers = await sessions.headers(email, is_admin=True)
+    for if_match, status_code in [('"not-a-revision"', 412), ("*", 200)]:
+        response = await client.post("/api/v1/admin/user-profiles/",
+                                     json={"profile_id": str(profile_id), "about": if_match},
+                                     headers={**headers, "If-Match": if_match})
+        assert response.status_code == status_code
+
+
+@pytest.mark.anyio
+async def test_conditional_update_of_missing_profile_fails(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                           synthetic_profiles: list[tuple[PydanticObjectId, str]]
+                                                           ) -> None:
+    response = await client.post("/api/v1/admin/user-profiles/",
+                                 json={"profile_id": str(PydanticObjectId()), "mobile": "+01611000005"},
+                                 headers={**await sessions.headers(synthetic_profiles[-1][1], is_admin=True),
+                                          "If-Match": 'W/"0123456789abcdef0123456789abcdef"'})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "You should provide a existing profile id of the user"
@@ -0,0 +1,158 @@
+from typing import Any
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+
+from skill_management.controllers import profile as profile_controller
+from skill_management.controllers.router import api_router
+from skill_management.models.profile import Profiles
+from skill_management.utils import query_budget
+from skill_management.utils.query_budget import count_queries, get_query_budget
+from tests.conftest import SessionTokens
+
+"""
+Budgeted routes covered by a test below, the query budget guard fails a test whose requests go over
+"""
+COVERED_ROUTES = {
+    ("GET", "/admin/profiles/"),
+    ("GET", "/admin/user-profiles/{profile_id}"),
+    ("GET", "/profile/user-profiles/"),
+    ("GET", "/admin/user-profiles/{profile_id}/full"),
+    ("GET", "/profile/user-profiles/full"),
+    ("POST", "/profile/user-profiles/"),
+    ("POST", "/admin/user-profiles/"),
+    ("POST", "/profile/skills"),
+    ("POST", "/admin/profile/skills"),
+    ("POST", "/profile/experiences"),
+    ("POST", "/admin/profile/experiences"),
+    ("POST", "/profile/educations"),
+    ("POST", "/admin/profile/educations"),
+}
+
+
+def test_every_budgeted_route_is_covered() -> None:
+    budgeted_routes = {
+        (method, getattr(route, "path"))
+        for route in api_router.routes if get_query_budget(getattr(route, "endpoint", None)) is not None
+        for method in getattr(route, "methods")
+    }
+    assert budgeted_routes == COVERED_ROUTES
+
+
+@pytest.mark.anyio
+async def test_profile_listing_budget(client: httpx.AsyncClient, sessions: SessionTokens,
+                                      synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    for params in [{"page-size": 10}, {"page-number": 2, "page-size": 5}, {"skill-id": 1},
+                   {"employee-name": "a"}, {"fields": "name,skills"}]:
+        response = await client.get("/api/v1/admin/profiles/", params=params, headers=headers)
+        assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_profile_details_budget(client: httpx.AsyncClient, sessions: SessionTokens,
+                                      synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    admin_headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    for profile_id, email in synthetic_profiles:
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=admin_headers)
+        assert response.status_code == 200
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}",
+                                    headers={**admin_headers, "If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
+        response = await client.get("/api/v1/profile/user-profiles/", headers=await sessions.headers(email))
+        assert response.status_code in (200, 404)
+
+
+@pytest.mark.anyio
+async def test_full_profile_budget(client: httpx.AsyncClient, sessions: SessionTokens,
+                                   synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    admin_headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    for profile_id, email in synthetic_profiles:
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}/full", headers=admin_headers)
+        assert response.status_code == 200
+        response = await client.get("/api/v1/profile/user-profiles/full", headers=await sessions.headers(email))
+        assert response.status_code in (200, 404)
+    response = await client.get(f"/api/v1/admin/user-profiles/{PydanticObjectId()}/full", headers=admin_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_profile_write_budget(client: httpx.AsyncClient, sessions: SessionTokens,
+                                    synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    profile_id, email = synthetic_profiles[1]
+    admin_headers = await sessions.headers(email, is_admin=True)
+    for body in [{"mobile": "+01611000004"}, {"designation_id": 2, "experience_year": 3}]:
+        response = await client.post("/api/v1/admin/user-profiles/", json={"profile_id": str(profile_id), **body},
+                                      headers=admin_headers)
+        assert response.status_code == 200
+    response = await client.post("/api/v1/profile/user-profiles/",
+                                 json={"profile_id": str(profile_id), "about": "Budgeted"},
+                                 headers=await sessions.headers(email))
+    assert response.status_code == 200
+
+    """
+    The experience of the new designation is updated with the designation read back
+    """
+    profile = await Profiles.get_motor_collection().find_one({"_id": profile_id}, {"experiences": 1})
+    experience = max((experience for experience in profile["experiences"]
+                      if experience["designation"]["designation_id"] == 2), key=lambda item: item["experience_id"])
+    for url, headers, body in [("/api/v1/profile/experiences", await sessions.headers(email), {}),
+                               ("/api/v1/admin/profile/experiences", admin_headers, {"profile_id": str(profile_id)})]:
+        response = await client.post(url, json={**body, "experience_id": experience["experience_id"],
+                                                "company_name": "Budget Ltd.",
+                                                "designation": experience["designation"]["designation"]},
+                                      headers=headers)
+        assert response.status_code == 201
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path, id_field, create, update", [
+    ("skills", "skill_id", {"skill_id": 1, "experience_year": 2, "level": 5, "status": 1}, {"level": 6}),
+    ("experiences", "experience_id", {"company_name": "Budget Ltd.", "job_responsibility": "Testing",
+                                      "designation": "SQA", "start_date": "2020-01-01", "end_date": "2021-01-01"},
+     {"company_name": "Budget Inc.", "designation": "SQA"}),
+    ("educations", "education_id", {"degree_name": "BSc", "school_name": "Budget University",
+                                    "passing_year": "2015", "grade": 3.5}, {"grade": 3.75}),
+])
+async def test_profile_section_write_budget(client: httpx.AsyncClient, sessions: SessionTokens,
+                                            synthetic_profiles: list[tuple[PydanticObjectId, str]], path: str,
+                                            id_field: str, create: dict[str, Any], update: dict[str, Any]) -> None:
+    profile_id, email = synthetic_profiles[2]
+    for url, headers, profile in [(f"/api/v1/profile/{path}", await sessions.headers(email), {}),
+                                  (f"/api/v1/admin/profile/{path}", await sessions.headers(email, is_admin=True),
+                                   {"profile_id": str(profile_id)})]:
+        response = await client.post(url, json={**profile, **create}, headers=headers)
+        assert response.status_code == 201
+        """
+        The section created last has the highest id, a skill keeps the id of the master skill
+        """
+        item_id = create.get(id_field) or max(item[id_field] for item in response.json()[path])
+        response = await client.post(url, json={**profile, id_field: item_id, **update}, headers=headers)
+        assert response.status_code == 201
+        assert [item for item in response.json()[path] if item[id_field] == item_id]
+
+
+@pytest.mark.anyio
+async def test_route_over_budget_is_reported(client: httpx.AsyncClient, sessions: SessionTokens,
+                                             synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                             monkeypatch: pytest.MonkeyPatch) -> None:
+    endpoint = profile_controller.get_full_profile_by_id_for_admin
+    monkeypatch.setattr(endpoint, "__query_budget__", 0)
+    response = await client.get(f"/api/v1/admin/user-profiles/{synthetic_profiles[0][0]}/full",
+                                headers=await sessions.headers(synthetic_profiles[0][1], is_admin=True))
+    assert response.status_code == 200
+    violations = query_budget.budget_violations
+    assert violations is not None and [violation.route for violation in violations] == [
+        "/api/v1/admin/user-profiles/{profile_id}/full"]
+    violations.clear()
+
+
+@pytest.mark.anyio
+async def test_service_commands_are_counted(synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> None:
+    from skill_management.services.profile import ProfileService
+
+    with count_queries() as stats:
+        await ProfileService().get_full_profile_by_admin(synthetic_profiles[0][0])
+    assert stats.count == 1
+    assert stats.collections == {"Profiles": 1}
@@ -0,0 +1,38 @@
+import asyncio
+
+import aioredis
+import pytest
+
+from skill_management.config import redis_pool
+from skill_management.config.redis_pool import RedisConnectionManager
+
+
+@pytest.mark.anyio
+async def test_health_check_survives_unexpected_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    pings: list[int] = []
+
+    async def ping_with_retry(self: RedisConnectionManager) -> None:
+        pings.append(len(pings))
+        if len(pings) == 1:
+            raise RuntimeError("unexpected")
+        raise asyncio.CancelledError
+
+    async def sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setenv("REDIS_HEALTH_CHECK_INTERVAL", "1")
+    monkeypatch.setattr(RedisConnectionManager, "ping_with_retry", ping_with_retry)
+    monkeypatch.setattr(redis_pool.asyncio, "sleep", sleep)
+    manager = RedisConnectionManager()
+    manager.healthy = True
+    with pytest.raises(asyncio.CancelledError):
+        await manager._health_check()
+    assert len(pings) == 2
+    assert not manager.healthy
+
+
+def test_pool_stats_of_installed_pool() -> None:
+    manager = RedisConnectionManager()
+    manager.pool = aioredis.BlockingConnectionPool(max_connections=3)
+    manager.healthy = True
+    assert manager.get_pool_stats() == {"total": 0, "in_use": 0, "idle": 0, "max_connections": 3, "healthy": 1}
@@ -0,0 +1,82 @@
+from typing import Any
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+
+from skill_management.schemas.profile import ProfileProfileDetailsView
+from skill_management.services.profile import PROFILE_BASIC_FIELDS, PROFILE_DETAILS_FIELDS
+from skill_management.utils.sparse_fields import parse_fields, sparse_view
+from tests.conftest import SessionTokens
+
+
+def restricted(body: dict[str, Any], fields: str) -> dict[str, Any]:
+    """
+    The body with the selected fields only, and of a nested object its selected subfields.
+    """
+    selected: dict[str, Any] = {}
+    for path in fields.split(","):
+        name, _, subfield = path.partition(".")
+        if subfield:
+            selected.setdefault(name, {})[subfield] = body[name][subfield]
+        else:
+            selected[name] = body[name]
+    return selected
+
+
+def test_unknown_field_is_rejected() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        parse_fields("name,salary", PROFILE_BASIC_FIELDS)
+    assert exc_info.value.status_code == 400
+
+
+def test_field_selected_whole_and_by_subfields_is_selected_whole() -> None:
+    for value in ["personal_details,personal_details.name", "personal_details.name,personal_details"]:
+        fields = parse_fields(value, PROFILE_DETAILS_FIELDS)
+        assert fields is not None and fields.fields == {"personal_details": None}
+    fields = parse_fields(" id, personal_details.name,,personal_details.mobile ", PROFILE_DETAILS_FIELDS)
+    assert fields is not None and fields.fields == {"id": None, "personal_details": {"name", "mobile"}}
+    assert parse_fields(",", PROFILE_DETAILS_FIELDS) is None
+
+
+def test_sparse_view_projects_the_selected_subfields() -> None:
+    fields = parse_fields("personal_details.name", PROFILE_DETAILS_FIELDS)
+    assert fields is not None
+    document_fields = fields.document_fields(PROFILE_DETAILS_FIELDS, {"id": None})
+    view = sparse_view(ProfileProfileDetailsView, document_fields)
+    assert getattr(view, "Settings").projection == {"_id": 1, "personal_detail.name": 1}
+    assert set(view.__fields__) == {"id", "personal_detail"}
+    assert sparse_view(ProfileProfileDetailsView, document_fields) is view
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fields", ["name", "email,skills", "id,designation,profile_status,url",
+                                    "mobile,profile_picture_url"])
+async def test_sparse_listing_is_the_full_listing_restricted(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                             synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                             fields: str) -> None:
+    headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    full_body = (await client.get("/api/v1/admin/profiles/", params={"page-size": 20}, headers=headers)).json()
+    response = await client.get("/api/v1/admin/profiles/", params={"page-size": 20, "fields": fields},
+                                headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["items"] == [restricted(item, fields) for item in full_body["items"]]
+    assert {**body, "items": None} == {**full_body, "items": None}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fields", ["email", "id,profile_status,personal_details",
+                                    "personal_details.name,personal_details.date_of_birth",
+                                    "personal_details.picture_url,personal_details.cv_urls"])
+async def test_sparse_details_are_the_full_details_restricted(client: httpx.AsyncClient, sessions: SessionTokens,
+                                                              synthetic_profiles: list[tuple[PydanticObjectId, str]],
+                                                              fields: str) -> None:
+    headers = await sessions.headers(synthetic_profiles[0][1], is_admin=True)
+    for profile_id, _ in synthetic_profiles[:5]:
+        full_body = (await client.get(f"/api/v1/admin/user-profiles/{profile_id}", headers=headers)).json()
+        response = await client.get(f"/api/v1/admin/user-profiles/{profile_id}", params={"fields": fields},
+                                    headers=headers)
+        assert response.status_code == 200
+        assert response.json() == restricted(full_body, fields)
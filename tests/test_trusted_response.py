@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+import httpx
+import pytest
+from beanie import PydanticObjectId
+from fastapi import FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute, serialize_response
+
+from skill_management.enums import ProfileStatusEnum, StatusEnum, PlanTypeEnum
+from skill_management.services.designation import DesignationService
+from skill_management.services.education import EducationService
+from skill_management.services.experience import ExperienceService
+from skill_management.services.plan import PlanService
+from skill_management.services.profile import ProfileService
+from skill_management.services.skill import SkillService
+from tests.conftest import SessionTokens
+
+"""
+GET routes returning construct() models through TrustedResponse: path, whether an admin calls it, and
+the service call building the content the route returned before
+"""
+CONVERTED_ROUTES: list[tuple[str, bool, Callable[[PydanticObjectId, str], Awaitable[Any]]]] = [
+    ("/admin/profiles/", True,
+     lambda profile_id, email: ProfileService().get_user_profiles_for_admin(page_number=1, page_size=10)),
+    ("/admin/user-profiles/{profile_id}", True,
+     lambda profile_id, email: ProfileService().get_user_profile_by_admin(profile_id)),
+    ("/profile/user-profiles/", False,
+     lambda profile_id, email: ProfileService().get_user_profile_by_user(email)),
+    ("/admin/user-profiles/{profile_id}/full", True,
+     lambda profile_id, email: ProfileService().get_full_profile_by_admin(profile_id)),
+    ("/profile/user-profiles/full", False,
+     lambda profile_id, email: ProfileService().get_full_profile_by_user(email)),
+    ("/skills/{skill_id}", False, lambda profile_id, email: SkillService().get_skill_details(skill_id=1)),
+    ("/skills", False, lambda profile_id, email: SkillService().get_skill_list()),
+    ("/admin/paginated/skills", True,
+     lambda profile_id, email: SkillService().get_paginated_skills_by_admin(
+         skill_categories=None, skill_name=None, skill_types=None, page_size=10, page_number=1)),
+    ("/profile/admin/user-profiles/{profile_id}/skills", True,
+     lambda profile_id, email: SkillService().get_skill_details_by_admin(profile_id=profile_id)),
+    ("/profile/user-profiles/skills", False,
+     lambda profile_id, email: SkillService().get_skill_details_by_user(email=email)),
+    ("/admin/user-profiles/{profile_id}/experiences", True,
+     lambda profile_id, email: ExperienceService().get_experiences_details_by_admin(profile_id=profile_id)),
+    ("/profile/user-profiles/experiences", False,
+     lambda profile_id, email: ExperienceService().get_experiences_details_by_user(email=email)),
+    ("/profile/admin/user-profiles/{profile_id}/educations", True,
+     lambda profile_id, email: EducationService().get_education_details_by_admin(profile_id=profile_id)),
+    ("/profile/user-profiles/educations", False,
+     lambda profile_id, email: EducationService().get_education_details_by_user(email=email)),
+    ("/designations", False, lambda profile_id, email: DesignationService().get_master_designation_list(None)),
+    ("/profile/admin/user-profiles/{profile_id}/designation", True,
+     lambda profile_id, email: DesignationService().get_designation_details_by_admin(profile_id=profile_id)),
+    ("/profile/user-profiles/designation", False,
+     lambda profile_id, email: DesignationService().get_designation_details_by_user(email=email)),
+    ("/profile/admin/user-profiles/{profile_id}/plans", True,
+     lambda profile_id, email: PlanService().get_plan_details_by_admin(profile_id=profile_id)),
+    ("/profile/user-profiles/plans", False,
+     lambda profile_id, email: PlanService().get_plan_details_by_user(email=email)),
+]
+
+
+async def render_validated(app: FastAPI, path: str, content: Any) -> bytes:
+    """
+    The body FastAPI renders for `content` on the route's response_model path: dump, validation
+    against the response_model and jsonable_encoder.
+    """
+    route = next(route for route in app.routes
+                 if isinstance(route, APIRoute) and route.path == "/api/v1" + path and "GET" in route.methods)
+    value = await serialize_response(field=route.secure_cloned_response_field, response_content=content,
+                                     include=route.response_model_include, exclude=route.response_model_exclude,
+                                     by_alias=route.response_model_by_alias,
+                                     exclude_unset=route.response_model_exclude_unset,
+                                     exclude_defaults=route.response_model_exclude_defaults,
+                                     exclude_none=route.response_model_exclude_none, is_coroutine=True)
+    response_class = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    return bytes(response_class(content=value).body)
+
+
+@pytest.fixture(scope="module")
+async def profiles_with_plans(synthetic_profiles: list[tuple[PydanticObjectId, str]]) -> \
+        list[tuple[PydanticObjectId, str]]:
+    """
+    The synthetic profiles, the first active one with plans without dates: one saved through the
+    model, one whose end date was $set on a plan without start date.
+    """
+    from skill_management.models.plan import Plans
+    from skill_management.models.profile import Profiles
+    from skill_management.models.skill import Skills
+    from skill_management.repositories.plan import skill_snapshot
+
+    profile = await Profiles.find({"_id": {"$in": [profile_id for profile_id, _ in synthetic_profiles]},
+                                   "profile_status": {"$in": [ProfileStatusEnum.full_time,
+                                                              ProfileStatusEnum.part_time]}}).first_or_none()
+    assert profile is not None
+    skill = await Skills.find_one({"_id": 1})
+    assert skill is not None
+    plans = [
+        Plans(skill=skill, profile=profile, skill_snapshot=skill_snapshot(skill),  # type: ignore
+              plan_type=PlanTypeEnum.course, notes="No dates yet", start_date=None, end_date=None, task=[],
+              status=StatusEnum.active)
+        for _ in range(2)
+    ]
+    await Plans.insert_many(plans)
+    await Plans.get_motor_collection().update_one({"_id": plans[1].id},
+                                                  {"$set": {"end_date": datetime(2023, 1, 1)}})
+    return [(profile.id, profile.user_id)] + synthetic_profiles  # type: ignore
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path, is_admin, build", CONVERTED_ROUTES, ids=[path for path, _, _ in CONVERTED_ROUTES])
+async def test_trusted_response_is_byte_identical(skill_app: FastAPI, client: httpx.AsyncClient,
+                                                  sessions: SessionTokens,
+                                                  profiles_with_plans: list[tuple[PydanticObjectId, str]],
+                                                  path: str, is_admin: bool,
+                                                  build: Callable[[PydanticObjectId, str], Awaitable[Any]]) -> None:
+    compared = 0
+    for profile_id, email in profiles_with_plans:
+        response = await client.get("/api/v1" + path.format(profile_id=profile_id, skill_id=1),
+                                    headers=await sessions.headers(email, is_admin=is_admin))
+        if response.status_code == 404 and not is_admin:
+            continue
+        assert response.status_code == 200
+        assert response.content == await render_validated(skill_app, path, await build(profile_id, email))
+        compared += 1
+    assert compared